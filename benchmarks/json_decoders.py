@@ -0,0 +1,46 @@
+'''Compares the installed JSON decoders on the football fixture payloads
+
+    python benchmarks/json_decoders.py [--repeat 20]
+'''
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from espn_api.requests.json_decoder import JSON_DECODERS
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'football', 'unit', 'data')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {}
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, '*.json'))):
+        with open(path, 'rb') as f:
+            payloads[os.path.basename(path)] = f.read()
+    total_mb = sum(len(payload) for payload in payloads.values()) / 1e6
+
+    print(f'{len(payloads)} payloads, {total_mb:.1f} MB, best of 3 x {args.repeat} decodes')
+    print(f'{"payload":36}' + ''.join(f'{name:>12}' for name in JSON_DECODERS))
+    totals = dict.fromkeys(JSON_DECODERS, 0.0)
+    for file_name, payload in payloads.items():
+        row = f'{file_name:36}'
+        for name, decode in JSON_DECODERS.items():
+            seconds = min(timeit.repeat(lambda: decode(payload), number=args.repeat, repeat=3)) / args.repeat
+            totals[name] += seconds
+            row += f'{seconds * 1000:>10.2f}ms'
+        print(row)
+
+    print(f'{"total":36}' + ''.join(f'{seconds * 1000:>10.2f}ms' for seconds in totals.values()))
+    print(f'{"MB/s":36}' + ''.join(f'{total_mb / seconds:>12.0f}' for seconds in totals.values()))
+    print(f'{"speedup vs json":36}' + ''.join(f'{totals["json"] / seconds:>11.1f}x' for seconds in totals.values()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+'''Measures the memory a League holds once it is built offline from a recorded archive or a directory of JSON payloads
+
+    python benchmarks/league_memory.py hockey tests/hockey/unit/data [--leagues 20]
+'''
+import argparse
+import gc
+import importlib
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from espn_api.requests.transport import open_replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sport', choices=['baseball', 'basketball', 'football', 'hockey', 'wbasketball'])
+    parser.add_argument('path', help='RecordingTransport archive or directory of JSON payloads')
+    parser.add_argument('--leagues', type=int, default=20, help='leagues held in memory at once')
+    args = parser.parse_args()
+
+    League = importlib.import_module(f'espn_api.{args.sport}').League
+    transport = open_replay(args.path)
+
+    def build():
+        league = League(transport.league_id, transport.year, fetch_league=False)
+        league.espn_request.transport = transport
+        league.fetch_league()
+        return league
+
+    # the first build fills the shared pro data caches, they aren't part of any one league
+    build()
+    gc.collect()
+    tracemalloc.start()
+    leagues = [build() for _ in range(args.leagues)]
+    gc.collect()
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    players = sum(len(team.roster) for team in leagues[0].teams)
+    print(f'{"per league":16}{current / args.leagues / 1024:>10.1f}KiB')
+    print(f'{"per player":16}{current / args.leagues / max(players, 1):>10.0f}B')
+    print(f'{"peak":16}{peak / 1024:>10.1f}KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+'''Profiles building a League and its box scores offline from a recorded archive or a directory of JSON payloads
+
+    python benchmarks/replay_league.py hockey tests/hockey/unit/data [--repeat 50] [--profile]
+'''
+import argparse
+import cProfile
+import importlib
+import os
+import pstats
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from espn_api.requests.transport import open_replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sport', choices=['baseball', 'basketball', 'football', 'hockey', 'wbasketball'])
+    parser.add_argument('path', help='RecordingTransport archive or directory of JSON payloads')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--profile', action='store_true', help='print the top functions by cumulative time')
+    args = parser.parse_args()
+
+    League = importlib.import_module(f'espn_api.{args.sport}').League
+    transport = open_replay(args.path)
+    league = League(transport.league_id, transport.year, fetch_league=False)
+    league.espn_request.transport = transport
+
+    def build():
+        league.fetch_league()
+
+    def box_scores():
+        league.box_scores()
+
+    build()
+    for (name, stmt) in [('fetch_league', build), ('box_scores', box_scores)]:
+        seconds = min(timeit.repeat(stmt, number=args.repeat, repeat=3)) / args.repeat
+        print(f'{name:16}{seconds * 1000:>10.2f}ms')
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(lambda: [(build(), box_scores()) for _ in range(args.repeat)])
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+
+if __name__ == '__main__':
+    main()
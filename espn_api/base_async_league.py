@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+from .pro_schedule import ProSchedule
+from .requests.async_espn_requests import AsyncEspnFantasyRequests, AsyncSessionPool
+from .requests.transport import open_replay
+
+
+class BaseAsyncLeague(object):
+    '''Mixin for a sports League where requests are coroutines, fetch_league must be awaited'''
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, debug=False, session_pool: AsyncSessionPool = None,
+                 max_response_length: int = None):
+        super().__init__(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid, fetch_league=False, debug=debug,
+                         max_response_length=max_response_length)
+        request = self.espn_request
+        self.espn_request = AsyncEspnFantasyRequests(sport=request.sport, year=year, league_id=league_id,
+                                                     cookies=request.cookies, logger=self.logger, session_pool=session_pool)
+
+    @classmethod
+    async def from_replay(cls, path: str, league_id: int = None, year: int = None, **kwargs):
+        '''Builds the league without network access from a RecordingTransport archive or a directory of JSON payloads'''
+        transport = open_replay(path)
+        league = cls(league_id or transport.league_id, year or transport.year, **kwargs)
+        league.espn_request.transport = transport
+        return await league.fetch_league()
+
+    async def fetch_league(self):
+        (data, players, pro_schedule, draft) = await self._fetch_league_payloads()
+        self._build_league(data, players, pro_schedule, draft)
+        return self
+
+    async def _fetch_league_payloads(self) -> Tuple[dict, list, dict, dict]:
+        '''Requests the league, pro players, pro schedule and draft payloads concurrently'''
+        requests = [
+            self.espn_request.get_league(),
+            self.espn_request.get_pro_players(),
+            self.espn_request.get_league_draft(),
+        ]
+        if self._uses_pro_schedule:
+            requests.append(self.espn_request.get_pro_schedule())
+        responses = await asyncio.gather(*requests)
+
+        (data, players, draft) = responses[:3]
+        pro_schedule = responses[3] if self._uses_pro_schedule else None
+        return (data, players, pro_schedule, draft)
+
+    async def scoreboard(self, matchupPeriod: int = None) -> List:
+        '''Returns list of matchups for a given matchup period'''
+        if not matchupPeriod:
+            matchupPeriod = self.currentMatchupPeriod
+
+        data = await self.espn_request.league_get(params={'view': 'mMatchup'})
+        return self._parse_scoreboard(data, matchupPeriod)
+
+    async def iter_activity(self, page_size: int = 25, msg_type: str = None, since: Union[int, datetime] = None, last_id: str = None,
+                            **kwargs) -> AsyncIterator:
+        '''Yields the leagues activities newest first, the next page is requested while the current one is consumed.
+        Stops before the first activity made at or before since (epoch milliseconds or datetime) or with the id last_id'''
+        since = self._activity_cutoff(since)
+        offset = 0
+        page = asyncio.ensure_future(self.recent_activity(size=page_size, msg_type=msg_type, offset=offset, **kwargs))
+        try:
+            while page is not None:
+                activities = await page
+                stop = self._find_activity_stop(activities, since, last_id)
+                offset += page_size
+                if stop is None and len(activities) == page_size:
+                    page = asyncio.ensure_future(self.recent_activity(size=page_size, msg_type=msg_type, offset=offset, **kwargs))
+                else:
+                    page = None
+                for activity in activities[:stop]:
+                    yield activity
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def box_scores_range(self, start: int = 1, end: int = None, **kwargs) -> Dict[int, List]:
+        '''Returns the box scores of every period from start to end (the current period by default) keyed by period.
+        Periods are requested concurrently and completed periods are only requested once'''
+        periods = list(range(start, (end or self._current_box_score_period()) + 1))
+        missing = [period for period in periods if self._box_score_key(period, kwargs) not in self._box_score_cache]
+        fetched = {}
+        if missing:
+            await self._get_pro_schedule_store()
+            responses = await asyncio.gather(*[self._period_box_scores(period, **kwargs) for period in missing])
+            fetched = dict(zip(missing, responses))
+            self._cache_box_scores(fetched, kwargs)
+        return {period: fetched[period] if period in fetched else self._box_score_cache[self._box_score_key(period, kwargs)]
+                for period in periods}
+
+    async def season_box_scores(self, **kwargs) -> Dict[int, List]:
+        '''Returns the box scores of every period of the season up to the current one keyed by period'''
+        return await self.box_scores_range(**kwargs)
+
+    async def _get_pro_schedule_store(self) -> ProSchedule:
+        if self._pro_schedule is None:
+            self._set_pro_schedule(await self.espn_request.get_pro_schedule())
+        return self._pro_schedule
+
+    async def _get_pro_schedule(self, scoringPeriodId: int = None):
+        return (await self._get_pro_schedule_store()).scoring_period(scoringPeriodId)
+
+    async def _get_all_pro_schedule(self):
+        return (await self._get_pro_schedule_store()).games
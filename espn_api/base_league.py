@@ -1,21 +1,41 @@
 from abc import ABC
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from .base_settings import BaseSettings
 from .base_pick import BasePick
+from .box_score_poller import BoxScorePoller
+from .pro_schedule import ProSchedule
 from .utils.logger import Logger
 from .requests.espn_requests import EspnFantasyRequests
+from .requests.session_pool import SessionPool
+from .requests.transport import open_replay
 
 class BaseLeague(ABC):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False):
-        self.logger = Logger(name=f'{sport} league', debug=debug)
+    # whether the teams rosters need the pro team schedule to be built
+    _uses_pro_schedule = False
+
+    def __init__(self, league_id: int, year: int, sport: str, espn_s2=None, swid=None, debug=False, concurrent_requests=False,
+                 max_response_length: int = None, session_pool: SessionPool = None):
+        self.logger = Logger(name=f'{sport} league', debug=debug, max_response_length=max_response_length)
         self.league_id = league_id
         self.year = year
         self.teams = []
         self.members = []
         self.draft = []
         self.player_map = {}
+        self._team_index = {}
+        self._player_index = {}
+        self._player_team_index = {}
+        self.concurrent_requests = concurrent_requests
+        self._pro_schedule = None
+        # the payload _pro_schedule was built from
+        self._pro_schedule_data = None
+        self._box_score_cache = {}
+        # playerId -> identity fields shared by every Player of the league
+        self._player_identities = {}
 
         cookies = None
         if espn_s2 and swid:
@@ -23,14 +43,46 @@ class BaseLeague(ABC):
                 'espn_s2': espn_s2,
                 'SWID': swid
             }
-        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger)
+        self.espn_request = EspnFantasyRequests(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=self.logger,
+                                                session_pool=session_pool)
 
     def __repr__(self):
         return 'League(%s, %s)' % (self.league_id, self.year, )
 
+    @classmethod
+    def from_replay(cls, path: str, league_id: int = None, year: int = None, **kwargs):
+        '''Builds the league without network access from a RecordingTransport archive or a directory of JSON payloads.
+        Later requests are answered by the same transport'''
+        transport = open_replay(path)
+        league = cls(league_id or transport.league_id, year or transport.year, fetch_league=False, **kwargs)
+        league.espn_request.transport = transport
+        league.fetch_league()
+        return league
+
     def _fetch_league(self, SettingsClass = BaseSettings):
         data = self.espn_request.get_league()
+        return self._parse_league(data, SettingsClass)
+
+    def _fetch_league_payloads(self) -> Tuple[dict, list, dict, dict]:
+        '''Requests the league, pro players, pro schedule and draft payloads needed to build the league'''
+        requests = [self.espn_request.get_league, self.espn_request.get_pro_players]
+        if self._uses_pro_schedule:
+            requests.append(self.espn_request.get_pro_schedule)
+        requests.append(self.espn_request.get_league_draft)
+
+        if self.concurrent_requests:
+            # none of the requests depend on each other, send them all at once
+            with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+                futures = [executor.submit(request) for request in requests]
+                responses = [future.result() for future in futures]
+        else:
+            responses = [request() for request in requests]
+
+        data, players, draft = responses[0], responses[1], responses[-1]
+        pro_schedule = responses[2] if self._uses_pro_schedule else None
+        return (data, players, pro_schedule, draft)
 
+    def _parse_league(self, data, SettingsClass = BaseSettings):
         self.currentMatchupPeriod = data['status']['currentMatchupPeriod']
         self.scoringPeriodId = data['scoringPeriodId']
         self.firstScoringPeriod = data['status']['firstScoringPeriod']
@@ -44,12 +96,18 @@ class BaseLeague(ABC):
             self.current_week = self.scoringPeriodId if self.scoringPeriodId <= data['status']['finalScoringPeriod'] else data['status']['finalScoringPeriod']
         self.settings = SettingsClass(data['settings'])
         self.members = data.get('members', [])
+
+        latest_scoring_period = data['status'].get('latestScoringPeriod', self.scoringPeriodId)
+        season_complete = 0 < self.finalScoringPeriod < latest_scoring_period
+        self.espn_request.set_season_status(latest_scoring_period, season_complete)
         return data
 
     def _fetch_draft(self):
         '''Creates list of Pick objects from the leagues draft'''
         data = self.espn_request.get_league_draft()
+        self._parse_draft(data)
 
+    def _parse_draft(self, data):
         # League has not drafted yet
         if not data.get('draftDetail', {}).get('drafted'):
             return
@@ -83,13 +141,28 @@ class BaseLeague(ABC):
         for team in teams:
             roster = team_roster[team['id']]
             owners = [member for member in members if member.get('id') in team.get('owners', [])]
-            self.teams.append(TeamClass(team, roster=roster, schedule=schedule, year=seasonId, owners=owners, pro_schedule=pro_schedule))
+            self.teams.append(TeamClass(team, roster=roster, schedule=schedule, year=seasonId, owners=owners, pro_schedule=pro_schedule,
+                                        player_identities=self._player_identities))
 
         # sort by team ID
         self.teams = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
+        self._index_teams()
+
+    def _index_teams(self):
+        '''Indexes the teams and their rostered players by id, needs to be called whenever teams or rosters are replaced'''
+        self._team_index = {team.team_id: team for team in self.teams}
+        self._player_index = {}
+        self._player_team_index = {}
+        for team in self.teams:
+            for player in team.roster:
+                self._player_index[player.playerId] = player
+                self._player_team_index[player.playerId] = team
 
     def _fetch_players(self):
         data = self.espn_request.get_pro_players()
+        self._parse_players(data)
+
+    def _parse_players(self, data):
         # Map all player id's to player name
         for player in data:
             # two way map to find playerId's by name
@@ -98,36 +171,133 @@ class BaseLeague(ABC):
             if player['fullName'] not in self.player_map:
                 self.player_map[player['fullName']] = player['id']
 
+    def _get_pro_schedule_store(self) -> ProSchedule:
+        '''Downloads the pro schedule once per league, refresh clears it'''
+        if self._pro_schedule is None:
+            self._set_pro_schedule(self.espn_request.get_pro_schedule())
+        return self._pro_schedule
+
+    def _set_pro_schedule(self, data) -> ProSchedule:
+        self._pro_schedule = ProSchedule(data)
+        self._pro_schedule_data = data
+        return self._pro_schedule
+
     def _get_pro_schedule(self, scoringPeriodId: int = None):
-        data = self.espn_request.get_pro_schedule()
-
-        pro_teams = data['settings']['proTeams']
-        pro_team_schedule = {}
-
-        for team in pro_teams:
-            pro_game = team.get('proGamesByScoringPeriod', {})
-            if team['id'] != 0 and (str(scoringPeriodId) in pro_game.keys() and pro_game[str(scoringPeriodId)]):
-                game_data = pro_game[str(scoringPeriodId)][0]
-                pro_team_schedule[team['id']] = (game_data['homeProTeamId'], game_data['date'])  if team['id'] == game_data['awayProTeamId'] else (game_data['awayProTeamId'], game_data['date'])
-        return pro_team_schedule
-    
+        return self._get_pro_schedule_store().scoring_period(scoringPeriodId)
+
     def _get_all_pro_schedule(self):
-        data = self.espn_request.get_pro_schedule()
+        return self._get_pro_schedule_store().games
+
+    def box_score_poller(self, live_interval: float = 30, idle_interval: float = 600, **kwargs) -> BoxScorePoller:
+        '''Returns a poller of the box scores box_scores returns for kwargs that reports the players and scores
+        that changed, polling every live_interval seconds while pro games are in progress'''
+        return BoxScorePoller(self, live_interval=live_interval, idle_interval=idle_interval, **kwargs)
+
+    def box_scores_range(self, start: int = 1, end: int = None, max_workers: int = 8, **kwargs) -> Dict[int, List]:
+        '''Returns the box scores of every period from start to end (the current period by default) keyed by period.
+        Periods are weeks in football and matchup periods in the other sports, kwargs are passed to box_scores.
+        Periods are requested concurrently and completed periods are only requested once'''
+        periods = list(range(start, (end or self._current_box_score_period()) + 1))
+        missing = [period for period in periods if self._box_score_key(period, kwargs) not in self._box_score_cache]
+        fetched = {}
+        if missing:
+            # every period shares the leagues pro schedule, download it once up front
+            self._get_pro_schedule_store()
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                fetched = dict(zip(missing, executor.map(lambda period: self._period_box_scores(period, **kwargs), missing)))
+            self._cache_box_scores(fetched, kwargs)
+        return {period: fetched[period] if period in fetched else self._box_score_cache[self._box_score_key(period, kwargs)]
+                for period in periods}
 
-        pro_teams = data.get('settings', {}).get('proTeams', {})
-        pro_team_schedule = {}
+    def season_box_scores(self, max_workers: int = 8, **kwargs) -> Dict[int, List]:
+        '''Returns the box scores of every period of the season up to the current one keyed by period'''
+        return self.box_scores_range(max_workers=max_workers, **kwargs)
 
-        for team in pro_teams:
-            pro_game = team.get('proGamesByScoringPeriod', {})
-            pro_team_schedule[team['id']] = pro_game
-        return pro_team_schedule
+    def _period_box_scores(self, period: int, **kwargs) -> List:
+        return self.box_scores(matchup_period=period, **kwargs)
+
+    def _current_box_score_period(self) -> int:
+        return self.currentMatchupPeriod
+
+    @staticmethod
+    def _box_score_key(period: int, kwargs: dict) -> tuple:
+        return (period, tuple(sorted(kwargs.items())))
+
+    def _cache_box_scores(self, box_scores: Dict[int, List], kwargs: dict):
+        '''Keeps the box scores of completed periods, they can't change anymore'''
+        current_period = self._current_box_score_period()
+        for (period, period_box_scores) in box_scores.items():
+            if period < current_period or self.espn_request.season_complete:
+                self._box_score_cache[self._box_score_key(period, kwargs)] = period_box_scores
 
     def standings(self) -> List:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
         return standings
 
-    def get_team_data(self, team_id: int) -> List:
-        for team in self.teams:
-            if team_id == team.team_id:
-                return team
+    def _get_slot_filter(self, position_map: dict, position: str = None, position_id: int = None) -> List[int]:
+        slot_filter = []
+        if position and position in position_map:
+            slot_filter = [position_map[position]]
+        if position_id:
+            slot_filter.append(position_id)
+        return slot_filter
+
+    def _get_player_ids(self, name: str = None, playerId: Union[int, list] = None) -> List[int]:
+        '''Returns the list of player ids to request a player card for, None if the player is unknown'''
+        if name:
+            playerId = self.player_map.get(name)
+        if playerId is None or isinstance(playerId, str):
+            return None
+        if not isinstance(playerId, list):
+            playerId = [playerId]
+        return playerId
+
+    def iter_activity(self, page_size: int = 25, msg_type: str = None, since: Union[int, datetime] = None, last_id: str = None,
+                      **kwargs) -> Iterator:
+        '''Yields the leagues activities newest first, the next page is requested in the background while the current one is consumed.
+        Stops before the first activity made at or before since (epoch milliseconds or datetime) or with the id last_id'''
+        since = self._activity_cutoff(since)
+        offset = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = executor.submit(self.recent_activity, size=page_size, msg_type=msg_type, offset=offset, **kwargs)
+            while page is not None:
+                activities = page.result()
+                stop = self._find_activity_stop(activities, since, last_id)
+                offset += page_size
+                # a short page is the last one
+                if stop is None and len(activities) == page_size:
+                    page = executor.submit(self.recent_activity, size=page_size, msg_type=msg_type, offset=offset, **kwargs)
+                else:
+                    page = None
+                yield from activities[:stop]
+
+    @staticmethod
+    def _activity_cutoff(since: Union[int, datetime] = None) -> Optional[int]:
+        if isinstance(since, datetime):
+            return int(since.timestamp() * 1000)
+        return since
+
+    @staticmethod
+    def _find_activity_stop(activities: List, since: int = None, last_id: str = None) -> Optional[int]:
+        '''Returns the index of the first activity that was already seen, None if every activity is new'''
+        for (index, activity) in enumerate(activities):
+            if (since is not None and activity.date <= since) or (last_id is not None and activity.id == last_id):
+                return index
         return None
+
+    def _map_matchup_teams(self, matchups: List):
+        '''Replaces the home and away team ids of matchups or box scores with the leagues teams'''
+        for matchup in matchups:
+            matchup.home_team = self._team_index.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_index.get(matchup.away_team, matchup.away_team)
+
+    def get_team_data(self, team_id: int) -> List:
+        return self._team_index.get(team_id)
+
+    def get_player_data(self, player_id: int):
+        '''Returns the rostered player with the id, None if they aren't on a roster'''
+        return self._player_index.get(player_id)
+
+    def get_player_team(self, player_id: int):
+        '''Returns the team whose roster the player is on, None if they aren't on a roster'''
+        return self._player_team_index.get(player_id)
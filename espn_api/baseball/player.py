@@ -1,44 +1,73 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP
-from .utils import json_parsing
+from ..utils.utils import compact_stats, json_parsing_keys
+from functools import cached_property
 import pdb
 
+def build_stats(stat_splits: list, breakdowns: bool = True) -> dict:
+    '''Returns the points and stats breakdowns of each scoring period, actual and projected,
+    from (scoring period, stat source, points, compacted breakdown) splits. Without breakdowns they are None'''
+    stats = {}
+    for (scoring_period, stat_source, points, (ids, values)) in stat_splits:
+        breakdown = {STATS_MAP.get(int(k), k):v for (k,v) in zip(ids, values)} if breakdowns else None
+        (points_type, breakdown_type) = ('points', 'breakdown') if stat_source == 0 else ('projected_points', 'projected_breakdown')
+        if stats.get(scoring_period):
+            stats[scoring_period][points_type] = points
+            stats[scoring_period][breakdown_type] = breakdown
+        else:
+            stats[scoring_period] = {points_type: points, breakdown_type: breakdown}
+    return stats
+
 class Player(object):
-    '''Player are part of team'''
+    '''Player are part of team, stats are built on first access'''
+    # __dict__ holds the cached properties
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', '_stat_splits', 'injured', 'total_points', 'projected_total_points', '__dict__')
+
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1, json_parsing(data, 'defaultPositionId') - 1)
+        # the stats and rankings are most of the players json and hold none of the fields
+        fields = json_parsing_keys(data, ['fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType', 'proTeamId', 'injuryStatus'],
+                                   skip=('stats', 'rankings'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        self.position = POSITION_MAP.get(fields['defaultPositionId'] - 1, fields['defaultPositionId'] - 1)
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in json_parsing(data, 'eligibleSlots')]  # if position isn't in position map, just use the position id number
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), json_parsing(data, 'proTeamId'))
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.stats = {}
+        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in fields['eligibleSlots']]  # if position isn't in position map, just use the position id number
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(fields['proTeamId'], fields['proTeamId'])
+        self.injuryStatus = fields['injuryStatus']
 
         player = data.get('playerPoolEntry', {}).get('player') or data['player']
         self.injuryStatus = player.get('injuryStatus', self.injuryStatus)
         self.injured = player.get('injured', False)
 
-        # add available stats
+        # add available stats, they are mapped when stats are read
+        splits = {}
         player_stats = player.get('stats', [])
         for stats in player_stats:
             stats_split_type = stats.get('statSplitTypeId')
             if stats.get('seasonId') != year or (stats_split_type != 0 and stats_split_type != 5):
                 continue
             stats_breakdown = stats.get('stats') or stats.get('appliedStats', {})
-            breakdown = {STATS_MAP.get(int(k), k):v for (k,v) in stats_breakdown.items()}
-            points = round(stats.get('appliedTotal', 0), 2)
-            scoring_period = stats.get('scoringPeriodId')
             stat_source = stats.get('statSourceId')
             # TODO update stats to include stat split type (0: Season, 1: Last 7 Days, 2: Last 15 Days, 3: Last 30, 4: ??, 5: ?? Used in Box Scores)
-            (points_type, breakdown_type) = ('points', 'breakdown') if stat_source == 0 else ('projected_points', 'projected_breakdown')
-            if self.stats.get(scoring_period):
-                self.stats[scoring_period][points_type] = points
-                self.stats[scoring_period][breakdown_type] = breakdown
-            else:
-                self.stats[scoring_period] = {points_type: points, breakdown_type: breakdown}
-        self.total_points = self.stats.get(0, {}).get('points', 0)
-        self.projected_total_points = self.stats.get(0, {}).get('projected_points', 0)
+            # a later split replaces the actual or projected stats of the scoring period
+            splits[(stats.get('scoringPeriodId'), stat_source == 0)] = (stats.get('scoringPeriodId'), stat_source, round(stats.get('appliedTotal', 0), 2),
+                                                                         compact_stats(stats_breakdown))
+        self._stat_splits = list(splits.values())
+        season = self.scoring_period_stats(0, breakdowns=False)
+        self.total_points = season.get('points', 0)
+        self.projected_total_points = season.get('projected_points', 0)
             
     def __repr__(self):
         return 'Player(%s)' % (self.name, )
+
+    @cached_property
+    def stats(self):
+        return build_stats(self._stat_splits)
+
+    def scoring_period_stats(self, scoring_period: int, breakdowns: bool = True) -> dict:
+        '''Returns stats[scoring_period] without building the stats of the other scoring periods'''
+        if 'stats' in self.__dict__:
+            return self.stats.get(scoring_period, {})
+        splits = [split for split in self._stat_splits if split[0] == scoring_period]
+        return build_stats(splits, breakdowns).get(scoring_period, {})
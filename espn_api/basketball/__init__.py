@@ -1,10 +1,12 @@
 __all__ = ['League',
+           'AsyncLeague',
            'Team',
            'Player',
            'Matchup',
            ]
 
 from .league import League
+from .async_league import AsyncLeague
 from .team import Team
 from .player import Player
 from .matchup import Matchup
@@ -4,8 +4,10 @@ from datetime import datetime, timedelta
 
 class BoxPlayer(Player):
     '''player with extra data from a matchup'''
-    def __init__(self, data, pro_schedule, year, scoring_period):
-        super(BoxPlayer, self).__init__(data, year, pro_schedule)
+    __slots__ = ('slot_position', 'pro_opponent', 'game_played', 'points', 'points_breakdown')
+
+    def __init__(self, data, pro_schedule, year, scoring_period, player_identities: dict = None):
+        super(BoxPlayer, self).__init__(data, year, pro_schedule, player_identities)
         self.slot_position = 'FA'
         self.pro_opponent = "None" # professional team playing against
         self.game_played = 100 # 0-100 for percent of game played
@@ -16,25 +16,25 @@ class BoxScore(ABC):
     home_team = self.home_team or "BYE"
     return f'Box Score({away_team} at {home_team})'
   
-  def _get_player_lineup(self, team, data, pro_schedule, by_matchup, year):
+  def _get_player_lineup(self, team, data, pro_schedule, by_matchup, year, player_identities):
     if team not in data:
       return []
     
     roster_key = 'rosterForMatchupPeriod' if by_matchup else 'rosterForCurrentScoringPeriod'
     roster =  data[team].get(roster_key, {})
-    lineup = [BoxPlayer(player, pro_schedule, year, self.scoring_period) for player in roster.get('entries', [])]
+    lineup = [BoxPlayer(player, pro_schedule, year, self.scoring_period, player_identities) for player in roster.get('entries', [])]
 
     return lineup
 
 class H2HPointsBoxScore(BoxScore):
-  def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0):
+  def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0, player_identities: dict = None):
     super().__init__(data, scoring_period)
 
-    (self.home_score, self.home_projected, self.home_lineup) = self._get_team_data('home', data, pro_schedule, by_matchup, year)
+    (self.home_score, self.home_projected, self.home_lineup) = self._get_team_data('home', data, pro_schedule, by_matchup, year, player_identities)
 
-    (self.away_score, self.away_projected, self.away_lineup) = self._get_team_data('away', data, pro_schedule, by_matchup, year)
+    (self.away_score, self.away_projected, self.away_lineup) = self._get_team_data('away', data, pro_schedule, by_matchup, year, player_identities)
 
-  def _get_team_data(self, team, data, pro_schedule, by_matchup, year):
+  def _get_team_data(self, team, data, pro_schedule, by_matchup, year, player_identities):
     if team not in data:
       return (0, -1, [])
     
@@ -46,19 +46,19 @@ class H2HPointsBoxScore(BoxScore):
       team_projected = round(data[team].get('totalProjectedPointsLive', -1), 2)
     else:
       team_score = round(team_roster.get('appliedStatTotal', 0), 2)
-    lineup = self._get_player_lineup(team, data, pro_schedule, by_matchup, year)
+    lineup = self._get_player_lineup(team, data, pro_schedule, by_matchup, year, player_identities)
 
     return (team_score, team_projected, lineup)
 
 class H2HCategoryBoxScore(BoxScore):
-  def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0):
+  def __init__(self, data, pro_schedule, by_matchup, year, scoring_period = 0, player_identities: dict = None):
     super().__init__(data, scoring_period)
 
-    (self.home_wins, self.home_ties, self.home_losses, self.home_stats, self.home_lineup) = self._get_team_data('home', data, pro_schedule, by_matchup, year)
+    (self.home_wins, self.home_ties, self.home_losses, self.home_stats, self.home_lineup) = self._get_team_data('home', data, pro_schedule, by_matchup, year, player_identities)
 
-    (self.away_wins, self.away_ties, self.away_losses, self.away_stats, self.away_lineup) = self._get_team_data('away', data, pro_schedule, by_matchup, year)
+    (self.away_wins, self.away_ties, self.away_losses, self.away_stats, self.away_lineup) = self._get_team_data('away', data, pro_schedule, by_matchup, year, player_identities)
   
-  def _get_team_data(self, team, data, pro_schedule, by_matchup, year):
+  def _get_team_data(self, team, data, pro_schedule, by_matchup, year, player_identities):
     if team not in data:
       return (0, 0, 0, {}, [])
     cumulative_score = data[team].get('cumulativeScore', {})
@@ -73,7 +73,7 @@ class H2HCategoryBoxScore(BoxScore):
         'result': stat_dict['result']
       }
 
-    lineup = self._get_player_lineup(team, data, pro_schedule, by_matchup, year)
+    lineup = self._get_player_lineup(team, data, pro_schedule, by_matchup, year, player_identities)
 
     return (team_wins, team_ties, team_losses, team_stats, lineup)
 
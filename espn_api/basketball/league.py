@@ -1,36 +1,42 @@
 import json
-from typing import List, Set, Union
+from typing import List, Set, Tuple, Union
 
 from ..base_league import BaseLeague
+from ..requests.session_pool import SessionPool
+from ..stats_store import StatsStore
 from .team import Team
 from .player import Player
 from .matchup import Matchup
 from .box_score import get_box_scoring_type_class, BoxScore
 from .activity import Activity
 from .transaction import Transaction
-from .constant import POSITION_MAP, ACTIVITY_MAP, TRANSACTION_TYPES
+from .constant import POSITION_MAP, ACTIVITY_MAP, STATS_MAP, TRANSACTION_TYPES
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nba', espn_s2=espn_s2, swid=swid, debug=debug)
+    _uses_pro_schedule = True
+
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, concurrent_requests=False,
+                 max_response_length: int = None, session_pool: SessionPool = None):
+        super().__init__(league_id=league_id, year=year, sport='nba', espn_s2=espn_s2, swid=swid, debug=debug, concurrent_requests=concurrent_requests,
+                         max_response_length=max_response_length, session_pool=session_pool)
 
         if fetch_league:
             self.fetch_league()
 
     def fetch_league(self):
-        data = self._fetch_league()
-        self._fetch_teams(data)
-        super()._fetch_draft()
-
-        self.BoxScoreClass = get_box_scoring_type_class(self.settings.scoring_type)
+        (data, players, pro_schedule, draft) = self._fetch_league_payloads()
+        self._build_league(data, players, pro_schedule, draft)
 
-    def _fetch_league(self):
-        data = super()._fetch_league()
-
-        self._fetch_players()
+    def _build_league(self, data, players, pro_schedule, draft):
+        '''Builds the league from the league, pro players, pro schedule and draft payloads'''
+        super()._parse_league(data)
+        self._parse_players(players)
         self._map_matchup_ids(data['schedule'])
-        return(data)
+        self._fetch_teams(data, pro_schedule=self._set_pro_schedule(pro_schedule).games)
+        super()._parse_draft(draft)
+
+        self.BoxScoreClass = get_box_scoring_type_class(self.settings.scoring_type)
 
     def _map_matchup_ids(self, schedule):
         self.matchup_ids = {}
@@ -44,20 +50,16 @@ class League(BaseLeague):
                     self.matchup_ids[matchup_period] = sorted(set(self.matchup_ids[matchup_period] + list(scoring_periods)))
 
 
-    def _fetch_teams(self, data):
+    def _fetch_teams(self, data, pro_schedule = None):
         '''Fetch teams in league'''
-        pro_schedule = self._get_all_pro_schedule()
+        if pro_schedule is None:
+            pro_schedule = self._get_all_pro_schedule()
         super()._fetch_teams(data, TeamClass=Team, pro_schedule=pro_schedule)
 
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            self._map_matchup_teams(team.schedule)
 
     def standings(self) -> List[Team]:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
@@ -72,15 +74,13 @@ class League(BaseLeague):
             'view': 'mMatchup',
         }
         data = self.espn_request.league_get(params=params)
+        return self._parse_scoreboard(data, matchupPeriod)
+
+    def _parse_scoreboard(self, data, matchupPeriod: int) -> List[Matchup]:
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        self._map_matchup_teams(matchups)
 
         return matchups
 
@@ -89,23 +89,26 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178,180,179,239,181,244,188]
-        if msg_type in ACTIVITY_MAP:
-            msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
+        msg_types = self._get_activity_msg_types(msg_type)
 
-        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
-        activity = [Activity(topic, self.player_map, self.get_team_data, include_moved=include_moved) for topic in data]
+        data = self.espn_request.get_recent_activity(msg_types, size=size, offset=offset)
+        return self._parse_activity(data, include_moved=include_moved)
 
-        return activity
+    def _get_activity_msg_types(self, msg_type: str = None) -> List[int]:
+        if msg_type in ACTIVITY_MAP:
+            return [ACTIVITY_MAP[msg_type]]
+        return [178,180,179,239,181,244,188]
+
+    def _parse_activity(self, data, include_moved=False) -> List[Activity]:
+        return [Activity(topic, self.player_map, self.get_team_data, include_moved=include_moved) for topic in data['topics']]
 
     def transactions(self, scoring_period: int = None, types: Set[str] = {"FREEAGENT","WAIVER","WAIVER_ERROR"}) -> List[Transaction]:
         '''Returns a list of recent transactions'''
+        (params, headers) = self._get_transaction_request(scoring_period, types)
+        data = self.espn_request.league_get(params=params, headers=headers)
+        return self._parse_transactions(data)
+
+    def _get_transaction_request(self, scoring_period: int, types: Set[str]) -> Tuple[dict, dict]:
         if not scoring_period:
             scoring_period = self.scoringPeriodId
 
@@ -119,8 +122,9 @@ class League(BaseLeague):
 
         filters = {"transactions":{"filterType":{"value":list(types)}}}
         headers = {'x-fantasy-filter': json.dumps(filters)}
+        return (params, headers)
 
-        data = self.espn_request.league_get(params=params, headers=headers)
+    def _parse_transactions(self, data) -> List[Transaction]:
         transactions = data['transactions']
 
         return [Transaction(transaction, self.player_map, self.get_team_data) for transaction in transactions]
@@ -134,30 +138,37 @@ class League(BaseLeague):
         if not week:
             week = self.current_week
 
-        slot_filter = []
-        if position and position in POSITION_MAP:
-            slot_filter = [POSITION_MAP[position]]
-        if position_id:
-            slot_filter.append(position_id)
+        slot_filter = self._get_slot_filter(POSITION_MAP, position, position_id)
+        data = self.espn_request.get_free_agents(week, size=size, slot_filter=slot_filter)
+        return self._parse_free_agents(data)
 
-
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
+    def _parse_free_agents(self, data) -> List[Player]:
         players = data['players']
+        return [Player(player, self.year, player_identities=self._player_identities) for player in players]
 
-        return [Player(player, self.year) for player in players]
+    def stats_store(self, players: List[Player] = None, projected: bool = False) -> StatsStore:
+        '''Returns the stats of each scoring period of players, the rostered players by default, in a StatsStore. Needs NumPy'''
+        if players is None:
+            players = [player for team in self.teams for player in team.roster]
+        return StatsStore.from_players(players, lambda stat_id: STATS_MAP.get(stat_id, stat_id), projected=projected)
 
     def box_scores(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> List[BoxScore]:
         '''Returns list of box score for a given matchup or scoring period'''
+        (data, parse_args) = self._get_box_score_data(matchup_period, scoring_period, matchup_total)
+        return self._parse_box_scores(data, *parse_args)
+
+    def _get_box_score_data(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> Tuple[dict, tuple]:
+        '''Requests the box scores, returns the response and the other _parse_box_scores arguments, the scoring period last'''
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
+        (matchup_id, scoring_id) = self._get_box_score_periods(matchup_period, scoring_period)
+
+        data = self.espn_request.get_box_scores(matchup_id, scoring_id)
+        pro_schedule = self._get_all_pro_schedule()
+        return (data, (pro_schedule, matchup_total, scoring_id))
 
+    def _get_box_score_periods(self, matchup_period: int = None, scoring_period: int = None) -> Tuple[int, int]:
+        '''Returns the matchup period and scoring period to get box scores for'''
         matchup_id = self.currentMatchupPeriod
         scoring_id = self.current_week
         if matchup_period and scoring_period:
@@ -172,43 +183,28 @@ class League(BaseLeague):
                 if str(scoring_id) in self.matchup_ids[matchup]:
                     matchup_id = matchup
                     break
+        return (matchup_id, scoring_id)
 
-        params = {
-            'view': ['mMatchupScore', 'mScoreboard'],
-            'scoringPeriodId': scoring_id
-        }
-
-        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(params=params, headers=headers)
-
+    def _parse_box_scores(self, data, pro_schedule, matchup_total: bool, scoring_id: int) -> List[BoxScore]:
         schedule = data['schedule']
-        pro_schedule = self._get_all_pro_schedule()
-        box_data = [self.BoxScoreClass(matchup, pro_schedule, matchup_total, self.year, scoring_id) for matchup in schedule]
+        box_data = [self.BoxScoreClass(matchup, pro_schedule, matchup_total, self.year, scoring_id, self._player_identities) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        self._map_matchup_teams(box_data)
         return box_data
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
         ''' Returns Player class if name found '''
 
-        if name:
-            playerId = self.player_map.get(name)
-        if playerId is None or isinstance(playerId, str):
+        playerIds = self._get_player_ids(name, playerId)
+        if playerIds is None:
             return None
-        if not isinstance(playerId, list):
-            playerId = [playerId]
-
-        data = self.espn_request.get_player_card(playerId, self.finalScoringPeriod)
 
+        data = self.espn_request.get_player_card(playerIds, self.finalScoringPeriod)
         pro_schedule = self._get_all_pro_schedule()
+        return self._parse_player_info(data, pro_schedule)
 
+    def _parse_player_info(self, data, pro_schedule) -> Union[Player, List[Player]]:
         if len(data['players']) == 1:
-            return Player(data['players'][0], self.year, pro_schedule)
+            return Player(data['players'][0], self.year, pro_schedule, self._player_identities)
         if len(data['players']) > 1:
-            return [Player(player, self.year, pro_schedule) for player in data['players']]
+            return [Player(player, self.year, pro_schedule, self._player_identities) for player in data['players']]
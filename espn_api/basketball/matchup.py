@@ -2,6 +2,9 @@ from .constant import STATS_MAP
 
 class Matchup(object):
     '''Creates Matchup instance'''
+    __slots__ = ('winner', 'home_team', 'home_final_score', 'home_team_cats', 'home_team_live_score', 'away_team',
+                 'away_final_score', 'away_team_cats', 'away_team_live_score')
+
     def __init__(self, data):
         self.winner = data['winner']
         (self.home_team, self.home_final_score, self.home_team_cats,
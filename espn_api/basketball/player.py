@@ -1,58 +1,63 @@
 from .constant import NINE_CAT_STATS, POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import get_player_identity, json_parsing_keys
 from datetime import datetime
 from functools import cached_property
 
-class Player(object):
-    '''Player are part of team'''
-    def __init__(self, data, year, pro_team_schedule = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.year = year
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId') - 1]
-        self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.posRank = json_parsing(data, 'positionalRanking')
-        self.stats = {}
-        self.schedule = {}
-
-        if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
-            pro_team = pro_team_schedule.get(pro_team_id, {})
-            for key in pro_team:
-                game = pro_team[key][0]
-                team = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
-                self.schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
+class PlayerIdentity(object):
+    '''The fields of a player that are the same in every view of the league, shared by the Players built from them'''
+    __slots__ = ('name', 'playerId', 'position', 'eligibleSlots', 'proTeam', '_pro_team_id', '_slot_ids')
 
+    def __init__(self, player: dict):
+        self.name = player['fullName']
+        self.playerId = player['id']
+        self.position = POSITION_MAP[player['defaultPositionId'] - 1]
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in player['eligibleSlots']]
+        self.proTeam = PRO_TEAM_MAP[player['proTeamId']]
+        self._pro_team_id = player['proTeamId']
+        self._slot_ids = player['eligibleSlots']
 
+    def matches(self, player: dict) -> bool:
+        '''False once the player moved to another pro team or their eligible slots changed'''
+        return self._pro_team_id == player['proTeamId'] and self._slot_ids == player['eligibleSlots']
 
-        # add available stats
+class Player(object):
+    '''Player are part of team, stats and schedule are built on first access. Players of a league share their PlayerIdentity fields'''
+    # __dict__ holds the cached properties
+    __slots__ = ('name', 'playerId', 'year', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', 'posRank', '_pro_team_id', '_pro_games', '_stat_splits', 'injured', 'total_points', 'avg_points',
+                 'projected_total_points', 'projected_avg_points', '__dict__')
 
+    def __init__(self, data, year, pro_team_schedule = None, player_identities: dict = None):
         player = data['playerPoolEntry']['player'] if 'playerPoolEntry' in data else data['player']
-        self.injuryStatus = player.get('injuryStatus', self.injuryStatus)
+        identity = get_player_identity(player, player_identities, PlayerIdentity)
+        self.name = identity.name
+        self.playerId = identity.playerId
+        self.year = year
+        self.position = identity.position
+        self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
+        self.eligibleSlots = identity.eligibleSlots
+        self.proTeam = identity.proTeam
+        self._pro_team_id = identity._pro_team_id
+        self._pro_games = pro_team_schedule.get(identity._pro_team_id, {}) if pro_team_schedule else {}
+
+        # the stats and rankings are most of the players json and hold none of the fields
+        fields = json_parsing_keys(data, ['acquisitionType', 'injuryStatus', 'positionalRanking'], skip=('stats', 'rankings'))
+        self.acquisitionType = fields['acquisitionType']
+        self.posRank = fields['positionalRanking']
+        self.injuryStatus = player.get('injuryStatus', fields['injuryStatus'])
         self.injured = player.get('injured', False)
 
-        for split in  player.get('stats', []):
+        # the raw stats of the season by stat id, they are mapped when stats are read
+        self._stat_splits = {}
+        for split in player.get('stats', []):
             if split['seasonId'] == year:
-                id = self._stat_id_pretty(split['id'], split['scoringPeriodId'])
-                applied_total = split.get('appliedTotal', 0)
-                applied_avg =  round(split.get('appliedAverage', 0), 2)
-                game = self.schedule.get(id, {})
-                self.stats[id] = dict(applied_total=applied_total, applied_avg=applied_avg, team=game.get('team', None), date=game.get('date', None))
-                if split.get('stats'):
-                    if 'averageStats' in split.keys():
-                        self.stats[id]['avg'] = {STATS_MAP.get(i, i): split['averageStats'][i] for i in split['averageStats'].keys() if STATS_MAP.get(i) != ''}
-                        self.stats[id]['total'] = {STATS_MAP.get(i, i): split['stats'][i] for i in split['stats'].keys() if STATS_MAP.get(i) != ''}
-                    else:
-                        self.stats[id]['avg'] = None
-                        self.stats[id]['total'] = {STATS_MAP.get(i, i): split['stats'][i] for i in split['stats'].keys() if STATS_MAP.get(i) != ''}
-        self.total_points = self.stats.get(f'{year}_total', {}).get('applied_total', 0)
-        self.avg_points = self.stats.get(f'{year}_total', {}).get('applied_avg', 0)
-        self.projected_total_points= self.stats.get(f'{year}_projected', {}).get('applied_total', 0)
-        self.projected_avg_points = self.stats.get(f'{year}_projected', {}).get('applied_avg', 0)
+                self._stat_splits[self._stat_id_pretty(split['id'], split['scoringPeriodId'])] = split
+        total = self._stat_splits.get(f'{year}_total', {})
+        projected = self._stat_splits.get(f'{year}_projected', {})
+        self.total_points = total.get('appliedTotal', 0)
+        self.avg_points = round(total.get('appliedAverage', 0), 2)
+        self.projected_total_points = projected.get('appliedTotal', 0)
+        self.projected_avg_points = round(projected.get('appliedAverage', 0), 2)
 
     def __repr__(self):
         return f'Player({self.name})'
@@ -61,6 +66,37 @@ class Player(object):
         id_type = STAT_ID_MAP.get(id[:2])
         return f'{id[2:]}_{id_type}' if id_type else str(scoring_period)
 
+    @cached_property
+    def schedule(self):
+        schedule = {}
+        for key in self._pro_games:
+            game = self._pro_games[key][0]
+            team = game['awayProTeamId'] if game['awayProTeamId'] != self._pro_team_id else game['homeProTeamId']
+            schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
+        return schedule
+
+    @cached_property
+    def stats(self):
+        stats = {}
+        for (id, split) in self._stat_splits.items():
+            applied_total = split.get('appliedTotal', 0)
+            applied_avg =  round(split.get('appliedAverage', 0), 2)
+            game = self.schedule.get(id, {})
+            stats[id] = dict(applied_total=applied_total, applied_avg=applied_avg, team=game.get('team', None), date=game.get('date', None))
+            if split.get('stats'):
+                if 'averageStats' in split.keys():
+                    stats[id]['avg'] = {STATS_MAP.get(i, i): split['averageStats'][i] for i in split['averageStats'].keys() if STATS_MAP.get(i) != ''}
+                    stats[id]['total'] = {STATS_MAP.get(i, i): split['stats'][i] for i in split['stats'].keys() if STATS_MAP.get(i) != ''}
+                else:
+                    stats[id]['avg'] = None
+                    stats[id]['total'] = {STATS_MAP.get(i, i): split['stats'][i] for i in split['stats'].keys() if STATS_MAP.get(i) != ''}
+        return stats
+
+    def _stats_store_rows(self, projected: bool = False) -> list:
+        '''Returns the (scoring period, points, raw stats) of each scoring period, actual or projected'''
+        return [(int(id), split.get('appliedTotal', 0), split.get('stats') or {}) for (id, split) in self._stat_splits.items()
+                if id.isdigit() and id != '0' and (split.get('statSourceId', 0) == 0) != projected]
+
     @cached_property
     def nine_cat_averages(self):
         return {
@@ -4,6 +4,10 @@ from .constant import STATS_MAP
 
 class Team(object):
     '''Teams are part of the league'''
+    __slots__ = ('team_id', 'team_abbrev', 'team_name', 'division_id', 'division_name', 'wins', 'losses', 'ties',
+                 'acquisitions', 'acquisition_budget_spent', 'drops', 'trades', 'logo_url', 'stats', 'standing',
+                 'final_standing', 'roster', 'schedule', 'owners')
+
     def __init__(self, data, roster, schedule, year, **kwargs):
         self.team_id = data['id']
         self.team_abbrev = data['abbrev']
@@ -31,7 +35,7 @@ class Team(object):
         if 'logo' in data:    
             self.logo_url = data['logo']
         
-        self._fetch_roster(roster, year, kwargs.get('pro_schedule'))
+        self._fetch_roster(roster, year, kwargs.get('pro_schedule'), kwargs.get('player_identities'))
         self._fetch_schedule(schedule)
         self.owners = kwargs.get('owners', [])
         
@@ -39,13 +43,13 @@ class Team(object):
         return f'Team({self.team_name})'
     
 
-    def _fetch_roster(self, data, year, pro_schedule = None):
+    def _fetch_roster(self, data, year, pro_schedule = None, player_identities: dict = None):
         '''Fetch teams roster'''
         self.roster.clear()
         roster = data['entries']
 
         for player in roster:
-            self.roster.append(Player(player, year, pro_schedule))
+            self.roster.append(Player(player, year, pro_schedule, player_identities))
 
 
     def _fetch_schedule(self, data):
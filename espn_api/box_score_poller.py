@@ -0,0 +1,160 @@
+import asyncio
+import time
+from functools import partial
+from typing import AsyncIterator, Callable, List
+
+# a pro game is in progress for this long after it starts, the same window BoxPlayer.game_played uses
+GAME_LENGTH = 3 * 60 * 60
+# box score attributes compared for each side, the ones a sports box score doesn't have are skipped
+SCORE_FIELDS = ('score', 'projected', 'wins', 'losses', 'ties')
+# box player attributes compared for each player
+PLAYER_FIELDS = ('slot_position', 'points', 'projected_points', 'points_breakdown')
+
+
+class ScoreChange(object):
+    '''A box score field of one side of a matchup that changed since the last poll'''
+    def __init__(self, box_score, team, field: str, old, new):
+        self.box_score = box_score
+        self.team = team
+        self.field = field
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return f'ScoreChange({self.team}, {self.field}: {self.old} -> {self.new})'
+
+
+class PlayerChange(object):
+    '''A player whose box score changed since the last poll, old is None for a player
+    added to the lineup and player is None for one that left it'''
+    def __init__(self, box_score, team, player, old):
+        self.box_score = box_score
+        self.team = team
+        self.player = player
+        self.old = old
+
+    def __repr__(self):
+        return f'PlayerChange({self.team}, {self.player or self.old})'
+
+
+class BoxScorePoller(object):
+    '''Polls a leagues box scores and reports what changed since the last poll.
+    Matchups whose payload didn't change keep their box score objects instead of being parsed again.
+    box_score_kwargs are passed to the leagues box_scores, AsyncLeague is supported by events'''
+    def __init__(self, league, live_interval: float = 30, idle_interval: float = 600, **box_score_kwargs):
+        self.league = league
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.box_score_kwargs = box_score_kwargs
+        self.box_scores = []
+        self.scoring_period = None
+        self._matchups = []
+
+    def __repr__(self):
+        return f'BoxScorePoller({self.league}, {len(self.box_scores)} box scores)'
+
+    def poll(self) -> List:
+        '''Requests the box scores once and returns the changes, the first poll returns none'''
+        (data, parse_args) = self.league._get_box_score_data(**self.box_score_kwargs)
+        return self._update(data, parse_args)
+
+    async def poll_async(self) -> List:
+        '''poll for an AsyncLeague, a League is polled in the default executor'''
+        if asyncio.iscoroutinefunction(self.league._get_box_score_data):
+            (data, parse_args) = await self.league._get_box_score_data(**self.box_score_kwargs)
+        else:
+            get_data = partial(self.league._get_box_score_data, **self.box_score_kwargs)
+            (data, parse_args) = await asyncio.get_running_loop().run_in_executor(None, get_data)
+        return self._update(data, parse_args)
+
+    def run(self, callback: Callable, polls: int = None):
+        '''Polls until polls have been made, forever by default, calling callback with every change'''
+        count = 0
+        while polls is None or count < polls:
+            for change in self.poll():
+                callback(change)
+            count += 1
+            if polls is None or count < polls:
+                time.sleep(self.next_interval())
+
+    async def events(self, polls: int = None) -> AsyncIterator:
+        '''Yields every change of polls polls, forever by default'''
+        count = 0
+        while polls is None or count < polls:
+            for change in await self.poll_async():
+                yield change
+            count += 1
+            if polls is None or count < polls:
+                await asyncio.sleep(self.next_interval())
+
+    def next_interval(self, now: float = None) -> float:
+        '''Seconds until the next poll, live_interval while a pro game of the scoring period is in progress,
+        otherwise until the next game starts but no more than idle_interval'''
+        pro_schedule = self.league._pro_schedule
+        if pro_schedule is None or self.scoring_period is None:
+            return self.idle_interval
+        now = time.time() if now is None else now
+        starts = [date / 1000.0 for (opponent, date) in pro_schedule.scoring_period(self.scoring_period).values()]
+        if any(start <= now < start + GAME_LENGTH for start in starts):
+            return self.live_interval
+        upcoming = [start - now for start in starts if start > now]
+        return max(self.live_interval, min([self.idle_interval] + upcoming))
+
+    def _update(self, data, parse_args: tuple) -> List:
+        '''Parses the matchups that changed, reusing the previous box score of the others, and returns the changes'''
+        self.scoring_period = parse_args[-1]
+        matchups = data['schedule']
+        previous = {self._matchup_key(i, matchup): (matchup, box_score)
+                    for (i, (matchup, box_score)) in enumerate(zip(self._matchups, self.box_scores))}
+
+        box_scores = [None] * len(matchups)
+        changed = []
+        for (i, matchup) in enumerate(matchups):
+            (old_matchup, old_box_score) = previous.get(self._matchup_key(i, matchup), (None, None))
+            if old_matchup == matchup:
+                box_scores[i] = old_box_score
+            else:
+                changed.append(i)
+        if changed:
+            parsed = self.league._parse_box_scores({'schedule': [matchups[i] for i in changed]}, *parse_args)
+            for (i, box_score) in zip(changed, parsed):
+                box_scores[i] = box_score
+
+        changes = []
+        if self._matchups:
+            for i in changed:
+                old = previous.get(self._matchup_key(i, matchups[i]))
+                changes.extend(box_score_changes(old[1] if old else None, box_scores[i]))
+        self._matchups = matchups
+        self.box_scores = box_scores
+        return changes
+
+    @staticmethod
+    def _matchup_key(i: int, matchup: dict):
+        return matchup.get('id', i)
+
+
+def _player_fields(player) -> tuple:
+    return tuple(getattr(player, field, None) for field in PLAYER_FIELDS)
+
+
+def box_score_changes(old, new) -> List:
+    '''Returns the ScoreChange and PlayerChange events between two box scores of a matchup, old is None for a new matchup'''
+    changes = []
+    for side in ('home', 'away'):
+        team = getattr(new, f'{side}_team')
+        for field in SCORE_FIELDS:
+            name = f'{side}_{field}'
+            if not hasattr(new, name):
+                continue
+            (old_value, value) = (getattr(old, name, None), getattr(new, name))
+            if old_value != value:
+                changes.append(ScoreChange(new, team, field, old_value, value))
+
+        old_lineup = {player.playerId: player for player in getattr(old, f'{side}_lineup', [])}
+        for player in getattr(new, f'{side}_lineup', []):
+            old_player = old_lineup.pop(player.playerId, None)
+            if old_player is None or _player_fields(old_player) != _player_fields(player):
+                changes.append(PlayerChange(new, team, player, old_player))
+        changes.extend(PlayerChange(new, team, None, old_player) for old_player in old_lineup.values())
+    return changes
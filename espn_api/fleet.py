@@ -0,0 +1,180 @@
+import asyncio
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Iterable, Iterator, Tuple, Union
+
+from . import baseball, basketball, football, hockey, wbasketball
+from .requests.async_espn_requests import AsyncSessionPool
+from .requests.session_pool import SessionPool
+
+# sport package of each ESPN sport code and package name
+SPORTS = {
+    'nfl': football, 'football': football,
+    'nba': basketball, 'basketball': basketball,
+    'nhl': hockey, 'hockey': hockey,
+    'mlb': baseball, 'baseball': baseball,
+    'wnba': wbasketball, 'wbasketball': wbasketball,
+}
+
+
+def _league_class(sport: str, asynchronous: bool = False):
+    if sport not in SPORTS:
+        raise Exception(f'Unknown sport: {sport}, available options are {list(SPORTS)}')
+    return SPORTS[sport].AsyncLeague if asynchronous else SPORTS[sport].League
+
+
+def _credentials(credentials: Union[None, tuple, dict]) -> Tuple[str, str]:
+    '''Returns the (espn_s2, swid) of None, an (espn_s2, swid) pair or a dict with those keys'''
+    if credentials is None:
+        return (None, None)
+    if isinstance(credentials, dict):
+        return (credentials.get('espn_s2'), credentials.get('swid', credentials.get('SWID')))
+    return tuple(credentials)
+
+
+class LeagueResult(object):
+    '''One league of a fleet, league is None and error is the exception when it couldn't be loaded'''
+    def __init__(self, sport: str, league_id: int, year: int, league=None, error: Exception = None, elapsed: float = 0.0):
+        self.sport = sport
+        self.league_id = league_id
+        self.year = year
+        self.league = league
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        outcome = self.league if self.error is None else type(self.error).__name__
+        return f'LeagueResult({self.sport}, {self.league_id}, {self.year}, {outcome}, {self.elapsed:.2f}s)'
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FleetStats(object):
+    '''Throughput of a fleet, latencies are the seconds each league took to load'''
+    def __init__(self):
+        self.loaded = 0
+        self.failed = 0
+        # exception name -> number of leagues that failed with it
+        self.errors = {}
+        self.latencies = []
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return (f'FleetStats({self.loaded} loaded, {self.failed} failed, {self.leagues_per_second:.1f} leagues/s, '
+                f'p50 {self.p50:.2f}s, p95 {self.p95:.2f}s)')
+
+    def record(self, result: LeagueResult):
+        if result.ok:
+            self.loaded += 1
+        else:
+            self.failed += 1
+            name = type(result.error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+        self.latencies.append(result.elapsed)
+        self.elapsed = time.monotonic() - self.started
+
+    @property
+    def leagues_per_second(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency(self, percentile: float) -> float:
+        '''Returns the nearest rank percentile of the league latencies, 0 before any league finished'''
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        rank = max(int(-(-percentile * len(latencies) // 100)), 1)
+        return latencies[rank - 1]
+
+    @property
+    def p50(self) -> float:
+        return self.latency(50)
+
+    @property
+    def p95(self) -> float:
+        return self.latency(95)
+
+
+class LeagueFleet(object):
+    '''Loads many leagues, max_workers at a time. Leagues are (sport, league_id, year, credentials) where sport is an ESPN
+    code like nfl or a package name like football and credentials is None, an (espn_s2, swid) pair or a dict with those keys.
+    Every league shares one connection pool and the process wide pro data cache. A league that fails to load, usually with
+    ESPNAccessDenied or ESPNInvalidLeague, is returned with its error instead of stopping the others'''
+    def __init__(self, max_workers: int = 16, session_pool: SessionPool = None, **league_kwargs):
+        self.max_workers = max_workers
+        self.session_pool = session_pool or SessionPool(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.league_kwargs = league_kwargs
+        self.stats = FleetStats()
+
+    def __repr__(self):
+        return f'LeagueFleet(max_workers={self.max_workers})'
+
+    def fetch(self, leagues: Iterable[tuple]) -> Iterator[LeagueResult]:
+        '''Loads the leagues on max_workers threads and yields each LeagueResult as soon as it is done, not in order.
+        leagues is read a few at a time so it can be a generator, stats is updated as results come in'''
+        self.stats = FleetStats()
+        leagues = iter(leagues)
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    for league in itertools.islice(leagues, 2 * self.max_workers - len(pending)):
+                        pending.add(executor.submit(self._load, *league))
+                    if not pending:
+                        break
+                    (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        self.stats.record(result)
+                        yield result
+            finally:
+                # leagues that haven't started when the caller stops iterating are never loaded
+                for future in pending:
+                    future.cancel()
+
+    def _load(self, sport: str, league_id: int, year: int, credentials=None) -> LeagueResult:
+        started = time.monotonic()
+        try:
+            (espn_s2, swid) = _credentials(credentials)
+            league = _league_class(sport)(league_id, year, espn_s2=espn_s2, swid=swid, session_pool=self.session_pool, **self.league_kwargs)
+        except Exception as e:
+            return LeagueResult(sport, league_id, year, error=e, elapsed=time.monotonic() - started)
+        return LeagueResult(sport, league_id, year, league=league, elapsed=time.monotonic() - started)
+
+    async def fetch_async(self, leagues: Iterable[tuple], session_pool: AsyncSessionPool = None) -> AsyncIterator[LeagueResult]:
+        '''fetch with AsyncLeagues, max_workers leagues are loaded at a time on the running event loop.
+        The AsyncSessionPool is closed at the end unless it is passed in'''
+        self.stats = FleetStats()
+        pool = session_pool or AsyncSessionPool(limit=self.max_workers)
+        leagues = iter(leagues)
+        pending = set()
+        try:
+            while True:
+                for league in itertools.islice(leagues, self.max_workers - len(pending)):
+                    pending.add(asyncio.ensure_future(self._load_async(pool, *league)))
+                if not pending:
+                    break
+                (done, pending) = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    self.stats.record(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            if session_pool is None:
+                await pool.close()
+
+    async def _load_async(self, session_pool: AsyncSessionPool, sport: str, league_id: int, year: int, credentials=None) -> LeagueResult:
+        started = time.monotonic()
+        try:
+            (espn_s2, swid) = _credentials(credentials)
+            league = _league_class(sport, asynchronous=True)(league_id, year, espn_s2=espn_s2, swid=swid, session_pool=session_pool,
+                                                             **self.league_kwargs)
+            await league.fetch_league()
+        except Exception as e:
+            return LeagueResult(sport, league_id, year, error=e, elapsed=time.monotonic() - started)
+        return LeagueResult(sport, league_id, year, league=league, elapsed=time.monotonic() - started)
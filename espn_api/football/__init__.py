@@ -1,4 +1,5 @@
 __all__ = ['League',
+           'AsyncLeague',
            'Team',
            'Matchup',
            'Player',
@@ -6,6 +7,7 @@ __all__ = ['League',
            ]
 
 from .league import League
+from .async_league import AsyncLeague
 from .team import Team
 from .matchup import Matchup
 from .player import Player
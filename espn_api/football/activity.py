@@ -1,8 +1,19 @@
 from .constant import ACTIVITY_MAP
 
+def get_activity_team_id(msg) -> int:
+    '''Returns the id of the team that made the move in an activity message'''
+    msg_id = msg['messageTypeId']
+    if msg_id == 244:
+        return msg['from']
+    elif msg_id == 239:
+        return msg['for']
+    return msg['to']
+
+
 class Activity(object):
     def __init__(self, data, player_map, get_team_data, player_info):
         self.actions = [] # List of tuples (Team, action, Player)
+        self.id = data.get('id')
         self.date = data['date']
         for msg in data['messages']:
             team = ''
@@ -10,21 +21,13 @@ class Activity(object):
             player = None
             bid_amount = 0
             msg_id = msg['messageTypeId']
-            if msg_id == 244:
-                team = get_team_data(msg['from'])
-            elif msg_id == 239:
-                team = get_team_data(msg['for'])
-            else:
-                team = get_team_data(msg['to'])
+            team = get_team_data(get_activity_team_id(msg))
             if msg_id in ACTIVITY_MAP:
                 action = ACTIVITY_MAP[msg_id]
             if action == 'WAIVER ADDED':
                 bid_amount = msg.get('from', 0)
             if team:
-                for team_player in team.roster:
-                    if team_player.playerId == msg['targetId']:
-                        player = team_player
-                        break
+                player = team.get_player(msg['targetId'])
             if not player:
                 player = player_info(playerId=msg['targetId'])
             self.actions.append((team, action, player, bid_amount))
@@ -0,0 +1,130 @@
+import asyncio
+from typing import List, Tuple, Union
+
+from ..base_async_league import BaseAsyncLeague
+from .league import League
+from .box_score import BoxScore
+from .box_player import BoxPlayer
+from .player import Player
+from .activity import Activity
+from .matchup import Matchup
+from .constant import POSITION_MAP
+from .lineup import SeasonLineupEfficiency, season_lineup_efficiency, team_optimal_lineup
+from .refresh import RefreshSummary
+
+
+class AsyncLeague(BaseAsyncLeague, League):
+    '''League where fetch_league, refresh, box_scores, scoreboard, free_agents, recent_activity, player_info
+    and the other methods that request data are coroutines'''
+
+    async def refresh(self) -> RefreshSummary:
+        '''Gets latest league data. This can be used instead of creating a new League class each week.
+        Only the teams whose data changed are rebuilt, the others keep their objects. Returns what changed'''
+        (data, pro_schedule_data) = await asyncio.gather(self.espn_request.get_league(), self.espn_request.get_pro_schedule())
+        return self._refresh_teams(self._parse_league(data), pro_schedule_data)
+
+    async def refresh_draft(self, refresh_players=False, refresh__teams=False):
+        self._parse_draft(await self.espn_request.get_league_draft())
+        if refresh_players:
+            self._parse_players(await self.espn_request.get_pro_players())
+        if refresh__teams:
+            await self.refresh()
+
+    async def load_roster_week(self, week: int) -> None:
+        '''Sets Teams Roster for a Certain Week'''
+        params = {
+            'view': 'mRoster',
+            'scoringPeriodId': week
+        }
+        self._parse_roster_week(await self.espn_request.league_get(params=params))
+
+    async def scoreboard(self, week: int = None) -> List[Matchup]:
+        '''Returns list of matchups for a given week'''
+        if not week:
+            week = self.current_week
+
+        data = await self.espn_request.league_get(params={'view': 'mMatchupScore'})
+        return self._parse_scoreboard(data, week)
+
+    async def message_board(self, msg_types: List[str] = None):
+        ''' Returns a list of league messages'''
+        return self._parse_message_board(await self.espn_request.get_league_message_board(msg_types))
+
+    async def _get_positional_ratings(self, week: int):
+        data = await self.espn_request.get_positional_ratings(week)
+        return self._parse_positional_ratings(data)
+
+    async def recent_activity(self, size: int = 25, msg_type: str = None, offset: int = 0) -> List[Activity]:
+        '''Returns a list of recent league activities (Add, Drop, Trade)'''
+        if self.year < 2019:
+            raise Exception('Cant use recent activity before 2019')
+
+        msg_types = self._get_activity_msg_types(msg_type)
+        data = await self.espn_request.get_recent_activity(msg_types, size=size, offset=offset)
+
+        # Activity looks up players that aren't on the acting teams roster, request them all up front
+        player_ids = self._get_activity_player_ids(data)
+        if not player_ids:
+            return self._parse_activity(data, lambda playerId: None)
+        (pro_schedule, *cards) = await asyncio.gather(
+            self._get_all_pro_schedule(),
+            *[self.espn_request.get_player_card(chunk, self.finalScoringPeriod) for chunk in self._chunk_player_ids(player_ids)],
+        )
+        players = self._parse_player_cards(cards, pro_schedule)
+        return self._parse_activity(data, lambda playerId: players.get(playerId))
+
+    async def box_scores(self, week: int = None) -> List[BoxScore]:
+        '''Returns list of box score for a given week\n
+        Should only be used with most recent season'''
+        (data, parse_args) = await self._get_box_score_data(week)
+        return self._parse_box_scores(data, *parse_args)
+
+    async def _get_box_score_data(self, week: int = None) -> Tuple[dict, tuple]:
+        if self.year < 2019:
+            raise Exception('Cant use box score before 2019')
+        (matchup_period, scoring_period) = self._get_box_score_periods(week)
+
+        (data, pro_schedule, positional_rankings) = await asyncio.gather(
+            self.espn_request.get_box_scores(matchup_period, scoring_period),
+            self._get_pro_schedule(scoring_period),
+            self._get_positional_ratings(scoring_period),
+        )
+        return (data, (pro_schedule, positional_rankings, scoring_period))
+
+    async def free_agents(self, week: int=None, size: int=50, position: str=None, position_id: int=None) -> List[BoxPlayer]:
+        '''Returns a List of Free Agents for a Given Week\n
+        Should only be used with most recent season'''
+        if self.year < 2019:
+            raise Exception('Cant use free agents before 2019')
+        if not week:
+            week = self.current_week
+
+        slot_filter = self._get_slot_filter(POSITION_MAP, position, position_id)
+        (data, pro_schedule, positional_rankings) = await asyncio.gather(
+            self.espn_request.get_free_agents(week, size=size, slot_filter=slot_filter),
+            self._get_pro_schedule(week),
+            self._get_positional_ratings(week),
+        )
+        return self._parse_free_agents(data, pro_schedule, positional_rankings, week)
+
+    async def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
+        ''' Returns Player class if name found '''
+        playerIds = self._get_player_ids(name, playerId)
+        if playerIds is None:
+            return None
+
+        (data, pro_schedule) = await asyncio.gather(
+            self.espn_request.get_player_card(playerIds, self.finalScoringPeriod),
+            self._get_all_pro_schedule(),
+        )
+        return self._parse_player_info(data, pro_schedule)
+
+    async def optimal_lineup(self, team_id: int, week: int = None, projected: bool = False) -> List[Tuple[str, BoxPlayer]]:
+        '''Returns the (slot, player) pairs of the teams highest scoring lineup for a week, the current week by default.
+        projected picks the lineup by projected points, a recommendation for the current week'''
+        return team_optimal_lineup(await self.box_scores(week), team_id, self.settings.position_slot_counts, projected=projected)
+
+    async def lineup_efficiency(self, start: int = 1, end: int = None) -> List[SeasonLineupEfficiency]:
+        '''Returns every teams actual against optimal lineup points from start to end (the current week by default),
+        the team that left the most points on the bench first'''
+        return season_lineup_efficiency(await self.box_scores_range(start, end), self.settings.position_slot_counts)
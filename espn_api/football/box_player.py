@@ -5,8 +5,11 @@ from datetime import datetime, timedelta
 
 class BoxPlayer(Player):
     '''player with extra data from a matchup'''
-    def __init__(self, data, pro_schedule, positional_rankings, week, year):
-        super(BoxPlayer, self).__init__(data, year)
+    __slots__ = ('slot_position', 'pro_opponent', 'pro_pos_rank', 'game_played', 'on_bye_week', 'points',
+                 'points_breakdown', 'projected_points', 'projected_breakdown', 'game_date')
+
+    def __init__(self, data, pro_schedule, positional_rankings, week, year, player_identities: dict = None):
+        super(BoxPlayer, self).__init__(data, year, player_identities=player_identities)
         self.slot_position = 'FA'
         self.pro_opponent = "None" # professional team playing against
         self.pro_pos_rank = 0 # rank of professional team against player position
@@ -28,7 +31,7 @@ class BoxPlayer(Player):
         else: # bye week
             self.on_bye_week = True
 
-        stats = self.stats.get(week, {})
+        stats = self.scoring_period_stats(week)
         self.points = stats.get('points', 0)
         self.points_breakdown = stats.get('breakdown', 0)
         self.projected_points = stats.get('projected_points', 0)
@@ -121,9 +121,6 @@ def sort_by_head_to_head(
 
     # If there are only two teams, sort descending by H2H wins
     elif len(h2h_dict) == 2:
-        # Filter the H2H DataFrame to only include the teams in question
-        h2h_dict = build_h2h_dict(team_data_list)
-
         # Sum the H2H wins against all tied opponents
         for team_data in team_data_list:
             team_data["h2h_wins"] = sum(
@@ -134,9 +131,6 @@ def sort_by_head_to_head(
 
     # If there are more than two teams...
     else:
-        # Filter the H2H DataFrame to only include the teams in question
-        h2h_dict = build_h2h_dict(team_data_list)
-
         # Check if the teams have all played each other an equal number of times
         matchup_counts = [
             h2h_dict[team_id][opp_id]["h2h_games"]
@@ -189,23 +183,23 @@ def sort_team_data_list(
     # Apply the tiebreaker function to the standings list
     team_data_list = tiebreaker_function(team_data_list)
 
+    # Group the teams by their tiebreaker value, keeping their order within each group
+    team_data_groups = {}
+    for team_data in team_data_list:
+        team_data_groups.setdefault(team_data[tiebreaker_col], []).append(team_data)
+
     # Loop through each remaining unique tiebreaker value to see if ties remain
     sorted_team_data_list = []
-    for val in sorted(
-        set([team_data[tiebreaker_col] for team_data in team_data_list]),
-        reverse=True,
-    ):
-        # Filter the standings list to only include the teams with the current tiebreaker value
-        team_data_subset = [
-            team_data
-            for team_data in team_data_list
-            if team_data[tiebreaker_col] == val
-        ]
+    for val in sorted(team_data_groups, reverse=True):
+        team_data_subset = team_data_groups[val]
+        if len(team_data_subset) == 1:
+            sorted_team_data_list.append(team_data_subset[0])
+            continue
 
         # Append the sorted subset to the final sorted standings list
-        sorted_team_data_list = sorted_team_data_list + sort_team_data_list(
+        sorted_team_data_list.extend(sort_team_data_list(
             team_data_subset,
             tiebreaker_hierarchy[1:],
-        )
+        ))
 
     return sorted_team_data_list
@@ -3,30 +3,37 @@ import random
 from typing import Callable, Dict, List, Tuple, Union
 
 from ..base_league import BaseLeague
+from ..requests.session_pool import SessionPool
+from ..stats_store import StatsStore
 from .team import Team
 from .matchup import Matchup
 from .box_score import BoxScore
 from .box_player import BoxPlayer
 from .player import Player
-from .activity import Activity
+from .activity import Activity, get_activity_team_id
 from .settings import Settings
-from .utils import power_points, two_step_dominance
-from .constant import POSITION_MAP, ACTIVITY_MAP
-from .helper import (
-    sort_by_coin_flip,
-    sort_by_division_record,
-    sort_by_head_to_head,
-    sort_by_points_against,
-    sort_by_points_for,
-    sort_by_win_pct,
-    sort_team_data_list,
-)
+from .utils import power_points, power_points_all_weeks, two_step_dominance, win_matrix
+from .constant import POSITION_MAP, ACTIVITY_MAP, PLAYER_STATS_MAP
+from .standings import StandingsEngine
+from .playoff_odds import PlayoffOdds, PlayoffSimulator, bye_count
+from .lineup import SeasonLineupEfficiency, season_lineup_efficiency, team_optimal_lineup
+from .refresh import RefreshSummary, changed_parts, team_digests
 
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug)
+    _uses_pro_schedule = True
+    # players requested per kona_playercard request when resolving recent activity
+    _player_card_batch_size = 50
+    # built by _get_standings_engine, reset whenever the teams are fetched
+    _standings_engine = None
+    # team id -> digests of the team payload the team was built from, see refresh.team_digests
+    _team_digests = {}
+
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, concurrent_requests=False,
+                 max_response_length: int = None, session_pool: SessionPool = None):
+        super().__init__(league_id=league_id, year=year, sport='nfl', espn_s2=espn_s2, swid=swid, debug=debug, concurrent_requests=concurrent_requests,
+                         max_response_length=max_response_length, session_pool=session_pool)
 
         if fetch_league:
             self.fetch_league()
@@ -35,38 +42,46 @@ class League(BaseLeague):
         self._fetch_league()
 
     def _fetch_league(self):
-        data = super()._fetch_league(SettingsClass=Settings)
+        (data, players, pro_schedule, draft) = self._fetch_league_payloads()
+        self._build_league(data, players, pro_schedule, draft)
+
+    def _build_league(self, data, players, pro_schedule, draft):
+        '''Builds the league from the league, pro players, pro schedule and draft payloads'''
+        super()._parse_league(data, SettingsClass=Settings)
 
         self.nfl_week = data['status']['latestScoringPeriod']
-        self._fetch_players()
-        self._fetch_teams(data)
-        super()._fetch_draft()
+        self._parse_players(players)
+        self._fetch_teams(data, pro_schedule=self._set_pro_schedule(pro_schedule).games)
+        super()._parse_draft(draft)
 
-    def _fetch_teams(self, data):
+    def _fetch_teams(self, data, pro_schedule = None):
         '''Fetch teams in league'''
-        pro_schedule = self._get_all_pro_schedule()
+        if pro_schedule is None:
+            pro_schedule = self._get_all_pro_schedule()
+        self._team_digests = team_digests(data)
         super()._fetch_teams(data, TeamClass=Team, pro_schedule=pro_schedule)
+        self._link_teams(self.teams)
 
-        # replace opponentIds in schedule with team instances
+    def _link_teams(self, new_teams: List[Team]):
+        '''Replaces the opponents in the teams schedules with the current team instances and
+        calculates the margins of victory of new_teams'''
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup == opponent.team_id:
-                        team.schedule[week] = opponent
+            team.schedule = [self._team_index.get(getattr(opponent, 'team_id', opponent), opponent) for opponent in team.schedule]
 
         # calculate margin of victory
-        for team in self.teams:
+        for team in new_teams:
             for week, opponent in enumerate(team.schedule):
                 mov = team.scores[week] - opponent.scores[week]
                 team.mov.append(mov)
 
+        self._standings_engine = None
+
     def _get_positional_ratings(self, week: int):
-        params = {
-            'view': 'mPositionalRatings',
-            'scoringPeriodId': week,
-        }
-        data = self.espn_request.league_get(params=params)
+        data = self.espn_request.get_positional_ratings(week)
+        return self._parse_positional_ratings(data)
+
+    def _parse_positional_ratings(self, data):
         ratings = data.get('positionAgainstOpponent', {}).get('positionalRatings', {})
 
         positional_ratings = {}
@@ -77,12 +92,64 @@ class League(BaseLeague):
             positional_ratings[pos] = teams_rating
         return positional_ratings
 
-    def refresh(self):
-        '''Gets latest league data. This can be used instead of creating a new League class each week'''
+    def refresh(self) -> RefreshSummary:
+        '''Gets latest league data. This can be used instead of creating a new League class each week.
+        Only the teams whose data changed are rebuilt, the others keep their objects. Returns what changed'''
         data = super()._fetch_league()
+        return self._refresh_teams(data, self.espn_request.get_pro_schedule())
 
+    def _refresh_teams(self, data, pro_schedule_data) -> RefreshSummary:
         self.nfl_week = data['status']['latestScoringPeriod']
-        self._fetch_teams(data)
+        # the shared pro data cache returns the same payload until it expires
+        pro_schedule_changed = self._pro_schedule is None or (pro_schedule_data is not self._pro_schedule_data and
+                                                              pro_schedule_data != self._pro_schedule_data)
+        if pro_schedule_changed:
+            self._set_pro_schedule(pro_schedule_data)
+        summary = self._update_teams(data, pro_schedule_changed)
+        if summary.teams or summary.removed_teams:
+            # cached box scores reference the replaced teams
+            self._box_score_cache = {}
+        return summary
+
+    def _update_teams(self, data, pro_schedule_changed: bool = False) -> RefreshSummary:
+        '''Rebuilds the teams whose payload changed since they were built, a team whose roster is the only change
+        keeps its object and a rebuilt team keeps its roster if it didn't change'''
+        (previous, self._team_digests) = (self._team_digests, team_digests(data))
+        pro_schedule = self._pro_schedule.games
+        members = data.get('members', [])
+        changes = {}
+        (teams, new_teams) = ([], [])
+        for team_data in data['teams']:
+            team_id = team_data['id']
+            team = self._team_index.get(team_id)
+            parts = changed_parts(previous.get(team_id) if team else None, self._team_digests[team_id])
+            if pro_schedule_changed and 'roster' not in parts:
+                parts.append('roster')
+            if parts:
+                changes[team_id] = parts
+            roster = team_data.get('roster', {})
+            owners = [member for member in members if member.get('id') in team_data.get('owners', [])]
+
+            if 'team' in parts or 'schedule' in parts:
+                rebuilt = Team(team_data, roster=roster if 'roster' in parts else {}, schedule=data['schedule'], year=data['seasonId'],
+                               owners=owners, pro_schedule=pro_schedule, player_identities=self._player_identities)
+                if 'roster' not in parts:
+                    rebuilt.roster = list(team.roster)
+                    rebuilt._roster_index = dict(team._roster_index)
+                team = rebuilt
+                new_teams.append(team)
+            else:
+                if 'roster' in parts:
+                    team._fetch_roster(roster, self.year, pro_schedule, self._player_identities)
+                if 'owners' in parts:
+                    team.owners = owners
+            teams.append(team)
+
+        removed_teams = [team_id for team_id in self._team_index if team_id not in self._team_digests]
+        self.teams = sorted(teams, key=lambda x: x.team_id)
+        self._index_teams()
+        self._link_teams(new_teams)
+        return RefreshSummary(changes, removed_teams, pro_schedule_changed)
 
     def refresh_draft(self, refresh_players=False, refresh__teams=False):
         super()._fetch_draft()
@@ -98,14 +165,19 @@ class League(BaseLeague):
             'scoringPeriodId': week
         }
         data = self.espn_request.league_get(params=params)
+        self._parse_roster_week(data)
 
+    def _parse_roster_week(self, data):
         team_roster = {}
         for team in data['teams']:
             team_roster[team['id']] = team['roster']
 
         for team in self.teams:
             roster = team_roster[team.team_id]
-            team._fetch_roster(roster, self.year)
+            team._fetch_roster(roster, self.year, player_identities=self._player_identities)
+        self._index_teams()
+        # the rosters no longer match the digests, the next refresh rebuilds them
+        self._team_digests = {team_id: digests[:1] + (None, ) + digests[2:] for (team_id, digests) in self._team_digests.items()}
 
     def standings(self) -> List[Team]:
         standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
@@ -114,8 +186,9 @@ class League(BaseLeague):
     def standings_weekly(self, week: int) -> List[Team]:
         """This is the main function to get the standings for a given week.
 
-        It controls the tiebreaker hierarchy and calls the recursive League()._sort_team_data_list function.
+        It controls the tiebreaker hierarchy and calls the recursive sort_team_data_list function.
         First, the division winners must be determined. Then, the rest of the teams are sorted.
+        Records, points and head to head results come from a StandingsEngine built once per fetch of the teams.
 
         The standard tiebreaker hierarchy is:
             1. Head-to-head record among the tied teams
@@ -134,82 +207,32 @@ class League(BaseLeague):
         if self.currentMatchupPeriod <= 1:
             return self.standings()
 
-        # Get standings data for each team up to the given week
-        list_of_team_data = []
-        for team in self.teams:
-            team_data = {
-                "team": team,
-                "team_id": team.team_id,
-                "division_id": team.division_id,
-                "wins": sum([1 for outcome in team.outcomes[:week] if outcome == "W"]),
-                "ties": sum([1 for outcome in team.outcomes[:week] if outcome == "T"]),
-                "losses": sum(
-                    [1 for outcome in team.outcomes[:week] if outcome == "L"]
-                ),
-                "points_for": sum(team.scores[:week]),
-                "points_against": sum(
-                    [team.schedule[w].scores[w] for w in range(week)]
-                ),
-                "schedule": team.schedule[:week],
-                "outcomes": team.outcomes[:week],
-            }
-            team_data["win_pct"] = (team_data["wins"] + team_data["ties"] / 2) / sum(
-                [1 for outcome in team.outcomes[:week] if outcome in ["W", "T", "L"]]
-            )
-            list_of_team_data.append(team_data)
-
-        # Identify the proper tiebreaker hierarchy
-        if self.settings.playoff_seed_tie_rule == "TOTAL_POINTS_SCORED":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        elif self.settings.playoff_seed_tie_rule == "H2H_RECORD":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        else:
-            raise ValueError(
-                "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED' or 'H2H_RECORD'"
-            )
-
-        # First assign the division winners
-        division_winners = []
-        for division_id in list(self.settings.division_map.keys()):
-            division_teams = [
-                team_data
-                for team_data in list_of_team_data
-                if team_data["division_id"] == division_id
-            ]
-            division_winner = sort_team_data_list(division_teams, tiebreaker_hierarchy)[
-                0
-            ]
-            division_winners.append(division_winner)
-            list_of_team_data.remove(division_winner)
-
-        # Sort the division winners
-        sorted_division_winners = sort_team_data_list(
-            division_winners, tiebreaker_hierarchy
-        )
-
-        # Then sort the rest of the teams
-        sorted_rest_of_field = sort_team_data_list(
-            list_of_team_data, tiebreaker_hierarchy
-        )
-
-        # Combine all teams
-        sorted_team_data = sorted_division_winners + sorted_rest_of_field
-
-        return [team_data["team"] for team_data in sorted_team_data]
+        return self._get_standings_engine().standings(week)
+
+    def standings_all_weeks(self, week: int = None) -> Dict[int, List[Team]]:
+        '''Returns the standings_weekly of every week up to week (the current week by default) keyed by week'''
+        if not week or week <= 0 or week > self.current_week:
+            week = self.current_week
+        if self.currentMatchupPeriod <= 1:
+            return {w: self.standings() for w in range(1, week + 1)}
+        engine = self._get_standings_engine()
+        return {w: engine.standings(w) for w in range(1, week + 1)}
+
+    def playoff_odds(self, simulations: int = 10000, seed: int = None, processes: int = None) -> List[PlayoffOdds]:
+        '''Simulates the rest of the regular season and returns each teams playoff, bye and seed chances,
+        most likely playoff team first. processes runs the simulations on a pool of processes'''
+        simulator = PlayoffSimulator(self.teams, self.settings.division_map, self.settings.playoff_seed_tie_rule,
+                                     self.settings.reg_season_count)
+        counts = simulator.simulate(simulations, seed=seed, processes=processes)
+        byes = bye_count(self.settings.playoff_team_count)
+        odds = [PlayoffOdds(team, counts[i], simulations, self.settings.playoff_team_count, byes) for (i, team) in enumerate(self.teams)]
+        return sorted(odds, key=lambda x: x.playoff_pct, reverse=True)
+
+    def _get_standings_engine(self) -> StandingsEngine:
+        '''Builds the StandingsEngine once per fetch of the teams'''
+        if self._standings_engine is None:
+            self._standings_engine = StandingsEngine(self.teams, self.settings.division_map, self.settings.playoff_seed_tie_rule)
+        return self._standings_engine
 
     def top_scorer(self) -> Team:
         most_pf = sorted(self.teams, key=lambda x: x.points_for, reverse=True)
@@ -245,20 +268,43 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178,180,179,239,181,244]
-        if msg_type in ACTIVITY_MAP:
-            msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
+        msg_types = self._get_activity_msg_types(msg_type)
 
-        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
-        activity = [Activity(topic, self.player_map, self.get_team_data, self.player_info) for topic in data]
+        data = self.espn_request.get_recent_activity(msg_types, size=size, offset=offset)
 
-        return activity
+        # Activity looks up players that aren't on the acting teams roster, request them all up front
+        player_ids = self._get_activity_player_ids(data)
+        if not player_ids:
+            return self._parse_activity(data, lambda playerId: None)
+        cards = [self.espn_request.get_player_card(chunk, self.finalScoringPeriod) for chunk in self._chunk_player_ids(player_ids)]
+        players = self._parse_player_cards(cards, self._get_all_pro_schedule())
+        return self._parse_activity(data, lambda playerId: players.get(playerId))
+
+    def _get_activity_msg_types(self, msg_type: str = None) -> List[int]:
+        if msg_type in ACTIVITY_MAP:
+            return [ACTIVITY_MAP[msg_type]]
+        return [178,180,179,239,181,244]
+
+    def _get_activity_player_ids(self, data) -> List[int]:
+        '''Returns the ids of players in the activity that aren't on the acting teams roster'''
+        player_ids = {}
+        for topic in data['topics']:
+            for msg in topic['messages']:
+                team = self.get_team_data(get_activity_team_id(msg))
+                if team is None or self.get_player_team(msg['targetId']) is not team:
+                    player_ids[msg['targetId']] = None
+        return list(player_ids)
+
+    def _chunk_player_ids(self, player_ids: List[int]) -> List[List[int]]:
+        size = self._player_card_batch_size
+        return [player_ids[i:i + size] for i in range(0, len(player_ids), size)]
+
+    def _parse_player_cards(self, cards, pro_schedule) -> Dict[int, Player]:
+        '''Returns the players of kona_playercard responses by id'''
+        return {player['id']: Player(player, self.year, pro_schedule, self._player_identities) for card in cards for player in card['players']}
+
+    def _parse_activity(self, data, player_info) -> List[Activity]:
+        return [Activity(topic, self.player_map, self.get_team_data, player_info) for topic in data['topics']]
 
     def scoreboard(self, week: int = None) -> List[Matchup]:
         '''Returns list of matchups for a given week'''
@@ -269,24 +315,46 @@ class League(BaseLeague):
             'view': 'mMatchupScore',
         }
         data = self.espn_request.league_get(params=params)
+        return self._parse_scoreboard(data, week)
 
+    def _parse_scoreboard(self, data, week: int) -> List[Matchup]:
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == week]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup._home_team_id == team.team_id:
-                    matchup.home_team = team
-                elif matchup._away_team_id == team.team_id:
-                    matchup.away_team = team
+        # a matchup without an away team is a bye
+        for matchup in matchups:
+            if matchup._home_team_id in self._team_index:
+                matchup.home_team = self._team_index[matchup._home_team_id]
+            if matchup._away_team_id in self._team_index:
+                matchup.away_team = self._team_index[matchup._away_team_id]
 
         return matchups
 
     def box_scores(self, week: int = None) -> List[BoxScore]:
         '''Returns list of box score for a given week\n
         Should only be used with most recent season'''
+        (data, parse_args) = self._get_box_score_data(week)
+        return self._parse_box_scores(data, *parse_args)
+
+    def _get_box_score_data(self, week: int = None) -> Tuple[dict, tuple]:
+        '''Requests the box scores, returns the response and the other _parse_box_scores arguments, the scoring period last'''
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
+        (matchup_period, scoring_period) = self._get_box_score_periods(week)
+
+        data = self.espn_request.get_box_scores(matchup_period, scoring_period)
+        pro_schedule = self._get_pro_schedule(scoring_period)
+        positional_rankings = self._get_positional_ratings(scoring_period)
+        return (data, (pro_schedule, positional_rankings, scoring_period))
+
+    def _period_box_scores(self, period: int, **kwargs) -> List[BoxScore]:
+        return self.box_scores(period, **kwargs)
+
+    def _current_box_score_period(self) -> int:
+        return self.current_week
+
+    def _get_box_score_periods(self, week: int = None) -> Tuple[int, int]:
+        '''Returns the matchup period and scoring period for a week'''
         matchup_period = self.currentMatchupPeriod
         scoring_period = self.current_week
         if week and week <= self.current_week:
@@ -295,50 +363,50 @@ class League(BaseLeague):
               if week in self.settings.matchup_periods[matchup_id]:
                 matchup_period = matchup_id
                 break
+        return (matchup_period, scoring_period)
 
-        params = {
-            'view': ['mMatchupScore', 'mScoreboard'],
-            'scoringPeriodId': scoring_period,
-        }
-
-        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_period]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(params=params, headers=headers)
-
+    def _parse_box_scores(self, data, pro_schedule, positional_rankings, scoring_period: int) -> List[BoxScore]:
         schedule = data['schedule']
-        pro_schedule = self._get_pro_schedule(scoring_period)
-        positional_rankings = self._get_positional_ratings(scoring_period)
-        box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
+        box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year, self._player_identities) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        self._map_matchup_teams(box_data)
         return box_data
 
+    def optimal_lineup(self, team_id: int, week: int = None, projected: bool = False) -> List[Tuple[str, BoxPlayer]]:
+        '''Returns the (slot, player) pairs of the teams highest scoring lineup for a week, the current week by default.
+        projected picks the lineup by projected points, a recommendation for the current week'''
+        return team_optimal_lineup(self.box_scores(week), team_id, self.settings.position_slot_counts, projected=projected)
+
+    def lineup_efficiency(self, start: int = 1, end: int = None) -> List[SeasonLineupEfficiency]:
+        '''Returns every teams actual against optimal lineup points from start to end (the current week by default),
+        the team that left the most points on the bench first'''
+        return season_lineup_efficiency(self.box_scores_range(start, end), self.settings.position_slot_counts)
+
+    def stats_store(self, players: List[Player] = None, projected: bool = False) -> StatsStore:
+        '''Returns the weekly stats of players, the rostered players by default, in a StatsStore. Needs NumPy'''
+        if players is None:
+            players = [player for team in self.teams for player in team.roster]
+        return StatsStore.from_players(players, lambda stat_id: PLAYER_STATS_MAP.get(int(stat_id), stat_id), projected=projected)
+
     def power_rankings(self, week: int=None):
         '''Return power rankings for any week'''
 
         if not week or week <= 0 or week > self.current_week:
             week = self.current_week
-        # calculate win for every week
-        win_matrix = []
         teams_sorted = sorted(self.teams, key=lambda x: x.team_id,
                               reverse=False)
-
-        for team in teams_sorted:
-            wins = [0]*len(teams_sorted)
-            for mov, opponent in zip(team.mov[:week], team.schedule[:week]):
-                opp = teams_sorted.index(opponent)
-                if mov > 0:
-                    wins[opp] += 1
-            win_matrix.append(wins)
-        dominance_matrix = two_step_dominance(win_matrix)
+        # calculate win for every week
+        dominance_matrix = two_step_dominance(win_matrix(teams_sorted, week))
         power_rank = power_points(dominance_matrix, teams_sorted, week)
         return power_rank
 
+    def power_rankings_all_weeks(self, week: int = None) -> Dict[int, List[Tuple[str, Team]]]:
+        '''Returns the power rankings of every week up to week (the current week by default) keyed by week'''
+        if not week or week <= 0 or week > self.current_week:
+            week = self.current_week
+        teams_sorted = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
+        return dict(enumerate(power_points_all_weeks(teams_sorted, week), start=1))
+
     def free_agents(self, week: int=None, size: int=50, position: str=None, position_id: int=None) -> List[Player]:
         '''Returns a List of Free Agents for a Given Week\n
         Should only be used with most recent season'''
@@ -348,49 +416,40 @@ class League(BaseLeague):
         if not week:
             week = self.current_week
 
-        slot_filter = []
-        if position and position in POSITION_MAP:
-            slot_filter = [POSITION_MAP[position]]
-        if position_id:
-            slot_filter.append(position_id)
-
-
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
+        slot_filter = self._get_slot_filter(POSITION_MAP, position, position_id)
+        data = self.espn_request.get_free_agents(week, size=size, slot_filter=slot_filter)
 
-        players = data['players']
         pro_schedule = self._get_pro_schedule(week)
         positional_rankings = self._get_positional_ratings(week)
+        return self._parse_free_agents(data, pro_schedule, positional_rankings, week)
 
-        return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year) for player in players]
+    def _parse_free_agents(self, data, pro_schedule, positional_rankings, week: int) -> List[BoxPlayer]:
+        players = data['players']
+        return [BoxPlayer(player, pro_schedule, positional_rankings, week, self.year, self._player_identities) for player in players]
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None) -> Union[Player, List[Player]]:
         ''' Returns Player class if name found '''
 
-        if name:
-            playerId = self.player_map.get(name)
-        if playerId is None or isinstance(playerId, str):
+        playerIds = self._get_player_ids(name, playerId)
+        if playerIds is None:
             return None
-        if not isinstance(playerId, list):
-            playerId = [playerId]
 
-        data = self.espn_request.get_player_card(playerId, self.finalScoringPeriod)
+        data = self.espn_request.get_player_card(playerIds, self.finalScoringPeriod)
         pro_schedule = self._get_all_pro_schedule()
+        return self._parse_player_info(data, pro_schedule)
+
+    def _parse_player_info(self, data, pro_schedule) -> Union[Player, List[Player]]:
         if len(data['players']) == 1:
-            return Player(data['players'][0], self.year, pro_schedule)
+            return Player(data['players'][0], self.year, pro_schedule, self._player_identities)
         if len(data['players']) > 1:
-            return [Player(player, self.year, pro_schedule) for player in data['players']]
+            return [Player(player, self.year, pro_schedule, self._player_identities) for player in data['players']]
 
     def message_board(self, msg_types: List[str] = None):
         ''' Returns a list of league messages'''
         data = self.espn_request.get_league_message_board(msg_types)
+        return self._parse_message_board(data)
 
+    def _parse_message_board(self, data) -> List:
         msg_topics = list(data.get('topicsByType', {}).keys())
         messages = []
         for topic in msg_topics:
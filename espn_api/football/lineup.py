@@ -0,0 +1,148 @@
+from typing import Dict, List, Tuple
+
+# slots that don't score
+BENCH_SLOTS = ('BE', 'IR')
+# cost of putting a player in a slot they can't play, larger than any points difference
+INELIGIBLE = 1e9
+# cost of leaving a slot empty, below the 0.01 points are rounded to so a player with no points still starts
+EMPTY_SLOT = 0.001
+
+
+def starting_slots(slot_counts: Dict[str, int]) -> List[str]:
+    '''Returns one entry per starting slot of the leagues lineup, flex slots included'''
+    slots = []
+    for (slot, count) in slot_counts.items():
+        if slot not in BENCH_SLOTS:
+            slots += [slot] * count
+    return slots
+
+
+def assignment(cost: List[List[float]]) -> List[int]:
+    '''Hungarian algorithm, returns the column of each row that minimizes the total cost.
+    The matrix can't have more rows than columns'''
+    (n, m) = (len(cost), len(cost[0]) if cost else 0)
+    # potentials of rows and columns, row assigned to each column, 1 indexed with 0 as the free row
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    rows = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        rows[0] = i
+        j0 = 0
+        min_slack = [float('inf')] * (m + 1)
+        used = [False] * (m + 1)
+        while rows[j0] != 0:
+            used[j0] = True
+            i0 = rows[j0]
+            row = cost[i0 - 1]
+            delta = float('inf')
+            j1 = 0
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                slack = row[j - 1] - u[i0] - v[j]
+                if slack < min_slack[j]:
+                    min_slack[j] = slack
+                    way[j] = j0
+                if min_slack[j] < delta:
+                    delta = min_slack[j]
+                    j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[rows[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            j0 = j1
+        # flip the augmenting path
+        while j0 != 0:
+            j1 = way[j0]
+            rows[j0] = rows[j1]
+            j0 = j1
+
+    columns = [0] * n
+    for j in range(1, m + 1):
+        if rows[j] != 0:
+            columns[rows[j] - 1] = j - 1
+    return columns
+
+
+def optimal_lineup(lineup: List, slot_counts: Dict[str, int], projected: bool = False) -> List[Tuple[str, object]]:
+    '''Returns the (slot, player) pairs of the lineup that scores the most points, a slot without
+    an eligible player is left out. Flex slots are filled by matching players to slots, not by trying every lineup.
+    projected uses the players projected points to recommend a lineup'''
+    slots = starting_slots(slot_counts)
+    if not slots:
+        return []
+    points = [player.projected_points if projected else player.points for player in lineup]
+
+    # every slot can also stay empty
+    cost = []
+    for (s, slot) in enumerate(slots):
+        row = [-points[p] if slot in player.eligibleSlots else INELIGIBLE for (p, player) in enumerate(lineup)]
+        row += [EMPTY_SLOT if e == s else INELIGIBLE for e in range(len(slots))]
+        cost.append(row)
+
+    return [(slot, lineup[p]) for (slot, p) in zip(slots, assignment(cost)) if p < len(lineup)]
+
+
+def lineup_points(lineup: List[Tuple[str, object]], projected: bool = False) -> float:
+    return round(sum(player.projected_points if projected else player.points for (slot, player) in lineup), 2)
+
+
+class LineupEfficiency(object):
+    '''A teams starting lineup against its optimal lineup for one week'''
+    def __init__(self, team, week: int, lineup: List, slot_counts: Dict[str, int]):
+        self.team = team
+        self.week = week
+        self.actual_points = round(sum(player.points for player in lineup if player.slot_position not in BENCH_SLOTS), 2)
+        self.optimal_lineup = optimal_lineup(lineup, slot_counts)
+        self.optimal_points = lineup_points(self.optimal_lineup)
+        self.points_left_on_bench = round(self.optimal_points - self.actual_points, 2)
+        self.efficiency = self.actual_points / self.optimal_points if self.optimal_points > 0 else 1.0
+
+    def __repr__(self):
+        return f'LineupEfficiency({self.team}, week {self.week}, {self.actual_points} of {self.optimal_points})'
+
+
+class SeasonLineupEfficiency(object):
+    '''A teams lineup efficiency added up over a range of weeks'''
+    def __init__(self, team, weeks: List[LineupEfficiency]):
+        self.team = team
+        self.weeks = weeks
+        self.actual_points = round(sum(week.actual_points for week in weeks), 2)
+        self.optimal_points = round(sum(week.optimal_points for week in weeks), 2)
+        self.points_left_on_bench = round(self.optimal_points - self.actual_points, 2)
+        self.efficiency = self.actual_points / self.optimal_points if self.optimal_points > 0 else 1.0
+
+    def __repr__(self):
+        return f'SeasonLineupEfficiency({self.team}, {self.points_left_on_bench} left on bench)'
+
+
+def box_score_lineups(box_scores: List) -> List[Tuple[object, List]]:
+    '''Returns the (team, lineup) of both sides of every box score, a bye has no team'''
+    lineups = []
+    for box_score in box_scores:
+        for (team, lineup) in ((box_score.home_team, box_score.home_lineup), (box_score.away_team, box_score.away_lineup)):
+            if team:
+                lineups.append((team, lineup))
+    return lineups
+
+
+def season_lineup_efficiency(box_scores: Dict[int, List], slot_counts: Dict[str, int]) -> List[SeasonLineupEfficiency]:
+    '''Returns every teams lineup efficiency over the box scores of each week keyed by week,
+    most points left on the bench first'''
+    weeks = {}
+    for (week, week_box_scores) in sorted(box_scores.items()):
+        for (team, lineup) in box_score_lineups(week_box_scores):
+            weeks.setdefault(team, []).append(LineupEfficiency(team, week, lineup, slot_counts))
+    season = [SeasonLineupEfficiency(team, team_weeks) for (team, team_weeks) in weeks.items()]
+    return sorted(season, key=lambda x: x.points_left_on_bench, reverse=True)
+
+
+def team_optimal_lineup(box_scores: List, team_id: int, slot_counts: Dict[str, int], projected: bool = False) -> List[Tuple[str, object]]:
+    '''optimal_lineup of the team with team_id in a weeks box scores, None if the team has no box score'''
+    for (team, lineup) in box_score_lineups(box_scores):
+        if getattr(team, 'team_id', team) == team_id:
+            return optimal_lineup(lineup, slot_counts, projected=projected)
+    return None
@@ -1,70 +1,145 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
-from .utils import json_parsing
+from ..utils.utils import get_player_identity, json_parsing_keys
 from datetime import datetime
+from functools import cached_property
 
-class Player(object):
-    '''Player are part of team'''
-    def __init__(self, data, year, pro_team_schedule = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.posRank = json_parsing(data, 'positionalRanking')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.onTeamId = json_parsing(data, 'onTeamId')
-        self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.stats = {}
-        self.schedule = {}
+# pro team schedules shared by the players of a pro team, keyed by the id of the pro teams games.
+# The games are kept in the entry so their id can't be reused while it is cached
+_pro_team_schedules = {}
+_PRO_TEAM_SCHEDULES_SIZE = 256
+
+
+def get_pro_team_schedule(pro_team_id: int, pro_games: dict) -> dict:
+    '''Returns the pro teams opponent and game date keyed by scoring period, every player of the pro team shares the dict'''
+    cached = _pro_team_schedules.get(id(pro_games))
+    if cached is not None and cached[0] is pro_games:
+        return cached[1]
+
+    schedule = {}
+    for key in pro_games:
+        game = pro_games[key][0]
+        team = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
+        schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
 
-        # Get players main position
-        for pos in json_parsing(data, 'eligibleSlots'):
+    if len(_pro_team_schedules) >= _PRO_TEAM_SCHEDULES_SIZE:
+        _pro_team_schedules.clear()
+    _pro_team_schedules[id(pro_games)] = (pro_games, schedule)
+    return schedule
+
+def build_stats(stat_splits: list, breakdowns: bool = True) -> dict:
+    '''Returns the points, averages and stats breakdowns of each scoring period, actual and projected,
+    from (scoring period, stat source, points, average points, raw breakdown) splits. Without breakdowns they are None'''
+    stats = {}
+    for (scoring_period, stat_source, points, avg_points, stats_breakdown) in stat_splits:
+        breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in stats_breakdown.items()} if breakdowns else None
+        points = round(points, 2)
+        avg_points = round(avg_points, 2)
+        (points_type, breakdown_type, avg_type) = ('points', 'breakdown', 'avg_points') if stat_source == 0 else ('projected_points', 'projected_breakdown', 'projected_avg_points')
+        if stats.get(scoring_period):
+            stats[scoring_period][points_type] = points
+            stats[scoring_period][breakdown_type] = breakdown
+            stats[scoring_period][avg_type] = avg_points
+        else:
+            stats[scoring_period] = {points_type: points, breakdown_type: breakdown, avg_type: avg_points}
+    return stats
+
+class PlayerIdentity(object):
+    '''The fields of a player that are the same in every view of the league, shared by the Players built from them'''
+    __slots__ = ('name', 'playerId', 'eligibleSlots', 'proTeam', 'position', '_pro_team_id', '_slot_ids')
+
+    def __init__(self, player: dict):
+        self.name = player['fullName']
+        self.playerId = player['id']
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in player['eligibleSlots']]
+        self.proTeam = PRO_TEAM_MAP[player['proTeamId']]
+        self._pro_team_id = player['proTeamId']
+        self._slot_ids = player['eligibleSlots']
+
+        # Get players main position, None if they have none
+        self.position = None
+        for pos in player['eligibleSlots']:
             if (pos != 25 and '/' not in POSITION_MAP[pos]) or '/' in self.name:
                 self.position = POSITION_MAP[pos]
                 break
 
-        if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
-            pro_team = pro_team_schedule.get(pro_team_id, {})
-            for key in pro_team:
-                game = pro_team[key][0]
-                team = game['awayProTeamId'] if game['awayProTeamId'] != pro_team_id else game['homeProTeamId']
-                self.schedule[key] = { 'team': PRO_TEAM_MAP[team], 'date': datetime.fromtimestamp(game['date']/1000.0) }
+    def matches(self, player: dict) -> bool:
+        '''False once the player moved to another pro team or their eligible slots changed'''
+        return self._pro_team_id == player['proTeamId'] and self._slot_ids == player['eligibleSlots']
 
-        # set each scoring period stat
+class Player(object):
+    '''Player are part of team, stats and schedule are built on first access. Players of a league share their PlayerIdentity fields'''
+    # __dict__ holds the cached properties
+    __slots__ = ('name', 'playerId', 'posRank', 'eligibleSlots', 'acquisitionType', 'proTeam', 'injuryStatus',
+                 'onTeamId', 'lineupSlot', 'injured', 'percent_owned', 'percent_started', 'active_status', 'total_points',
+                 'projected_total_points', 'avg_points', 'projected_avg_points', 'position', '_pro_team_id', '_pro_games',
+                 '_stat_splits', '__dict__')
+
+    def __init__(self, data, year, pro_team_schedule = None, player_identities: dict = None):
         player = data['playerPoolEntry']['player'] if 'playerPoolEntry' in data else data['player']
-        self.injuryStatus = player.get('injuryStatus', self.injuryStatus)
+        identity = get_player_identity(player, player_identities, PlayerIdentity)
+        self.name = identity.name
+        self.playerId = identity.playerId
+        self.eligibleSlots = identity.eligibleSlots
+        self.proTeam = identity.proTeam
+        if identity.position is not None:
+            self.position = identity.position
+
+        # the stats and rankings are most of the players json and hold none of the fields
+        fields = json_parsing_keys(data, ['positionalRanking', 'acquisitionType', 'injuryStatus', 'onTeamId'], skip=('stats', 'rankings'))
+        self.posRank = fields['positionalRanking']
+        self.acquisitionType = fields['acquisitionType']
+        self.onTeamId = fields['onTeamId']
+        self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
+        self._pro_team_id = identity._pro_team_id
+        self._pro_games = pro_team_schedule.get(identity._pro_team_id) if pro_team_schedule else None
+
+        self.injuryStatus = player.get('injuryStatus', fields['injuryStatus'])
         self.injured = player.get('injured', False)
         self.percent_owned = round(player.get('ownership', {}).get('percentOwned', -1), 2)
         self.percent_started = round(player.get('ownership', {}).get('percentStarted', -1), 2)
 
+        # the scoring period stats of the season, their breakdowns are mapped when stats are read
         self.active_status = 'bye'
-        player_stats = player.get('stats', [])
-        for stats in player_stats:
+        splits = {}
+        for stats in player.get('stats', []):
             if stats.get('seasonId') != year or stats.get('statSplitTypeId') == 2:
                 continue
             stats_breakdown = stats.get('stats') or stats.get('appliedStats', {})
-            breakdown = {PLAYER_STATS_MAP.get(int(k), k):v for (k,v) in stats_breakdown.items()}
-            points = round(stats.get('appliedTotal', 0), 2)
-            avg_points =  round(stats.get('appliedAverage', 0), 2)
-            scoring_period = stats.get('scoringPeriodId')
             stat_source = stats.get('statSourceId')
-            (points_type, breakdown_type, avg_type) = ('points', 'breakdown', 'avg_points') if stat_source == 0 else ('projected_points', 'projected_breakdown', 'projected_avg_points')
-            if self.stats.get(scoring_period):
-                self.stats[scoring_period][points_type] = points
-                self.stats[scoring_period][breakdown_type] = breakdown
-                self.stats[scoring_period][avg_type] = avg_points
-            else:
-                self.stats[scoring_period] = {points_type: points, breakdown_type: breakdown, avg_type: avg_points}
+            # a later split replaces the actual or projected stats of the scoring period
+            splits[(stats.get('scoringPeriodId'), stat_source == 0)] = (stats.get('scoringPeriodId'), stat_source, stats.get('appliedTotal', 0),
+                                                                         stats.get('appliedAverage', 0), stats_breakdown)
             if not stat_source:
-                if not self.stats[scoring_period][breakdown_type]:
-                    self.active_status = 'inactive'
-                else:
-                    self.active_status = 'active'
-        self.total_points = self.stats.get(0, {}).get('points', 0)
-        self.projected_total_points = self.stats.get(0, {}).get('projected_points', 0)
-        self.avg_points = self.stats.get(0, {}).get('avg_points', 0)
-        self.projected_avg_points = self.stats.get(0, {}).get('projected_avg_points', 0)
+                self.active_status = 'active' if stats_breakdown else 'inactive'
+        self._stat_splits = list(splits.values())
+
+        season = self.scoring_period_stats(0, breakdowns=False)
+        self.total_points = season.get('points', 0)
+        self.projected_total_points = season.get('projected_points', 0)
+        self.avg_points = season.get('avg_points', 0)
+        self.projected_avg_points = season.get('projected_avg_points', 0)
 
     def __repr__(self):
         return f'Player({self.name})'
+
+    @cached_property
+    def stats(self):
+        return build_stats(self._stat_splits)
+
+    @cached_property
+    def schedule(self):
+        if self._pro_games is None:
+            return {}
+        return get_pro_team_schedule(self._pro_team_id, self._pro_games)
+
+    def scoring_period_stats(self, scoring_period: int, breakdowns: bool = True) -> dict:
+        '''Returns stats[scoring_period] without building the stats of the other scoring periods'''
+        if 'stats' in self.__dict__:
+            return self.stats.get(scoring_period, {})
+        splits = [split for split in self._stat_splits if split[0] == scoring_period]
+        return build_stats(splits, breakdowns).get(scoring_period, {})
+
+    def _stats_store_rows(self, projected: bool = False) -> list:
+        '''Returns the (scoring period, points, raw stats) of each week, actual or projected'''
+        return [(scoring_period, round(points, 2), stats_breakdown) for (scoring_period, stat_source, points, avg_points, stats_breakdown) in self._stat_splits
+                if scoring_period != 0 and (stat_source == 0) != projected]
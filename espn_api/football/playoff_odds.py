@@ -0,0 +1,345 @@
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List
+
+from .standings import sort_by_head_to_head_matrix, sort_standings, tiebreaker_hierarchy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def bye_count(playoff_team_count: int) -> int:
+    '''Teams that skip the first playoff round, the bracket is filled up to a power of two'''
+    if playoff_team_count < 2:
+        return 0
+    return (1 << (playoff_team_count - 1).bit_length()) - playoff_team_count
+
+
+class PlayoffOdds(object):
+    '''A teams chances of finishing the regular season at each playoff seed, in percent'''
+    def __init__(self, team, seed_counts: List[int], simulations: int, playoff_team_count: int, byes: int):
+        self.team = team
+        self.seed_pct = [count / simulations * 100 for count in seed_counts]
+        self.playoff_pct = sum(self.seed_pct[:playoff_team_count])
+        self.bye_pct = sum(self.seed_pct[:byes])
+
+    def __repr__(self):
+        return f'PlayoffOdds({self.team}, {self.playoff_pct:.1f})'
+
+
+class SeasonRecord(object):
+    '''Records, points, division records and head to head results of every team'''
+    def __init__(self, division_ids: List):
+        n = len(division_ids)
+        self.division_ids = division_ids
+        self.wins = [0] * n
+        self.ties = [0] * n
+        self.losses = [0] * n
+        self.points_for = [0] * n
+        self.points_against = [0] * n
+        self.division_wins = [0] * n
+        self.division_games = [0] * n
+        self.h2h_wins = [[0] * n for division_id in division_ids]
+        self.h2h_games = [[0] * n for division_id in division_ids]
+
+    @classmethod
+    def from_totals(cls, division_ids: List, **totals) -> 'SeasonRecord':
+        '''A record with totals like wins=[...] already added up'''
+        record = cls(division_ids)
+        for (name, value) in totals.items():
+            setattr(record, name, value)
+        return record
+
+    def copy(self) -> 'SeasonRecord':
+        record = SeasonRecord(self.division_ids)
+        for name in ('wins', 'ties', 'losses', 'points_for', 'points_against', 'division_wins', 'division_games'):
+            setattr(record, name, list(getattr(self, name)))
+        record.h2h_wins = [list(row) for row in self.h2h_wins]
+        record.h2h_games = [list(row) for row in self.h2h_games]
+        return record
+
+    def add(self, i: int, j: int, outcome: str, score: float, opponent_score: float):
+        '''Adds team i's side of a game against team j'''
+        result = {'W': 1, 'T': 0.5, 'L': 0}[outcome]
+        self.wins[i] += outcome == 'W'
+        self.ties[i] += outcome == 'T'
+        self.losses[i] += outcome == 'L'
+        self.points_for[i] += score
+        self.points_against[i] += opponent_score
+        self.h2h_wins[i][j] += result
+        self.h2h_games[i][j] += 1
+        if self.division_ids[i] == self.division_ids[j]:
+            self.division_wins[i] += result
+            self.division_games[i] += 1
+
+    def team_data(self) -> List[Dict]:
+        '''Returns standings data for the tiebreakers, teams are identified by their row'''
+        list_of_team_data = []
+        for (i, division_id) in enumerate(self.division_ids):
+            team_data = {
+                'team_id': i,
+                'division_id': division_id,
+                'points_for': self.points_for[i],
+                'points_against': self.points_against[i],
+                'division_record': self.division_wins[i] / max(self.division_games[i], 1),
+            }
+            games = self.wins[i] + self.ties[i] + self.losses[i]
+            team_data['win_pct'] = (self.wins[i] + self.ties[i] / 2) / max(games, 1)
+            list_of_team_data.append(team_data)
+        return list_of_team_data
+
+
+class PlayoffSimulator(object):
+    '''Monte Carlo simulation of the rest of the regular season. Every remaining game is sampled from
+    normal distributions of both teams scores so far and the league is seeded with its playoff_seed_tie_rule tiebreakers'''
+    def __init__(self, teams: List, division_map: Dict, playoff_seed_tie_rule: str, reg_season_count: int):
+        # only plain numbers are kept so the simulator is cheap to send to other processes
+        self.team_ids = [team.team_id for team in teams]
+        self.division_ids = [team.division_id for team in teams]
+        self.playoff_seed_tie_rule = playoff_seed_tie_rule
+        self._index = {team_id: i for (i, team_id) in enumerate(self.team_ids)}
+        # raises a ValueError for an unknown playoff_seed_tie_rule
+        tiebreaker_hierarchy(playoff_seed_tie_rule, None)
+
+        self.record = SeasonRecord(self.division_ids)
+        # remaining regular season games as (team, opponent) rows
+        self.games = []
+        scores = [[] for team in teams]
+        for (i, team) in enumerate(teams):
+            for week in range(min(reg_season_count, len(team.schedule), len(team.outcomes))):
+                opponent = team.schedule[week]
+                j = self._index.get(getattr(opponent, 'team_id', opponent))
+                if j is None or j == i:
+                    continue
+                if team.outcomes[week] in ('W', 'T', 'L'):
+                    self.record.add(i, j, team.outcomes[week], team.scores[week], opponent.scores[week])
+                    scores[i].append(team.scores[week])
+                elif i < j:
+                    self.games.append((i, j))
+        # a division without teams has no winner
+        self.divisions = [division_id for division_id in division_map if division_id in self.division_ids]
+        (self.means, self.stds) = self._score_distributions(scores)
+
+    @staticmethod
+    def _score_distributions(scores: List[List[float]]):
+        '''Mean and standard deviation of each teams scores, the whole league stands in for teams with too few games'''
+        league_scores = [score for team_scores in scores for score in team_scores]
+        league_mean = statistics.mean(league_scores) if league_scores else 0
+        league_std = statistics.stdev(league_scores) if len(league_scores) > 1 else 1
+        means = [statistics.mean(team_scores) if team_scores else league_mean for team_scores in scores]
+        stds = [statistics.stdev(team_scores) if len(team_scores) > 1 else league_std for team_scores in scores]
+        return (means, stds)
+
+    def simulate(self, simulations: int = 10000, seed: int = None, processes: int = None) -> List[List[int]]:
+        '''Returns how often each team finished at each seed, counts[team][seed - 1].
+        processes splits the simulations over a pool of processes'''
+        if not processes or processes < 2 or simulations < processes:
+            return self._simulate(simulations, seed)
+
+        sizes = [simulations // processes + (k < simulations % processes) for k in range(processes)]
+        seeds = [None if seed is None else seed + k for k in range(processes)]
+        counts = [[0] * len(self.team_ids) for team_id in self.team_ids]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for chunk_counts in executor.map(self._simulate, sizes, seeds):
+                for (row, chunk_row) in zip(counts, chunk_counts):
+                    for (seed_index, count) in enumerate(chunk_row):
+                        row[seed_index] += count
+        return counts
+
+    def _simulate(self, simulations: int, seed: int = None) -> List[List[int]]:
+        counts = [[0] * len(self.team_ids) for team_id in self.team_ids]
+        if np is not None:
+            self._simulate_numpy(simulations, seed, counts)
+        else:
+            rng = random.Random(seed)
+            for _ in range(simulations):
+                results = []
+                for (i, j) in self.games:
+                    results.append((rng.gauss(self.means[i], self.stds[i]), rng.gauss(self.means[j], self.stds[j])))
+                for (seed_index, i) in enumerate(self.seed_order(results, rng)):
+                    counts[i][seed_index] += 1
+        return counts
+
+    def sample_scores(self, simulations: int, seed: int = None):
+        '''Returns numpy arrays of the team and opponent scores of game g in simulation k at [k, g]'''
+        rng = np.random.default_rng(seed)
+        games = np.array(self.games, dtype=int).reshape(-1, 2)
+        (means, stds) = (np.array(self.means), np.array(self.stds))
+        team_scores = rng.normal(means[games[:, 0]], stds[games[:, 0]], (simulations, len(games)))
+        opponent_scores = rng.normal(means[games[:, 1]], stds[games[:, 1]], (simulations, len(games)))
+        return (team_scores, opponent_scores)
+
+    def _simulate_numpy(self, simulations: int, seed: int, counts: List[List[int]]):
+        '''Samples every game of every simulation at once and seeds them with vectorized sorts,
+        simulations with ties past head to head and points for go through the full tiebreakers'''
+        games = np.array(self.games, dtype=int).reshape(-1, 2)
+        n = len(self.team_ids)
+        (team_scores, opponent_scores) = self.sample_scores(simulations, seed)
+
+        # one hot rows mapping each game to its team and opponent, adding up is a matrix product
+        (team_games, opponent_games) = (self._one_hot(games[:, 0], n), self._one_hot(games[:, 1], n))
+
+        def add(base, team_values, opponent_values):
+            return np.array(base, dtype=float) + team_values @ team_games + opponent_values @ opponent_games
+
+        won = (team_scores > opponent_scores).astype(float)
+        lost = (team_scores < opponent_scores).astype(float)
+        tied = 1 - won - lost
+        wins = add(self.record.wins, won, lost)
+        ties = add(self.record.ties, tied, tied)
+        losses = add(self.record.losses, lost, won)
+        points_for = add(self.record.points_for, team_scores, opponent_scores)
+        win_pct = (wins + ties / 2) / np.maximum(wins + ties + losses, 1)
+
+        results = won + tied / 2
+        h2h_games = self._h2h_games()
+        seeds = np.empty((simulations, n), dtype=int)
+        exact = np.zeros(simulations, dtype=bool)
+        for start in range(0, simulations, self._block_size()):
+            rows = slice(start, start + self._block_size())
+            h2h_wins = self._h2h_wins(results[rows]) if self.playoff_seed_tie_rule == 'H2H_RECORD' else None
+            (seeds[rows], exact[rows]) = self._seed_block(win_pct[rows], points_for[rows], h2h_wins, h2h_games)
+
+        fast = seeds[~exact]
+        for seed_index in range(n):
+            for (i, count) in enumerate(np.bincount(fast[:, seed_index], minlength=n)):
+                counts[i][seed_index] += int(count)
+
+        exact_rows = np.flatnonzero(exact)
+        if len(exact_rows):
+            totals = {
+                'wins': wins[exact_rows], 'ties': ties[exact_rows], 'losses': losses[exact_rows],
+                'points_for': points_for[exact_rows],
+                'points_against': add(self.record.points_against, opponent_scores, team_scores)[exact_rows],
+            }
+            self._seed_exact(totals, results[exact_rows], h2h_games, random.Random(seed), counts)
+
+    def _block_size(self) -> int:
+        # head to head results are n x n per simulation so they are handled a block of simulations at a time
+        return max(1, 2 ** 21 // max(len(self.team_ids) ** 2, 1))
+
+    def _h2h_games(self):
+        '''Games between every pair of teams at the end of the regular season, the same in every simulation'''
+        games = np.array(self.games, dtype=int).reshape(-1, 2)
+        h2h_games = np.array(self.record.h2h_games)
+        np.add.at(h2h_games, (games[:, 0], games[:, 1]), 1)
+        np.add.at(h2h_games, (games[:, 1], games[:, 0]), 1)
+        return h2h_games
+
+    def _h2h_wins(self, results):
+        '''Head to head wins of every pair of teams in each simulation, results holds the team side of each game'''
+        n = len(self.team_ids)
+        games = np.array(self.games, dtype=int).reshape(-1, 2)
+        team_pairs = self._one_hot(games[:, 0] * n + games[:, 1], n * n)
+        opponent_pairs = self._one_hot(games[:, 1] * n + games[:, 0], n * n)
+        h2h_wins = np.array(self.record.h2h_wins, dtype=float).ravel() + results @ team_pairs + (1 - results) @ opponent_pairs
+        return h2h_wins.reshape(len(results), n, n)
+
+    @staticmethod
+    def _one_hot(columns, width: int):
+        one_hot = np.zeros((len(columns), width))
+        one_hot[np.arange(len(columns)), columns] = 1
+        return one_hot
+
+    def _seed_block(self, win_pct, points_for, h2h_wins, h2h_games):
+        '''Seeds a block of simulations like sort_standings, sorting every subset of teams on win percentage,
+        head to head wins within the tied teams (H2H_RECORD only) and points for.
+        Returns the seeds and which simulations have a tie past those keys and need the full tiebreakers'''
+        (simulations, n) = win_pct.shape
+        rows = np.arange(simulations)
+        exact = np.zeros(simulations, dtype=bool)
+
+        def subset_order(members):
+            h2h = np.zeros_like(win_pct) if h2h_wins is None else self._h2h_key(members, win_pct, h2h_wins, h2h_games)
+            # members of the subset sort first
+            order = np.lexsort((-points_for, -h2h, -win_pct, ~members))
+            tied = np.take_along_axis(members, order, axis=1)
+            tied = tied[:, 1:] & tied[:, :-1]
+            for key in (win_pct, h2h, points_for):
+                sorted_key = np.take_along_axis(key, order, axis=1)
+                tied &= sorted_key[:, 1:] == sorted_key[:, :-1]
+            exact[tied.any(axis=1)] = True
+            return order
+
+        # division winners are the first team of each division, then the winners and the rest are sorted
+        winners = np.zeros((simulations, n), dtype=bool)
+        division_ids = np.array(self.division_ids, dtype=object)
+        for division_id in self.divisions:
+            members = np.broadcast_to(division_ids == division_id, (simulations, n))
+            winners[rows, subset_order(members)[:, 0]] = True
+        division_count = len(self.divisions)
+        seeds = np.concatenate([subset_order(winners)[:, :division_count], subset_order(~winners)[:, :n - division_count]], axis=1)
+        return (seeds, exact)
+
+    @staticmethod
+    def _h2h_key(members, win_pct, h2h_wins, h2h_games):
+        '''Each teams head to head wins against the teams of the subset it is tied with on win percentage,
+        the way sort_by_head_to_head_matrix counts them'''
+        n = win_pct.shape[1]
+        others = ~np.eye(n, dtype=bool)
+        group = members[:, :, None] & members[:, None, :] & (win_pct[:, :, None] == win_pct[:, None, :])
+        size = group.sum(axis=2)
+        h2h = (h2h_wins * (group & others)).sum(axis=2)
+
+        # more than two tied teams only count if every pair played each other equally often
+        group = group.astype(float)
+        counts_played = 0
+        for games in np.unique(h2h_games[others]):
+            pairs = ((group @ ((h2h_games == games) & others).astype(float)) * group).sum(axis=2)
+            counts_played = counts_played + (pairs > 0)
+        valid = (size == 2) | ((size > 2) & (counts_played == 1))
+        return np.where(valid, h2h, 0)
+
+    def _seed_exact(self, totals: Dict, results, h2h_games, rng: random.Random, counts: List[List[int]]):
+        '''Seeds simulations through the full tiebreakers, totals holds numpy arrays of each simulations wins, ties,
+        losses and points and results the team side of each game'''
+        games = np.array(self.games, dtype=int).reshape(-1, 2)
+        # every remaining game is played, only the wins depend on the simulation
+        same_division = np.array([self.division_ids[i] == self.division_ids[j] for (i, j) in self.games], dtype=bool)
+        division_games = np.array(self.record.division_games)
+        np.add.at(division_games, games[same_division].ravel(), 1)
+        division_games = division_games.tolist()
+        h2h_games = h2h_games.tolist()
+
+        division_wins = np.tile(np.array(self.record.division_wins, dtype=float), (len(results), 1))
+        np.add.at(division_wins.T, games[same_division, 0], results[:, same_division].T)
+        np.add.at(division_wins.T, games[same_division, 1], 1 - results[:, same_division].T)
+        totals = {name: value.tolist() for (name, value) in totals.items()}
+        division_wins = division_wins.tolist()
+
+        for start in range(0, len(results), self._block_size()):
+            h2h_wins = self._h2h_wins(results[start:start + self._block_size()])
+            for (k, simulation_h2h_wins) in enumerate(h2h_wins.tolist(), start=start):
+                record = SeasonRecord.from_totals(
+                    self.division_ids, division_wins=division_wins[k], division_games=division_games,
+                    h2h_wins=simulation_h2h_wins, h2h_games=h2h_games,
+                    **{name: value[k] for (name, value) in totals.items()})
+                for (seed_index, i) in enumerate(self._seed_record(record, rng)):
+                    counts[i][seed_index] += 1
+
+    def seed_order(self, results: List, rng: random.Random) -> List[int]:
+        '''Returns the teams in seed order after the remaining games end with results, a (score, opponent score) per game'''
+        record = self.record.copy()
+        for ((i, j), (score, opponent_score)) in zip(self.games, results):
+            outcome = 'W' if score > opponent_score else 'L' if score < opponent_score else 'T'
+            record.add(i, j, outcome, score, opponent_score)
+            record.add(j, i, {'W': 'L', 'L': 'W', 'T': 'T'}[outcome], opponent_score, score)
+
+        return self._seed_record(record, rng)
+
+    def _seed_record(self, record: SeasonRecord, rng: random.Random) -> List[int]:
+        sort_by_head_to_head = partial(sort_by_head_to_head_matrix, index=range(len(self.team_ids)),
+                                       wins=record.h2h_wins, games=record.h2h_games)
+        hierarchy = tiebreaker_hierarchy(self.playoff_seed_tie_rule, sort_by_head_to_head, partial(_sort_by_coin_flip, rng=rng))
+        return [team_data['team_id'] for team_data in sort_standings(record.team_data(), self.divisions, hierarchy)]
+
+
+def _sort_by_coin_flip(team_data_list: List[Dict], rng: random.Random) -> List[Dict]:
+    '''sort_by_coin_flip with the simulations own random number generator'''
+    for team_data in team_data_list:
+        team_data['coin_flip'] = rng.random()
+    return sorted(team_data_list, key=lambda x: x['coin_flip'], reverse=True)
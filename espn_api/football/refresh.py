@@ -0,0 +1,51 @@
+import hashlib
+import marshal
+from typing import Dict, List, Tuple
+
+# parts of a team compared between fetches, in the order of team_digests
+TEAM_PARTS = ('team', 'roster', 'schedule', 'owners')
+
+
+def _digest(doc) -> bytes:
+    # marshal is several times faster than json.dumps, its format only has to be stable within the process
+    return hashlib.sha256(marshal.dumps(doc, 2)).digest()
+
+
+def team_digests(data) -> Dict[int, Tuple[bytes, ...]]:
+    '''Digests of the record, roster, matchups and owners of every team of a league payload keyed by team id'''
+    matchups = {}
+    for matchup in data['schedule']:
+        for side in ('home', 'away'):
+            team_id = matchup.get(side, {}).get('teamId')
+            if team_id is not None:
+                matchups.setdefault(team_id, []).append(matchup)
+    members = data.get('members', [])
+
+    digests = {}
+    for team in data['teams']:
+        record = {key: value for (key, value) in team.items() if key != 'roster'}
+        owners = [member for member in members if member.get('id') in team.get('owners', [])]
+        digests[team['id']] = (_digest(record), _digest(team.get('roster', {})), _digest(matchups.get(team['id'], [])), _digest(owners))
+    return digests
+
+
+def changed_parts(old: Tuple[bytes, ...], new: Tuple[bytes, ...]) -> List[str]:
+    '''Returns the TEAM_PARTS whose digests differ, all of them for a team without old digests'''
+    if old is None:
+        return list(TEAM_PARTS)
+    return [part for (part, old_digest, new_digest) in zip(TEAM_PARTS, old, new) if old_digest != new_digest]
+
+
+class RefreshSummary(object):
+    '''What a refresh changed. teams maps the id of every team that changed to the parts that did,
+    out of team, roster, schedule and owners. Teams that aren't in it kept their objects'''
+    def __init__(self, teams: Dict[int, List[str]], removed_teams: List[int], pro_schedule: bool):
+        self.teams = teams
+        self.removed_teams = removed_teams
+        self.pro_schedule = pro_schedule
+
+    def __repr__(self):
+        return f'RefreshSummary({len(self.teams)} teams changed, pro schedule {"changed" if self.pro_schedule else "unchanged"})'
+
+    def __bool__(self):
+        return bool(self.teams or self.removed_teams or self.pro_schedule)
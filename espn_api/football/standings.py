@@ -0,0 +1,183 @@
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .helper import (
+    sort_by_coin_flip,
+    sort_by_points_against,
+    sort_by_points_for,
+    sort_by_win_pct,
+    sort_team_data_list,
+)
+
+
+def sort_by_head_to_head_matrix(team_data_list: List[Dict], index: Dict, wins: List[List], games: List[List]) -> List[Dict]:
+    '''sort_by_head_to_head reading the wins and games of every pair of teams from matrices, index maps a team_id to its row'''
+    if len(team_data_list) < 2:
+        return team_data_list
+
+    ids = [index[team_data['team_id']] for team_data in team_data_list]
+    matchup_counts = {games[i][j] for i in ids for j in ids if i != j}
+    if len(team_data_list) > 2 and len(matchup_counts) != 1:
+        # All teams have not played each other an equal number of times
+        for team_data in team_data_list:
+            team_data['h2h_wins'] = 0
+        return team_data_list
+
+    for (team_data, i) in zip(team_data_list, ids):
+        team_data['h2h_wins'] = sum(wins[i][j] for j in ids if j != i)
+    return sorted(team_data_list, key=lambda x: x['h2h_wins'], reverse=True)
+
+
+def sort_by_division_record_value(team_data_list: List[Dict]) -> List[Dict]:
+    '''sort_by_division_record for team data that already holds its division record'''
+    return sorted(team_data_list, key=lambda x: x['division_record'], reverse=True)
+
+
+def tiebreaker_hierarchy(playoff_seed_tie_rule: str, sort_by_head_to_head: Callable,
+                         sort_by_coin_flip: Callable = sort_by_coin_flip) -> List[Tuple[Callable, str]]:
+    '''Returns the tiebreakers of a playoff_seed_tie_rule, team data must hold its division record'''
+    if playoff_seed_tie_rule == 'TOTAL_POINTS_SCORED':
+        return [
+            (sort_by_win_pct, 'win_pct'),
+            (sort_by_points_for, 'points_for'),
+            (sort_by_head_to_head, 'h2h_wins'),
+            (sort_by_division_record_value, 'division_record'),
+            (sort_by_points_against, 'points_against'),
+            (sort_by_coin_flip, 'coin_flip'),
+        ]
+    elif playoff_seed_tie_rule == 'H2H_RECORD':
+        return [
+            (sort_by_win_pct, 'win_pct'),
+            (sort_by_head_to_head, 'h2h_wins'),
+            (sort_by_points_for, 'points_for'),
+            (sort_by_division_record_value, 'division_record'),
+            (sort_by_points_against, 'points_against'),
+            (sort_by_coin_flip, 'coin_flip'),
+        ]
+    raise ValueError(
+        "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED' or 'H2H_RECORD'"
+    )
+
+
+def sort_standings(list_of_team_data: List[Dict], division_ids: Iterable, tiebreaker_hierarchy: List[Tuple[Callable, str]]) -> List[Dict]:
+    '''Sorts the team data with the division winners first'''
+    list_of_team_data = list(list_of_team_data)
+
+    # First assign the division winners
+    division_winners = []
+    for division_id in list(division_ids):
+        division_teams = [team_data for team_data in list_of_team_data if team_data['division_id'] == division_id]
+        division_winner = sort_team_data_list(division_teams, tiebreaker_hierarchy)[0]
+        division_winners.append(division_winner)
+        list_of_team_data.remove(division_winner)
+
+    # Sort the division winners, then the rest of the teams
+    sorted_team_data = sort_team_data_list(division_winners, tiebreaker_hierarchy)
+    sorted_team_data += sort_team_data_list(list_of_team_data, tiebreaker_hierarchy)
+    return sorted_team_data
+
+
+class StandingsEngine(object):
+    '''Answers standings_weekly for any week from prefix sums of every teams record and points
+    and a head to head tensor, all built once from the teams schedules'''
+    def __init__(self, teams: List, division_map: Dict, playoff_seed_tie_rule: str):
+        self.teams = teams
+        self.division_map = division_map
+        self.playoff_seed_tie_rule = playoff_seed_tie_rule
+        self.weeks = max((len(team.outcomes) for team in teams), default=0)
+        self._index = {team.team_id: i for i, team in enumerate(teams)}
+
+        # prefix sums, index w holds the totals of the first w weeks
+        self._wins = []
+        self._ties = []
+        self._losses = []
+        self._points_for = []
+        self._points_against = []
+        self._division_wins = []
+        self._division_games = []
+        # _h2h_wins[w][i][j] is team i's wins (ties count half) against team j in the first w weeks
+        self._h2h_wins = [[[0] * len(teams) for team in teams]]
+        self._h2h_games = [[[0] * len(teams) for team in teams]]
+
+        for team in teams:
+            self._fill_prefix_sums(team)
+        for week in range(self.weeks):
+            self._fill_h2h_week(week)
+
+    def _fill_prefix_sums(self, team):
+        (wins, ties, losses, points_for, points_against, division_wins, division_games) = ([0], [0], [0], [0], [0], [0], [0])
+        for week in range(self.weeks):
+            outcome = team.outcomes[week] if week < len(team.outcomes) else None
+            opponent = team.schedule[week] if week < len(team.schedule) else None
+            wins.append(wins[-1] + (outcome == 'W'))
+            ties.append(ties[-1] + (outcome == 'T'))
+            losses.append(losses[-1] + (outcome == 'L'))
+            points_for.append(points_for[-1] + (team.scores[week] if week < len(team.scores) else 0))
+            points_against.append(points_against[-1] + (opponent.scores[week] if opponent is not None else 0))
+            in_division = opponent is not None and outcome is not None and opponent.division_id == team.division_id
+            division_wins.append(division_wins[-1] + (self._outcome_wins(outcome) if in_division else 0))
+            division_games.append(division_games[-1] + in_division)
+        self._wins.append(wins)
+        self._ties.append(ties)
+        self._losses.append(losses)
+        self._points_for.append(points_for)
+        self._points_against.append(points_against)
+        self._division_wins.append(division_wins)
+        self._division_games.append(division_games)
+
+    def _fill_h2h_week(self, week: int):
+        wins = [row[:] for row in self._h2h_wins[-1]]
+        games = [row[:] for row in self._h2h_games[-1]]
+        for (i, team) in enumerate(self.teams):
+            if week >= len(team.outcomes) or week >= len(team.schedule):
+                continue
+            j = self._index.get(team.schedule[week].team_id)
+            if j is None or j == i:
+                continue
+            wins[i][j] += self._outcome_wins(team.outcomes[week])
+            games[i][j] += 1
+        self._h2h_wins.append(wins)
+        self._h2h_games.append(games)
+
+    @staticmethod
+    def _outcome_wins(outcome: str):
+        if outcome == 'W':
+            return 1
+        if outcome == 'T':
+            return 0.5
+        return 0
+
+    def team_data(self, week: int) -> List[Dict]:
+        '''Returns each teams standings data for the first week weeks'''
+        week = min(week, self.weeks)
+        list_of_team_data = []
+        for (i, team) in enumerate(self.teams):
+            team_data = {
+                'team': team,
+                'team_id': team.team_id,
+                'division_id': team.division_id,
+                'wins': self._wins[i][week],
+                'ties': self._ties[i][week],
+                'losses': self._losses[i][week],
+                'points_for': self._points_for[i][week],
+                'points_against': self._points_against[i][week],
+                'division_record': self._division_wins[i][week] / max(self._division_games[i][week], 1),
+            }
+            games = team_data['wins'] + team_data['ties'] + team_data['losses']
+            team_data['win_pct'] = (team_data['wins'] + team_data['ties'] / 2) / games
+            list_of_team_data.append(team_data)
+        return list_of_team_data
+
+    def tiebreaker_hierarchy(self, week: int) -> List[Tuple[Callable, str]]:
+        sort_by_head_to_head = partial(sort_by_head_to_head_matrix, index=self._index,
+                                       wins=self._h2h_wins[week], games=self._h2h_games[week])
+        return tiebreaker_hierarchy(self.playoff_seed_tie_rule, sort_by_head_to_head)
+
+    def standings(self, week: int) -> List:
+        '''Returns the teams sorted by their standing after week, division winners first'''
+        week = min(week, self.weeks)
+        list_of_team_data = self.team_data(week)
+        tiebreaker_hierarchy = self.tiebreaker_hierarchy(week)
+
+        sorted_team_data = sort_standings(list_of_team_data, self.division_map.keys(), tiebreaker_hierarchy)
+        return [team_data['team'] for team_data in sorted_team_data]
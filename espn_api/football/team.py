@@ -3,6 +3,12 @@ from .constant import PLAYER_STATS_MAP
 
 class Team(object):
     '''Teams are part of the league'''
+    __slots__ = ('team_id', 'team_abbrev', 'team_name', 'division_id', 'division_name', 'wins', 'losses', 'ties',
+                 'points_for', 'points_against', 'acquisitions', 'acquisition_budget_spent', 'drops', 'trades',
+                 'playoff_pct', 'draft_projected_rank', 'streak_length', 'streak_type', 'standing', 'final_standing',
+                 'waiver_rank', 'roster', '_roster_index', 'schedule', 'scores', 'outcomes', 'mov', 'owners', 'stats',
+                 'logo_url')
+
     def __init__(self, data, roster, schedule, year, **kwargs):
         self.team_id = data['id']
         self.team_abbrev = data['abbrev']
@@ -32,25 +38,31 @@ class Team(object):
         else:
             self.logo_url = ''
         self.roster = []
+        self._roster_index = {}
         self.schedule = []
         self.scores = []
         self.outcomes = []
         self.mov = []
         self._fetch_schedule(schedule)
-        self._fetch_roster(roster, year, kwargs.get('pro_schedule'))
+        self._fetch_roster(roster, year, kwargs.get('pro_schedule'), kwargs.get('player_identities'))
         self.owners = kwargs.get('owners', [])
         self.stats = {PLAYER_STATS_MAP.get(int(i), i): j for i, j in data.get('valuesByStat', {}).items()}
 
     def __repr__(self):
         return 'Team(%s)' % (self.team_name, )
     
-    def _fetch_roster(self, data, year, pro_schedule = None):
+    def _fetch_roster(self, data, year, pro_schedule = None, player_identities: dict = None):
         '''Fetch teams roster'''
         self.roster.clear()
         roster = data.get('entries', [])
 
         for player in roster:
-            self.roster.append(Player(player, year, pro_schedule))
+            self.roster.append(Player(player, year, pro_schedule, player_identities))
+        self._roster_index = {player.playerId: player for player in self.roster}
+
+    def get_player(self, playerId: int) -> Player:
+        '''Returns the player on the roster with the id, None if they aren't on it'''
+        return self._roster_index.get(playerId)
 
     def _fetch_schedule(self, data):
         '''Fetch schedule and scores for team'''
@@ -83,7 +95,5 @@ class Team(object):
             return 'L'
 
     def get_player_name(self, playerId: int) -> str:
-        for player in self.roster:
-            if player.playerId == playerId:
-                return player.name
-        return ''
+        player = self._roster_index.get(playerId)
+        return player.name if player else ''
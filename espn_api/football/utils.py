@@ -1,4 +1,10 @@
 # Helper functions for json parsing and power rankings
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def json_parsing(obj, key):
     """Recursively pull values of specified key from nested JSON."""
@@ -52,11 +58,25 @@ def add_matrix(X, Y):
 
 def two_step_dominance(X):
     '''Returns result of two step dominance formula'''
+    if np is not None:
+        matrix = np.asarray(X, dtype=float)
+        return (matrix @ matrix + matrix).sum(axis=1).tolist()
     matrix = add_matrix(square_matrix(X), X)
     result = [sum(x) for x in matrix]
     return result
 
 
+def win_matrix(teams, week) -> List[List[int]]:
+    '''Returns how many times each team beat each other team in the first weeks, opponents are columns in the order of teams'''
+    index = {team: i for i, team in enumerate(teams)}
+    matrix = [[0] * len(teams) for team in teams]
+    for i, team in enumerate(teams):
+        for mov, opponent in zip(team.mov[:week], team.schedule[:week]):
+            if mov > 0 and opponent in index:
+                matrix[i][index[opponent]] += 1
+    return matrix
+
+
 def power_points(dominance, teams, week):
     '''Returns list of power points'''
     power_points = []
@@ -68,4 +88,40 @@ def power_points(dominance, teams, week):
                                  (int(avg_mov)*0.05))
         power_points.append(power)
     power_tup = [(i, j) for (i, j) in zip(power_points, teams)]
-    return sorted(power_tup, key=lambda tup: float(tup[0]), reverse=True)
\ No newline at end of file
+    return sorted(power_tup, key=lambda tup: float(tup[0]), reverse=True)
+
+
+def power_points_all_weeks(teams, weeks) -> List[List[Tuple[str, object]]]:
+    '''Returns the power points of every week from 1 to weeks, equal to calling power_points for each week.
+    With NumPy the wins, scores and margins of victory of all weeks are accumulated at once'''
+    if np is None or not teams:
+        return [power_points(two_step_dominance(win_matrix(teams, week)), teams, week) for week in range(1, weeks + 1)]
+
+    index = {team: i for i, team in enumerate(teams)}
+    scores = np.zeros((len(teams), weeks))
+    movs = np.zeros((len(teams), weeks))
+    opponents = np.full((len(teams), weeks), -1)
+    for i, team in enumerate(teams):
+        team_scores = team.scores[:weeks]
+        team_movs = team.mov[:weeks]
+        scores[i, :len(team_scores)] = team_scores
+        movs[i, :len(team_movs)] = team_movs
+        opponents[i, :len(team_movs)] = [index.get(opponent, -1) for opponent in team.schedule[:len(team_movs)]]
+
+    # wins[week, team, opponent] counts the wins up to and including the week
+    (team_ids, week_ids) = np.nonzero((movs > 0) & (opponents >= 0))
+    wins = np.zeros((weeks, len(teams), len(teams)))
+    np.add.at(wins, (week_ids, team_ids, opponents[team_ids, week_ids]), 1)
+    wins = np.cumsum(wins, axis=0)
+    dominance = (wins @ wins + wins).sum(axis=2)
+
+    week_counts = np.arange(1, weeks + 1)[:, None]
+    avg_scores = np.cumsum(scores, axis=1).T / week_counts
+    avg_movs = np.cumsum(movs, axis=1).T / week_counts
+    power = np.trunc(dominance) * 0.8 + np.trunc(avg_scores) * 0.15 + np.trunc(avg_movs) * 0.05
+
+    rankings = []
+    for week_power in power.tolist():
+        power_tup = [('{0:.2f}'.format(points), team) for (points, team) in zip(week_power, teams)]
+        rankings.append(sorted(power_tup, key=lambda tup: float(tup[0]), reverse=True))
+    return rankings
@@ -1,4 +1,5 @@
 __all__ = ['League',
+           'AsyncLeague',
            'Team',
            'Player',
            'Record',
@@ -8,6 +9,7 @@ __all__ = ['League',
            ]
 
 from .league import League
+from .async_league import AsyncLeague
 from .player import Player
 from .record import Record
 from .team import Team
@@ -1,6 +1,5 @@
 import datetime
-import json
-from typing import List
+from typing import List, Tuple
 
 from espn_api.hockey.constant import ACTIVITY_MAP, POSITION_MAP
 from .activity import Activity
@@ -9,27 +8,31 @@ from .matchup import Matchup
 from .player import Player
 from .team import Team
 from ..base_league import BaseLeague
+from ..requests.session_pool import SessionPool
 
 
 class League(BaseLeague):
     '''Creates a League instance for Public/Private ESPN league'''
 
-    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False):
-        super().__init__(league_id=league_id, year=year, sport='nhl', espn_s2=espn_s2, swid=swid, debug=debug)
+    def __init__(self, league_id: int, year: int, espn_s2=None, swid=None, fetch_league=True, debug=False, concurrent_requests=False,
+                 max_response_length: int = None, session_pool: SessionPool = None):
+        super().__init__(league_id=league_id, year=year, sport='nhl', espn_s2=espn_s2, swid=swid, debug=debug, concurrent_requests=concurrent_requests,
+                         max_response_length=max_response_length, session_pool=session_pool)
 
         if fetch_league:
             self.fetch_league()
 
     def fetch_league(self):
-        data = self._fetch_league()
-        self._fetch_teams(data)
-        super()._fetch_draft()
+        (data, players, pro_schedule, draft) = self._fetch_league_payloads()
+        self._build_league(data, players, pro_schedule, draft)
 
-    def _fetch_league(self):
-        data = super()._fetch_league()
-        self._fetch_players()
+    def _build_league(self, data, players, pro_schedule, draft):
+        '''Builds the league from the league, pro players and draft payloads'''
+        super()._parse_league(data)
+        self._parse_players(players)
         self._map_matchup_ids(data['schedule'])
-        return data
+        self._fetch_teams(data)
+        super()._parse_draft(draft)
 
     def _map_matchup_ids(self, schedule):
         self.matchup_ids = {}
@@ -50,12 +53,7 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            self._map_matchup_teams(team.schedule)
 
 
     def standings(self) -> List[Team]:
@@ -73,15 +71,13 @@ class League(BaseLeague):
             'view': 'mMatchup',
         }
         data = self.espn_request.league_get(params=params)
+        return self._parse_scoreboard(data, matchupPeriod)
+
+    def _parse_scoreboard(self, data, matchupPeriod: int) -> List[Matchup]:
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        self._map_matchup_teams(matchups)
 
         return matchups
 
@@ -91,24 +87,18 @@ class League(BaseLeague):
         if self.year < 2019:
             raise Exception('Cant use recent activity before 2019')
 
-        msg_types = [178, 180, 179, 239, 181, 244]
-        if msg_type in ACTIVITY_MAP:
-            msg_types = [ACTIVITY_MAP[msg_type]]
-        params = {
-            'view': 'kona_league_communication'
-        }
+        msg_types = self._get_activity_msg_types(msg_type)
+
+        data = self.espn_request.get_recent_activity(msg_types, size=size, offset=offset)
+        return self._parse_activity(data)
 
-        filters = {"topics": {"filterType": {"value": ["ACTIVITY_TRANSACTIONS"]}, "limit": size,
-                              "limitPerMessageSet": {"value": 25}, "offset": offset,
-                              "sortMessageDate": {"sortPriority": 1, "sortAsc": False},
-                              "sortFor": {"sortPriority": 2, "sortAsc": False},
-                              "filterIncludeMessageTypeIds": {"value": msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
-        data = data['topics']
-        activity = [Activity(topic, self.player_map, self.get_team_data) for topic in data]
+    def _get_activity_msg_types(self, msg_type: str = None) -> List[int]:
+        if msg_type in ACTIVITY_MAP:
+            return [ACTIVITY_MAP[msg_type]]
+        return [178, 180, 179, 239, 181, 244]
 
-        return activity
+    def _parse_activity(self, data) -> List[Activity]:
+        return [Activity(topic, self.player_map, self.get_team_data) for topic in data['topics']]
 
     def free_agents(self, week: int = None, size: int = 50, position: str = None, position_id: int = None) -> List[
         Player]:
@@ -119,23 +109,11 @@ class League(BaseLeague):
         if not week:
             week = self.current_week
 
-        slot_filter = []
-        if position and position in POSITION_MAP:
-            slot_filter = [POSITION_MAP[position]]
-        if position_id:
-            slot_filter.append(position_id)
+        slot_filter = self._get_slot_filter(POSITION_MAP, position, position_id)
+        data = self.espn_request.get_free_agents(week, size=size, slot_filter=slot_filter)
+        return self._parse_free_agents(data)
 
-        params = {
-            'view': 'kona_player_info',
-            'scoringPeriodId': week,
-        }
-        filters = {
-            "players": {"filterStatus": {"value": ["FREEAGENT", "WAIVERS"]}, "filterSlotIds": {"value": slot_filter},
-                        "limit": size, "sortPercOwned": {"sortPriority": 1, "sortAsc": False},
-                        "sortDraftRanks": {"sortPriority": 100, "sortAsc": True, "value": "STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-
-        data = self.espn_request.league_get(params=params, headers=headers)
+    def _parse_free_agents(self, data) -> List[Player]:
         players = data['players']
 
         free_agents = [Player(player) for player in players]
@@ -144,9 +122,21 @@ class League(BaseLeague):
     def box_scores(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> List[
         BoxScore]:
         '''Returns list of box score for a given matchup or scoring period'''
+        (data, parse_args) = self._get_box_score_data(matchup_period, scoring_period, matchup_total)
+        return self._parse_box_scores(data, *parse_args)
+
+    def _get_box_score_data(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> Tuple[dict, tuple]:
+        '''Requests the box scores, returns the response and the other _parse_box_scores arguments, the scoring period last'''
         if self.year < 2019:
             raise Exception('Cant use box score before 2019')
+        (matchup_id, scoring_id) = self._get_box_score_periods(matchup_period, scoring_period)
 
+        data = self.espn_request.get_box_scores(matchup_id, scoring_id)
+        pro_schedule = self._get_pro_schedule(scoring_id)
+        return (data, (pro_schedule, matchup_total, scoring_id))
+
+    def _get_box_score_periods(self, matchup_period: int = None, scoring_period: int = None) -> Tuple[int, int]:
+        '''Returns the matchup period and scoring period to get box scores for'''
         matchup_id = self.currentMatchupPeriod
         scoring_id = self.current_week
         if matchup_period and scoring_period:
@@ -161,25 +151,12 @@ class League(BaseLeague):
                 if str(scoring_id) in self.matchup_ids[matchup]:
                     matchup_id = matchup
                     break
+        return (matchup_id, scoring_id)
 
-        params = {
-            'view': ['mMatchupScore', 'mScoreboard'],
-            'scoringPeriodId': scoring_id
-        }
-
-        filters = {"schedule": {"filterMatchupPeriodIds": {"value": [matchup_id]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = self.espn_request.league_get(params=params, headers=headers)
-
+    def _parse_box_scores(self, data, pro_schedule, matchup_total: bool, scoring_id: int) -> List[BoxScore]:
         schedule = data['schedule']
-        pro_schedule = self._get_pro_schedule(scoring_id)
         box_data = [BoxScore(matchup, pro_schedule, matchup_total) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        self._map_matchup_teams(box_data)
         return box_data
 
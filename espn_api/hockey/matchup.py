@@ -2,6 +2,9 @@ from .constant import STATS_MAP
 
 class Matchup(object):
     '''Creates Matchup instance'''
+    __slots__ = ('home_team_live_score', 'away_team_live_score', 'home_team', 'home_final_score', 'away_team',
+                 'away_final_score', 'winner', 'home_team_cats', 'away_team_cats')
+
     def __init__(self, data):
         self.home_team_live_score = None
         self.away_team_live_score = None
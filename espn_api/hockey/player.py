@@ -1,21 +1,27 @@
-from espn_api.utils.utils import json_parsing
+from functools import cached_property
+from espn_api.utils.utils import compact_stats, json_parsing_keys
 from .constant import POSITION_MAP, STATS_MAP, PRO_TEAM_MAP, STATS_IDENTIFIER
 
 
 class Player(object):
+    '''Player are part of team, stats are built on first access'''
+    # __dict__ holds the cached properties
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', '_stat_splits', 'injured', '__dict__')
 
     def __init__(self, data):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1
-                                         if json_parsing(data, 'defaultPositionId') and json_parsing(data, 'defaultPositionId') <= 3 
-                                         else json_parsing(data, 'defaultPositionId'), '')
+        # the stats and rankings are most of the players json and hold none of the fields
+        fields = json_parsing_keys(data, ['fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType', 'proTeamId', 'injuryStatus'],
+                                   skip=('stats', 'rankings'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        position_id = fields['defaultPositionId']
+        self.position = POSITION_MAP.get(position_id - 1 if position_id and position_id <= 3 else position_id, '')
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), 'Unknown Team')
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.stats = {}
+        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(fields['proTeamId'], 'Unknown Team')
+        self.injuryStatus = fields['injuryStatus']
 
         '''
         Options
@@ -31,22 +37,17 @@ class Player(object):
         self.injuryStatus = player.get('injuryStatus', self.injuryStatus)
         self.injured = player.get('injured', False)
 
-        for split in player.get('stats', []):
-            if split.get('stats'):
-                id = split['id']
-                stat_key = get_stat_key(id)
-
-                self.stats[stat_key] = {}
-
-                if 'stats' in split.keys():
-                    self.stats[stat_key]['total'] = {STATS_MAP[i]: split['stats'][i] for i in split['stats'].keys()
-                                                        if STATS_MAP[i] != ''}
-                else:
-                    self.stats[stat_key]['total'] = None
+        # the compacted stats of each split by stat key, they are mapped when stats are read
+        self._stat_splits = {get_stat_key(split['id']): compact_stats(split['stats']) for split in player.get('stats', []) if split.get('stats')}
 
     def __repr__(self):
         return 'Player(%s)' % (self.name,)
 
+    @cached_property
+    def stats(self):
+        return {stat_key: {'total': {STATS_MAP[i]: value for (i, value) in zip(ids, values) if STATS_MAP[i] != ''}}
+                for (stat_key, (ids, values)) in self._stat_splits.items()}
+
 def get_stat_key(id: str) -> str:
     if id[:2] in STATS_IDENTIFIER:
         stat_type = STATS_IDENTIFIER[id[:2]]
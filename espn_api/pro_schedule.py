@@ -0,0 +1,33 @@
+from typing import Dict, Tuple
+
+
+class ProSchedule(object):
+    '''Pro team games for a season indexed by pro team and scoring period'''
+    def __init__(self, data):
+        # proTeamId -> proGamesByScoringPeriod
+        self.games = {}
+        # scoringPeriodId -> proTeamId -> (opponent proTeamId, game date)
+        self.scoring_periods = {}
+
+        for team in data.get('settings', {}).get('proTeams', {}):
+            pro_games = team.get('proGamesByScoringPeriod', {})
+            self.games[team['id']] = pro_games
+            if team['id'] == 0:
+                continue
+            for scoring_period, games in pro_games.items():
+                if not games:
+                    continue
+                game = games[0]
+                opponent = game['homeProTeamId'] if team['id'] == game['awayProTeamId'] else game['awayProTeamId']
+                self.scoring_periods.setdefault(scoring_period, {})[team['id']] = (opponent, game['date'])
+
+    def __repr__(self):
+        return 'ProSchedule(%s teams)' % (len(self.games), )
+
+    def scoring_period(self, scoringPeriodId: int) -> Dict[int, Tuple[int, int]]:
+        '''Returns each pro teams opponent and game date for a scoring period'''
+        return self.scoring_periods.get(str(scoringPeriodId), {})
+
+    def game(self, proTeamId: int, scoringPeriodId: int) -> Tuple[int, int]:
+        '''Returns the opponent and game date of a pro team for a scoring period, None on a bye'''
+        return self.scoring_period(scoringPeriodId).get(proTeamId)
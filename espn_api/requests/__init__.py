@@ -1,3 +1,29 @@
-__all__ = ['EspnFantasyRequests']
+__all__ = ['EspnFantasyRequests',
+           'SessionPool',
+           'get_session_pool',
+           'configure_session_pool',
+           'AsyncEspnFantasyRequests',
+           'AsyncSessionPool',
+           'get_async_session_pool',
+           'ProDataCache',
+           'get_pro_data_cache',
+           'configure_pro_data_cache',
+           'get_json_decoder',
+           'configure_json_decoder',
+           'DiskCache',
+           'get_disk_cache',
+           'configure_disk_cache',
+           'disable_disk_cache',
+           'RecordingTransport',
+           'ReplayTransport',
+           'JsonDirectoryTransport',
+           'open_replay',
+           ]
 
-from .espn_requests import EspnFantasyRequests
\ No newline at end of file
+from .espn_requests import EspnFantasyRequests
+from .session_pool import SessionPool, get_session_pool, configure_session_pool
+from .async_espn_requests import AsyncEspnFantasyRequests, AsyncSessionPool, get_async_session_pool
+from .pro_data_cache import ProDataCache, get_pro_data_cache, configure_pro_data_cache
+from .json_decoder import get_json_decoder, configure_json_decoder
+from .disk_cache import DiskCache, get_disk_cache, configure_disk_cache, disable_disk_cache
+from .transport import RecordingTransport, ReplayTransport, JsonDirectoryTransport, open_replay
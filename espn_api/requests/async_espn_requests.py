@@ -0,0 +1,167 @@
+import asyncio
+from functools import partial
+from typing import List, Optional, Tuple, Union
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .espn_requests import EspnFantasyRequests, checkRequestStatus
+from .session_pool import DEFAULT_POOL_MAXSIZE, get_session_pool
+from .pro_data_cache import get_pro_data_cache
+from .json_decoder import JsonDecoder
+from .disk_cache import DiskCache
+from .transport import Transport
+from ..utils.logger import Logger
+
+
+def encode_params(params: dict) -> List[Tuple[str, str]]:
+    '''Expands list values into repeated keys the same way requests does'''
+    items = []
+    for key, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for v in values:
+            items.append((key, str(v)))
+    return items
+
+
+class AsyncSessionPool(object):
+    '''Keep-alive aiohttp session shared by AsyncEspnFantasyRequests instances.
+    Without aiohttp installed requests are sent through the SessionPool on the default executor'''
+    def __init__(self, limit: int = DEFAULT_POOL_MAXSIZE):
+        self.limit = limit
+        self._session = None
+        self._loop = None
+
+    def __repr__(self):
+        return f'AsyncSessionPool(limit={self.limit})'
+
+    async def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None) -> Tuple[int, bytes]:
+        '''Returns the status code and body of the response'''
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            r = await loop.run_in_executor(None, partial(get_session_pool().get, url, params=params, headers=headers, cookies=cookies))
+            return (r.status_code, r.content)
+
+        session = await self._get_session()
+        async with session.get(url, params=encode_params(params), headers=headers, cookies=cookies) as r:
+            return (r.status, await r.read())
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+        # aiohttp sessions are bound to the event loop they were created in
+        if self._session is not None and self._loop is not loop:
+            await self.close()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+            self._loop = loop
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_async_session_pool = AsyncSessionPool()
+
+
+def get_async_session_pool() -> AsyncSessionPool:
+    '''Returns the process wide AsyncSessionPool shared by every async league'''
+    return _async_session_pool
+
+
+class AsyncEspnFantasyRequests(EspnFantasyRequests):
+    '''EspnFantasyRequests where every request method is a coroutine'''
+    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None, session_pool: AsyncSessionPool = None,
+                 json_decoder: Union[str, JsonDecoder] = None, disk_cache: DiskCache = None, transport: Transport = None):
+        super().__init__(sport=sport, year=year, league_id=league_id, cookies=cookies, logger=logger, json_decoder=json_decoder,
+                         disk_cache=disk_cache, transport=transport)
+        self._async_session_pool = session_pool
+
+    @property
+    def async_session_pool(self) -> AsyncSessionPool:
+        return self._async_session_pool or get_async_session_pool()
+
+    async def _send_async(self, endpoint: str, params: dict = None, headers: dict = None) -> Tuple[int, bytes]:
+        '''Returns the status code and body of the response, transports are synchronous and run on the default executor'''
+        if self.transport is None:
+            return await self.async_session_pool.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        loop = asyncio.get_running_loop()
+        r = await loop.run_in_executor(None, partial(self._send, endpoint, params=params, headers=headers))
+        return (r.status_code, r.content)
+
+    async def _cache_get_async(self, endpoint: str, params: dict = None, headers: dict = None) -> Optional[bytes]:
+        '''sqlite blocks so the disk cache is read and written on the default executor'''
+        if self.disk_cache is None:
+            return None
+        return await asyncio.get_running_loop().run_in_executor(None, self._cache_get, endpoint, params, headers)
+
+    async def _cache_set_async(self, endpoint: str, params: dict, headers: dict, content: bytes):
+        if self.disk_cache is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self._cache_set, endpoint, params, headers, content)
+
+    async def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        endpoint = self.LEAGUE_ENDPOINT + extend
+        content = await self._cache_get_async(endpoint, params, headers)
+        if content is None:
+            (status, content) = await self._send_async(endpoint, params=params, headers=headers)
+            checkRequestStatus(status, cookies=self.cookies, league_id=self.league_id)
+            await self._cache_set_async(endpoint, params, headers, content)
+
+        data = self.json_decoder(content)
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data if self.year > 2017 else data[0]
+
+    async def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        endpoint = self.ENDPOINT + extend
+        content = await self._cache_get_async(endpoint, params, headers)
+        if content is None:
+            (status, content) = await self._send_async(endpoint, params=params, headers=headers)
+            checkRequestStatus(status)
+            await self._cache_set_async(endpoint, params, headers, content)
+
+        data = self.json_decoder(content)
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data
+
+    # the parent methods build the request and return the league_get/get coroutine
+
+    async def get_league(self):
+        return await super().get_league()
+
+    async def get_pro_schedule(self):
+        if self.transport is not None:
+            return await super()._get_pro_schedule()
+        return await get_pro_data_cache().get_or_fetch_async((self.sport, self.year, 'proTeamSchedules_wl'), super()._get_pro_schedule)
+
+    async def get_pro_players(self):
+        if self.transport is not None:
+            return await super()._get_pro_players()
+        return await get_pro_data_cache().get_or_fetch_async((self.sport, self.year, 'players_wl'), super()._get_pro_players)
+
+    async def get_league_draft(self):
+        return await super().get_league_draft()
+
+    async def get_league_message_board(self, msg_types = None):
+        return await super().get_league_message_board(msg_types)
+
+    async def get_player_card(self, playerIds: List[int], max_scoring_period: int, additional_filters: List = None):
+        return await super().get_player_card(playerIds, max_scoring_period, additional_filters)
+
+    async def get_box_scores(self, matchup_period: int, scoring_period: int):
+        return await super().get_box_scores(matchup_period, scoring_period)
+
+    async def get_positional_ratings(self, scoring_period: int):
+        return await super().get_positional_ratings(scoring_period)
+
+    async def get_free_agents(self, scoring_period: int, size: int = 50, slot_filter: List[int] = None):
+        return await super().get_free_agents(scoring_period, size=size, slot_filter=slot_filter)
+
+    async def get_recent_activity(self, msg_types: List[int], size: int = 25, offset: int = 0):
+        return await super().get_recent_activity(msg_types, size=size, offset=offset)
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'espn_api')
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+DEFAULT_LIVE_TTL = 5 * 60
+
+
+class DiskCache(object):
+    '''SQLite backed response cache that evicts the least recently used responses past max_size bytes.
+    Responses of completed seasons and scoring periods are stored without an expiry, live data for live_ttl seconds'''
+    def __init__(self, path: str = DEFAULT_PATH, max_size: int = DEFAULT_MAX_SIZE, live_ttl: float = DEFAULT_LIVE_TTL):
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        self.live_ttl = live_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self):
+        return f'DiskCache({self.path})'
+
+    @staticmethod
+    def key(endpoint: str, params: dict = None, headers: dict = None, cookies: dict = None) -> str:
+        '''Responses are identified by the endpoint, params, x-fantasy-filter header and credentials
+        so a private leagues response is never returned to a request without them'''
+        fantasy_filter = (headers or {}).get('x-fantasy-filter')
+        credentials = [cookies.get('espn_s2'), cookies.get('SWID')] if cookies else None
+        return hashlib.sha256(json.dumps([endpoint, params, fantasy_filter, credentials], sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        '''Returns the cached response body or None if it is missing or expired'''
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute('SELECT body, expires FROM responses WHERE key = ?', (key, )).fetchone()
+            now = time.time()
+            if row is None or (row[1] is not None and row[1] < now):
+                if row is not None:
+                    conn.execute('DELETE FROM responses WHERE key = ?', (key, ))
+                self.misses += 1
+                return None
+            conn.execute('UPDATE responses SET last_used = ? WHERE key = ?', (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, body: bytes, ttl: float = None):
+        '''Stores a response body, a ttl of None never expires'''
+        if len(body) > self.max_size:
+            return
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            conn = self._connection()
+            conn.execute('INSERT OR REPLACE INTO responses (key, body, expires, last_used, size) VALUES (?, ?, ?, ?, ?)',
+                         (key, sqlite3.Binary(body), expires, now, len(body)))
+            self._evict(conn)
+
+    def size(self) -> int:
+        with self._lock:
+            return self._size(self._connection())
+
+    def clear(self):
+        with self._lock:
+            self._connection().execute('DELETE FROM responses')
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+
+    def _evict(self, conn):
+        size = self._size(conn)
+        while size > self.max_size:
+            rows = conn.execute('SELECT key, size FROM responses ORDER BY last_used LIMIT 64').fetchall()
+            for (key, row_size) in rows:
+                conn.execute('DELETE FROM responses WHERE key = ?', (key, ))
+                size -= row_size
+                if size <= self.max_size:
+                    break
+
+    def _size(self, conn) -> int:
+        return conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def _connection(self):
+        # sqlite connections can't be shared with a forked child process
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(os.path.join(self.path, 'responses.sqlite'), check_same_thread=False,
+                                         isolation_level=None, timeout=30)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB NOT NULL, '
+                               'expires REAL, last_used REAL NOT NULL, size INTEGER NOT NULL)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)')
+            self._pid = os.getpid()
+        return self._conn
+
+
+_disk_cache = None
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    '''Returns the process wide DiskCache, None unless configure_disk_cache was called'''
+    return _disk_cache
+
+
+def configure_disk_cache(**kwargs) -> DiskCache:
+    '''Enables the process wide DiskCache, kwargs are passed to DiskCache'''
+    global _disk_cache
+    if _disk_cache is not None:
+        _disk_cache.close()
+    _disk_cache = DiskCache(**kwargs)
+    return _disk_cache
+
+
+def disable_disk_cache():
+    global _disk_cache
+    if _disk_cache is not None:
+        _disk_cache.close()
+    _disk_cache = None
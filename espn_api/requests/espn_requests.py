@@ -1,8 +1,13 @@
-import requests
 import json
+from datetime import datetime
 from .constant import FANTASY_BASE_ENDPOINT, FANTASY_SPORTS
+from .session_pool import SessionPool, get_session_pool
+from .pro_data_cache import get_pro_data_cache
+from .json_decoder import JsonDecoder, get_json_decoder
+from .disk_cache import DiskCache, get_disk_cache
+from .transport import Transport
 from ..utils.logger import Logger
-from typing import List
+from typing import List, Optional, Union
 
 
 class ESPNAccessDenied(Exception):
@@ -32,15 +37,29 @@ def checkRequestStatus(status: int, cookies=None, league_id=None) -> None:
         raise ESPNUnknownError(f"ESPN returned an HTTP {status}")
 
 
+# views whose response never changes once the requested scoring period is over
+FINISHED_PERIOD_VIEWS = {'mMatchup', 'mMatchupScore', 'mScoreboard', 'mRoster', 'mPositionalRatings'}
+
+
 class EspnFantasyRequests(object):
-    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None):
+    def __init__(self, sport: str, year: int, league_id: int, cookies: dict = None, logger: Logger = None, session_pool: SessionPool = None,
+                 json_decoder: Union[str, JsonDecoder] = None, disk_cache: DiskCache = None, transport: Transport = None):
         if sport not in FANTASY_SPORTS:
             raise Exception(f'Unknown sport: {sport}, available options are {FANTASY_SPORTS.keys()}')
+        self.sport = sport
         self.year = year
         self.league_id = league_id
         self.ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/seasons/' + str(self.year)
         self.cookies = cookies
         self.logger = logger
+        self._session_pool = session_pool
+        self._json_decoder = get_json_decoder(json_decoder) if isinstance(json_decoder, str) else json_decoder
+        self._disk_cache = disk_cache
+        self.transport = transport
+        # every sports season is over by the end of the following calendar year
+        self.season_complete = year < 2018 or year < datetime.now().year - 1
+        self.latest_scoring_period = None
+        self._season_status_loaded = False
 
         self.LEAGUE_ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport]
         # older season data is stored at a different endpoint
@@ -49,23 +68,94 @@ class EspnFantasyRequests(object):
         else:
             self.LEAGUE_ENDPOINT += "/seasons/" + str(year) + "/segments/0/leagues/" + str(league_id)
 
+    @property
+    def session_pool(self) -> SessionPool:
+        '''Connections are shared by every league in the process unless a pool is given'''
+        return self._session_pool or get_session_pool()
+
+    def _send(self, endpoint: str, params: dict = None, headers: dict = None):
+        '''Sends the request through the transport, the session pool unless a transport is given'''
+        transport = self.transport or self.session_pool
+        return transport.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+
+    @property
+    def json_decoder(self) -> JsonDecoder:
+        '''Decodes response bodies, uses the fastest installed JSON library unless a decoder is given'''
+        return self._json_decoder or get_json_decoder()
+
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        '''Responses are only cached on disk after configure_disk_cache or when a cache is given.
+        Requests going through a transport always reach it'''
+        if self.transport is not None:
+            return None
+        return self._disk_cache or get_disk_cache()
+
+    def set_season_status(self, latest_scoring_period: int, season_complete: bool):
+        '''Updates which responses can be cached without an expiry from the leagues status'''
+        self.latest_scoring_period = latest_scoring_period
+        if season_complete and not self.season_complete:
+            self.season_complete = True
+            if self.disk_cache:
+                self.disk_cache.set(self._season_complete_key(), b'1')
+
+    def _season_complete_key(self) -> str:
+        return DiskCache.key(self.LEAGUE_ENDPOINT, {'season_complete': True})
+
+    def _cache_ttl(self, params: dict = None) -> Optional[float]:
+        '''Returns how long a response can be cached for, None never expires'''
+        params = params or {}
+        if not self._season_status_loaded:
+            # a previous run may have seen the season finish
+            self.season_complete = self.season_complete or self.disk_cache.get(self._season_complete_key()) is not None
+            self._season_status_loaded = True
+        if self.season_complete:
+            return None
+        views = params.get('view', [])
+        views = set(views) if isinstance(views, list) else {views}
+        scoring_period = params.get('scoringPeriodId')
+        if (scoring_period is not None and self.latest_scoring_period is not None and views and views <= FINISHED_PERIOD_VIEWS
+                and int(scoring_period) < self.latest_scoring_period):
+            return None
+        return self.disk_cache.live_ttl
+
+    def _cache_get(self, endpoint: str, params: dict = None, headers: dict = None) -> Optional[bytes]:
+        if self.disk_cache is None:
+            return None
+        return self.disk_cache.get(DiskCache.key(endpoint, params, headers, self.cookies))
+
+    def _cache_set(self, endpoint: str, params: dict, headers: dict, content: bytes):
+        if self.disk_cache is None:
+            return
+        self.disk_cache.set(DiskCache.key(endpoint, params, headers, self.cookies), content, self._cache_ttl(params))
+
     def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.LEAGUE_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        checkRequestStatus(r.status_code, cookies=self.cookies, league_id=self.league_id)
+        content = self._cache_get(endpoint, params, headers)
+        if content is None:
+            r = self._send(endpoint, params=params, headers=headers)
+            checkRequestStatus(r.status_code, cookies=self.cookies, league_id=self.league_id)
+            content = r.content
+            self._cache_set(endpoint, params, headers, content)
 
+        data = self.json_decoder(content)
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json() if self.year > 2017 else r.json()[0]
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data if self.year > 2017 else data[0]
 
     def get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
-        checkRequestStatus(r.status_code)
+        content = self._cache_get(endpoint, params, headers)
+        if content is None:
+            r = self._send(endpoint, params=params, headers=headers)
+            checkRequestStatus(r.status_code)
+            content = r.content
+            self._cache_set(endpoint, params, headers, content)
 
+        data = self.json_decoder(content)
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data
 
     def get_league(self):
         '''Gets all of the leagues initial data (teams, roster, matchups, settings)'''
@@ -76,7 +166,12 @@ class EspnFantasyRequests(object):
         return data
 
     def get_pro_schedule(self):
-        '''Gets the current sports professional team schedules'''
+        '''Gets the current sports professional team schedules, shared by every league of the sport and season'''
+        if self.transport is not None:
+            return self._get_pro_schedule()
+        return get_pro_data_cache().get_or_fetch((self.sport, self.year, 'proTeamSchedules_wl'), self._get_pro_schedule)
+
+    def _get_pro_schedule(self):
         params = {
             'view': 'proTeamSchedules_wl'
         }
@@ -84,7 +179,12 @@ class EspnFantasyRequests(object):
         return data
 
     def get_pro_players(self):
-        '''Gets the current sports professional players'''
+        '''Gets the current sports professional players, shared by every league of the sport and season'''
+        if self.transport is not None:
+            return self._get_pro_players()
+        return get_pro_data_cache().get_or_fetch((self.sport, self.year, 'players_wl'), self._get_pro_players)
+
+    def _get_pro_players(self):
         params = {
             'view': 'players_wl'
         }
@@ -132,6 +232,50 @@ class EspnFantasyRequests(object):
         data = self.league_get(params=params, headers=headers)
         return data
 
+    def get_box_scores(self, matchup_period: int, scoring_period: int):
+        '''Gets the leagues matchups and lineups for a matchup and scoring period'''
+        params = {
+            'view': ['mMatchupScore', 'mScoreboard'],
+            'scoringPeriodId': scoring_period,
+        }
+        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_period]}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+
+        data = self.league_get(params=params, headers=headers)
+        return data
+
+    def get_positional_ratings(self, scoring_period: int):
+        '''Gets the pro teams ratings against each position'''
+        params = {
+            'view': 'mPositionalRatings',
+            'scoringPeriodId': scoring_period,
+        }
+        data = self.league_get(params=params)
+        return data
+
+    def get_free_agents(self, scoring_period: int, size: int = 50, slot_filter: List[int] = None):
+        '''Gets the free agents and players on waivers for a scoring period'''
+        params = {
+            'view': 'kona_player_info',
+            'scoringPeriodId': scoring_period,
+        }
+        filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter or []},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+
+        data = self.league_get(params=params, headers=headers)
+        return data
+
+    def get_recent_activity(self, msg_types: List[int], size: int = 25, offset: int = 0):
+        '''Gets the leagues recent transaction activity'''
+        params = {
+            'view': 'kona_league_communication'
+        }
+        filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":size},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+
+        data = self.league_get(extend='/communication/', params=params, headers=headers)
+        return data
+
     # Username and password no longer works using their API without using google recaptcha
     # Possibly revisit in future if anything changes
  
@@ -0,0 +1,47 @@
+import json
+from typing import Callable, Dict, Union
+
+JsonDecoder = Callable[[Union[bytes, str]], object]
+
+
+def _available_decoders() -> Dict[str, JsonDecoder]:
+    decoders = {}
+    try:
+        import orjson
+        decoders['orjson'] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        decoders['msgspec'] = msgspec.json.decode
+    except ImportError:
+        pass
+    try:
+        import ujson
+        decoders['ujson'] = ujson.loads
+    except ImportError:
+        pass
+    decoders['json'] = json.loads
+    return decoders
+
+
+# installed decoders, fastest first
+JSON_DECODERS = _available_decoders()
+
+_json_decoder = next(iter(JSON_DECODERS.values()))
+
+
+def get_json_decoder(name: str = None) -> JsonDecoder:
+    '''Returns the named decoder, or the process wide default used for ESPN responses'''
+    if name is None:
+        return _json_decoder
+    if name not in JSON_DECODERS:
+        raise Exception(f'Unknown JSON decoder: {name}, available options are {list(JSON_DECODERS.keys())}')
+    return JSON_DECODERS[name]
+
+
+def configure_json_decoder(decoder: Union[str, JsonDecoder]) -> JsonDecoder:
+    '''Replaces the process wide decoder with an installed one by name or any function that decodes bytes'''
+    global _json_decoder
+    _json_decoder = get_json_decoder(decoder) if isinstance(decoder, str) else decoder
+    return _json_decoder
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+DEFAULT_TTL = 60 * 60
+DEFAULT_MAX_ENTRIES = 32
+
+
+class ProDataCache(object):
+    '''Thread safe cache for payloads that only depend on the sport and season, like the pro players and schedule.
+    Cached payloads are shared by every league so they must not be modified'''
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._tasks = {}
+
+    def __repr__(self):
+        return f'ProDataCache(ttl={self.ttl}, entries={len(self._entries)})'
+
+    def get(self, key: Hashable):
+        '''Returns the cached payload or None if it is missing or expired'''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            (expires, data) = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: Hashable, data):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(key)
+            # evict the least recently used payloads
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable):
+        '''Returns the cached payload, only one thread calls fetch when it is missing'''
+        data = self._lookup(key)
+        if data is not None:
+            return data
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # another thread may have fetched it while waiting for the lock
+            data = self.get(key)
+            if data is None:
+                data = fetch()
+                self.set(key, data)
+            return data
+
+    async def get_or_fetch_async(self, key: Hashable, fetch: Callable):
+        '''Returns the cached payload, concurrent coroutines share one fetch when it is missing'''
+        data = self._lookup(key)
+        if data is not None:
+            return data
+
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            self._tasks[key] = task
+        try:
+            data = await task
+        finally:
+            if self._tasks.get(key) is task and task.done():
+                del self._tasks[key]
+        self.set(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+    def _lookup(self, key: Hashable):
+        data = self.get(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+
+_pro_data_cache = ProDataCache()
+
+
+def get_pro_data_cache() -> ProDataCache:
+    '''Returns the process wide ProDataCache shared by every league'''
+    return _pro_data_cache
+
+
+def configure_pro_data_cache(**kwargs) -> ProDataCache:
+    '''Replaces the process wide ProDataCache, kwargs are passed to ProDataCache. Use ttl=0 to disable caching'''
+    global _pro_data_cache
+    _pro_data_cache = ProDataCache(**kwargs)
+    return _pro_data_cache
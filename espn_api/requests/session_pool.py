@@ -0,0 +1,80 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class SessionPool(object):
+    '''Keep-alive requests.Session with a configurable connection pool'''
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False, max_retries: int = 0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pid = os.getpid()
+        self._requests = 0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        # cookies are passed per request, never persist them between leagues
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block, max_retries=max_retries)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+    def __repr__(self):
+        return f'SessionPool(pool_maxsize={self.pool_maxsize})'
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None) -> requests.Response:
+        with self._lock:
+            self._requests += 1
+        return self.session.get(url, params=params, headers=headers, cookies=cookies)
+
+    def stats(self) -> dict:
+        '''Returns the number of requests sent and connections opened/reused by the pool'''
+        opened = 0
+        handled = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            handled += pool.num_requests
+        return {
+            'requests': self._requests,
+            'connections_opened': opened,
+            'connections_reused': max(handled - opened, 0),
+        }
+
+    def close(self):
+        self.session.close()
+
+
+_session_pool = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    '''Returns the process wide SessionPool shared by every league'''
+    global _session_pool
+    with _session_pool_lock:
+        # sockets can't be shared with a forked child process
+        if _session_pool is None or _session_pool.pid != os.getpid():
+            _session_pool = SessionPool()
+        return _session_pool
+
+
+def configure_session_pool(**kwargs) -> SessionPool:
+    '''Replaces the process wide SessionPool, kwargs are passed to SessionPool'''
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is not None and _session_pool.pid == os.getpid():
+            _session_pool.close()
+        _session_pool = SessionPool(**kwargs)
+        return _session_pool
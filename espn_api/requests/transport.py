@@ -0,0 +1,176 @@
+import glob
+import gzip
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+from typing import Optional, Tuple, Union
+
+from .disk_cache import DiskCache
+from .session_pool import SessionPool, get_session_pool
+
+Response = namedtuple('Response', ['status_code', 'content'])
+
+LEAGUE_URL_PATTERNS = [
+    re.compile(r'/seasons/(?P<year>\d+)/segments/0/leagues/(?P<league_id>\d+)'),
+    re.compile(r'/leagueHistory/(?P<league_id>\d+)\?seasonId=(?P<year>\d+)'),
+]
+
+# top level keys of a payload and the views whose response contains them
+PAYLOAD_VIEWS = {
+    'members': {'mTeam', 'mRoster', 'mMatchup', 'mSettings', 'mStandings'},
+    'schedule': {'mMatchup', 'mMatchupScore', 'mScoreboard', 'mRoster'},
+    'draftDetail': {'mDraftDetail'},
+    'transactions': {'mTransactions2'},
+    'positionAgainstOpponent': {'mPositionalRatings'},
+    'topics': {'kona_league_communication', 'kona_league_messageboard'},
+    'players': {'kona_player_info', 'kona_playercard'},
+    'display': {'proTeamSchedules_wl'},
+}
+
+
+def _request_views(params: dict = None) -> set:
+    views = (params or {}).get('view', [])
+    return set(views) if isinstance(views, list) else {views}
+
+
+def _view_hint(view: str) -> str:
+    '''The part of a view name a payload file is likely named after, mMatchupScore -> matchupscore'''
+    return re.sub(r'^(m(?=[A-Z])|kona_)|_wl$', '', view).lower()
+
+
+def _parse_league_url(url: str) -> Optional[Tuple[int, int]]:
+    '''Returns the league id and year of a league endpoint'''
+    for pattern in LEAGUE_URL_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return (int(match.group('league_id')), int(match.group('year')))
+    return None
+
+
+class RecordingTransport(object):
+    '''Sends requests through a SessionPool and appends every request and response to a gzip compressed JSON lines archive.
+    Cookies are never recorded'''
+    def __init__(self, path: str, session_pool: SessionPool = None):
+        self.path = path
+        self.recorded = 0
+        self._session_pool = session_pool
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'RecordingTransport({self.path})'
+
+    @property
+    def session_pool(self) -> SessionPool:
+        return self._session_pool or get_session_pool()
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None):
+        r = self.session_pool.get(url, params=params, headers=headers, cookies=cookies)
+        entry = {
+            'url': url,
+            'params': params,
+            'filter': (headers or {}).get('x-fantasy-filter'),
+            'status': r.status_code,
+            'body': r.content.decode('utf-8'),
+        }
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+        with self._lock:
+            # every request is its own gzip member so the archive stays readable if the process dies
+            with gzip.open(self.path, 'ab') as f:
+                f.write(line)
+            self.recorded += 1
+        return r
+
+
+class ReplayTransport(object):
+    '''Serves the responses of a RecordingTransport archive without network access.
+    A request recorded more than once is answered in the order it was recorded, the last response is repeated'''
+    def __init__(self, path: str):
+        self.path = path
+        self.league_id = None
+        self.year = None
+        self._responses = {}
+        self._served = {}
+        self._lock = threading.Lock()
+
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                key = self._key(entry['url'], entry['params'], entry['filter'])
+                self._responses.setdefault(key, []).append(Response(entry['status'], entry['body'].encode('utf-8')))
+                league = _parse_league_url(entry['url'])
+                if league and self.league_id is None:
+                    (self.league_id, self.year) = league
+
+    def __repr__(self):
+        return f'ReplayTransport({self.path})'
+
+    @staticmethod
+    def _key(url: str, params: dict = None, fantasy_filter: str = None) -> str:
+        return DiskCache.key(url, params, {'x-fantasy-filter': fantasy_filter})
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None) -> Response:
+        key = self._key(url, params, (headers or {}).get('x-fantasy-filter'))
+        responses = self._responses.get(key)
+        if not responses:
+            raise Exception(f'No recorded response for {url} with params {params} in {self.path}')
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        return responses[min(index, len(responses) - 1)]
+
+
+class JsonDirectoryTransport(object):
+    '''Serves the JSON payloads of a directory like tests/football/unit/data without network access.
+    Requests are matched to a payload by its top level keys, then the scoringPeriodId, then views named in the file name'''
+    def __init__(self, path: str):
+        self.path = path
+        self.league_id = None
+        self.year = None
+        self._payloads = []
+
+        for file_path in sorted(glob.glob(os.path.join(path, '*.json'))):
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            payload = json.loads(content)
+            # seasons before 2018 wrap the league in a list
+            if isinstance(payload, list):
+                payload = payload[0] if payload and isinstance(payload[0], dict) and 'seasonId' in payload[0] else None
+            if payload is None:
+                (views, scoring_period) = ({'players_wl'}, None)
+            else:
+                views = set().union(*(views for (key, views) in PAYLOAD_VIEWS.items() if key in payload))
+                scoring_period = payload.get('scoringPeriodId')
+                if 'members' in payload and self.league_id is None:
+                    (self.league_id, self.year) = (payload['id'], payload['seasonId'])
+            self._payloads.append((os.path.basename(file_path), views, scoring_period, Response(200, content)))
+
+    def __repr__(self):
+        return f'JsonDirectoryTransport({self.path})'
+
+    def get(self, url: str, params: dict = None, headers: dict = None, cookies: dict = None) -> Response:
+        views = _request_views(params)
+        scoring_period = (params or {}).get('scoringPeriodId')
+        hints = [_view_hint(view) for view in views]
+        candidates = []
+        for (name, payload_views, payload_scoring_period, response) in self._payloads:
+            overlap = len(views & payload_views)
+            if overlap:
+                named = any(hint in name.lower() for hint in hints)
+                rank = (-overlap, scoring_period is not None and payload_scoring_period != scoring_period, not named,
+                        len(payload_views), name)
+                candidates.append((rank, response))
+        if not candidates:
+            raise Exception(f'No payload for views {sorted(views)} in {self.path}')
+        return min(candidates, key=lambda candidate: candidate[0])[1]
+
+
+Transport = Union[SessionPool, RecordingTransport, ReplayTransport, JsonDirectoryTransport]
+
+
+def open_replay(path: str) -> Union[ReplayTransport, JsonDirectoryTransport]:
+    '''Returns a JsonDirectoryTransport for a directory, otherwise a ReplayTransport for a recorded archive'''
+    if os.path.isdir(path):
+        return JsonDirectoryTransport(path)
+    return ReplayTransport(path)
@@ -0,0 +1,103 @@
+from typing import Callable, Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class StatsStore(object):
+    '''Stats of a pool of players in a dense players x scoring periods x stats array.
+    Points are the stat named points, a stat a player has no value for in a scoring period is nan'''
+    def __init__(self, players: List, rows: Iterable[Tuple[int, int, float, Dict]], stat_name: Callable[[str], str]):
+        '''rows are (player index, scoring period, points, stats keyed by stat id), stat_name maps a stat id
+        to the name it is stored under, an empty name leaves the stat out'''
+        if np is None:
+            raise Exception('StatsStore needs NumPy, install it with pip install espn_api[numpy]')
+        self.players = players
+        self.player_index = {player.playerId: i for (i, player) in enumerate(players)}
+        self.stat_index = {'points': 0}
+        rows = list(rows)
+        self.scoring_periods = sorted({scoring_period for (i, scoring_period, points, stats) in rows})
+        period_index = {scoring_period: p for (p, scoring_period) in enumerate(self.scoring_periods)}
+
+        # the stat ids of a row -> columns of its stats and the positions of the stats that are kept, None when all are.
+        # Players share a few sets of stat ids so each set is mapped once
+        layouts = {}
+        (player_indexes, period_indexes, lengths, columns, values) = ([], [], [], [], [])
+        for (i, scoring_period, points, stats) in rows:
+            stat_ids = tuple(stats)
+            layout = layouts.get(stat_ids)
+            if layout is None:
+                names = [stat_name(stat_id) for stat_id in stat_ids]
+                kept = [k for (k, name) in enumerate(names) if name]
+                layout = layouts[stat_ids] = ([0] + [self.stat_index.setdefault(names[k], len(self.stat_index)) for k in kept],
+                                              None if len(kept) == len(names) else kept)
+            player_indexes.append(i)
+            period_indexes.append(period_index[scoring_period])
+            lengths.append(len(layout[0]))
+            columns.extend(layout[0])
+            values.append(points)
+            if layout[1] is None:
+                values.extend(stats.values())
+            else:
+                row_values = list(stats.values())
+                values.extend(row_values[k] for k in layout[1])
+
+        self.stats = list(self.stat_index)
+        self.values = np.full((len(players), len(self.scoring_periods), len(self.stats)), np.nan)
+        lengths = np.array(lengths, dtype=int)
+        self.values[np.repeat(np.array(player_indexes, dtype=int), lengths), np.repeat(np.array(period_indexes, dtype=int), lengths),
+                    np.array(columns, dtype=int)] = values
+
+    @classmethod
+    def from_players(cls, players: List, stat_name: Callable[[str], str], projected: bool = False) -> 'StatsStore':
+        '''Builds the store from the raw stats the players were parsed with, projected stores their projections'''
+        rows = ((i, scoring_period, points, stats) for (i, player) in enumerate(players)
+                for (scoring_period, points, stats) in player._stats_store_rows(projected))
+        return cls(players, rows, stat_name)
+
+    def __repr__(self):
+        return f'StatsStore({len(self.players)} players, {len(self.scoring_periods)} scoring periods, {len(self.stats)} stats)'
+
+    def window(self, stat: str, start: int = None, end: int = None):
+        '''Returns a players x scoring periods array of the stat in the scoring periods from start to end'''
+        if stat not in self.stat_index:
+            raise Exception(f'Unknown stat: {stat}')
+        periods = np.array(self.scoring_periods, dtype=int)
+        in_window = np.ones(len(periods), dtype=bool)
+        if start is not None:
+            in_window &= periods >= start
+        if end is not None:
+            in_window &= periods <= end
+        return self.values[:, in_window, self.stat_index[stat]]
+
+    def window_sum(self, stat: str, start: int = None, end: int = None):
+        '''Returns each players total of the stat from start to end'''
+        return np.nansum(self.window(stat, start, end), axis=1)
+
+    def window_average(self, stat: str, start: int = None, end: int = None):
+        '''Returns each players average of the stat over the scoring periods from start to end they have stats for,
+        nan for a player without any'''
+        window = self.window(stat, start, end)
+        counts = np.sum(~np.isnan(window), axis=1)
+        averages = np.full(len(self.players), np.nan)
+        np.divide(np.nansum(window, axis=1), counts, out=averages, where=counts > 0)
+        return averages
+
+    def rank(self, stat: str, start: int = None, end: int = None, average: bool = False):
+        '''Returns each players rank by the stat from start to end, 1 is the highest and tied players share a rank.
+        average ranks by window_average, players without stats are ranked last'''
+        values = self.window_average(stat, start, end) if average else self.window_sum(stat, start, end)
+        values = np.where(np.isnan(values), -np.inf, values)
+        return np.searchsorted(np.sort(-values), -values, side='left') + 1
+
+    def top(self, stat: str, start: int = None, end: int = None, average: bool = False, position: str = None, size: int = 10) -> List[Tuple[object, float]]:
+        '''Returns the (player, value) of the size players with the most of the stat from start to end, highest first.
+        position only ranks the players who play it'''
+        values = self.window_average(stat, start, end) if average else self.window_sum(stat, start, end)
+        candidates = np.flatnonzero(~np.isnan(values))
+        if position is not None:
+            candidates = np.array([i for i in candidates if getattr(self.players[i], 'position', None) == position], dtype=int)
+        order = candidates[np.argsort(-values[candidates], kind='stable')][:size]
+        return [(self.players[i], float(values[i])) for i in order]
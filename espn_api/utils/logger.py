@@ -2,14 +2,37 @@ import logging
 import sys
 import json
 
+class LazyJson(object):
+    '''Serializes a response only if the log record is emitted'''
+    def __init__(self, response, max_length: int = None):
+        self.response = response
+        self.max_length = max_length
+
+    def __str__(self):
+        if self.max_length is None:
+            return json.dumps(self.response)
+        # encode a chunk at a time and stop once max_length is reached instead of serializing the whole response
+        chunks = []
+        length = 0
+        for chunk in json.JSONEncoder().iterencode(self.response):
+            chunks.append(chunk)
+            length += len(chunk)
+            if length > self.max_length:
+                return f'{"".join(chunks)[:self.max_length]}... (truncated)'
+        return ''.join(chunks)
+
+
 class Logger(object):
-    def __init__(self, name: str, debug=False):
+    def __init__(self, name: str, debug=False, max_response_length: int = None):
         level = logging.DEBUG if debug else logging.INFO
         self.logging = logging.getLogger(name)
+        # cap the logged response size, None logs the full payload
+        self.max_response_length = max_response_length
 
         # if logger already exists don't add handlers
         if len(self.logging.handlers):
             self.logging.handlers[0].setLevel(level)
+            self.logging.setLevel(level)
             return
 
         handler = logging.StreamHandler(sys.stdout)
@@ -21,8 +44,10 @@ class Logger(object):
         self.logging.setLevel(level)
 
     def log_request(self, endpoint: str, response: dict, params: dict = None, headers: dict = None):
-        log = f'ESPN API Request: url: {endpoint} params: {params} headers: {headers} \nESPN API Response: {json.dumps(response)}'
-        self.logging.debug(log)
+        if not self.logging.isEnabledFor(logging.DEBUG):
+            return
+        self.logging.debug('ESPN API Request: url: %s params: %s headers: %s \nESPN API Response: %s',
+                           endpoint, params, headers, LazyJson(response, self.max_response_length))
 
 
 
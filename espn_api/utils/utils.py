@@ -19,3 +19,57 @@ def json_parsing(obj, key):
 
     results = extract(obj, arr, key)
     return results[0] if results else results
+
+def json_parsing_keys(obj, keys, skip=()):
+    """Pull the first value of each key from nested JSON in a single pass.
+    The values of the keys in skip aren't searched."""
+    wanted = set(keys)
+    found = {}
+
+    def extract(obj):
+        """Return True once every key has been found."""
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                if k in skip:
+                    continue
+                if isinstance(v, (dict)) or (isinstance(v, (list)) and  v and isinstance(v[0], (list, dict))):
+                    if extract(v):
+                        return True
+                elif k in wanted and k not in found:
+                    found[k] = v
+                    if len(found) == len(wanted):
+                        return True
+        elif isinstance(obj, list):
+            for item in obj:
+                if extract(item):
+                    return True
+        return False
+
+    extract(obj)
+    # missing keys match json_parsing's empty result
+    return {key: found.get(key, []) for key in keys}
+
+# stat id tuples shared by every compacted stats dict with the same stat ids
+_stat_ids = {}
+_STAT_IDS_SIZE = 1024
+
+def compact_stats(stats: dict) -> tuple:
+    """Returns the stat ids and values of a stats dict. The stat ids are shared by every dict with the same ids
+    so a players stats take a fraction of the memory of the dicts until they are read"""
+    ids = tuple(stats)
+    shared = _stat_ids.get(ids)
+    if shared is None:
+        if len(_stat_ids) >= _STAT_IDS_SIZE:
+            _stat_ids.clear()
+        shared = _stat_ids[ids] = ids
+    return (shared, tuple(stats.values()))
+
+def get_player_identity(player: dict, identities: dict, identity_class):
+    """Returns the identity_class of the players json from a leagues identities by playerId,
+    parsed when the player is new or no longer matches it. Without identities it is always parsed."""
+    if identities is None:
+        return identity_class(player)
+    identity = identities.get(player['id'])
+    if identity is None or not identity.matches(player):
+        identity = identities[player['id']] = identity_class(player)
+    return identity
@@ -0,0 +1,50 @@
+import asyncio
+from typing import List, Tuple
+
+from ..base_async_league import BaseAsyncLeague
+from .league import League
+from .box_score import BoxScore
+from .player import Player
+from .activity import Activity
+from .constant import POSITION_MAP
+
+
+class AsyncLeague(BaseAsyncLeague, League):
+    '''League where fetch_league, box_scores, scoreboard, free_agents and recent_activity are coroutines'''
+
+    async def recent_activity(self, size: int = 25, msg_type: str = None, offset: int = 0) -> List[Activity]:
+        '''Returns a list of recent league activities (Add, Drop, Trade)'''
+        if self.year < 2019:
+            raise Exception('Cant use recent activity before 2019')
+
+        msg_types = self._get_activity_msg_types(msg_type)
+        data = await self.espn_request.get_recent_activity(msg_types, size=size, offset=offset)
+        return self._parse_activity(data)
+
+    async def free_agents(self, week: int = None, size: int = 50, position: str = None, position_id: int = None) -> List[Player]:
+        '''Returns a List of Free Agents for a Given Week\n
+        Should only be used with most recent season'''
+        if self.year < 2019:
+            raise Exception('Cant use free agents before 2019')
+        if not week:
+            week = self.current_week
+
+        slot_filter = self._get_slot_filter(POSITION_MAP, position, position_id)
+        data = await self.espn_request.get_free_agents(week, size=size, slot_filter=slot_filter)
+        return self._parse_free_agents(data)
+
+    async def box_scores(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> List[BoxScore]:
+        '''Returns list of box score for a given matchup or scoring period'''
+        (data, parse_args) = await self._get_box_score_data(matchup_period, scoring_period, matchup_total)
+        return self._parse_box_scores(data, *parse_args)
+
+    async def _get_box_score_data(self, matchup_period: int = None, scoring_period: int = None, matchup_total: bool = True) -> Tuple[dict, tuple]:
+        if self.year < 2019:
+            raise Exception('Cant use box score before 2019')
+        (matchup_id, scoring_id) = self._get_box_score_periods(matchup_period, scoring_period)
+
+        (data, pro_schedule) = await asyncio.gather(
+            self.espn_request.get_box_scores(matchup_id, scoring_id),
+            self._get_pro_schedule(scoring_id),
+        )
+        return (data, (pro_schedule, matchup_total, scoring_id))
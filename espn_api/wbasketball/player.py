@@ -1,18 +1,32 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import compact_stats, json_parsing_keys
+from functools import cached_property
+
+def _map_stats(breakdown):
+    if breakdown is None:
+        return None
+    (ids, values) = breakdown
+    return {STATS_MAP[i]: value for (i, value) in zip(ids, values) if STATS_MAP[i] != ''}
 
 class Player(object):
-    '''Player are part of team'''
+    '''Player are part of team, stats are built on first access'''
+    # __dict__ holds the cached properties
+    __slots__ = ('name', 'playerId', 'position', 'lineupSlot', 'eligibleSlots', 'acquisitionType', 'proTeam',
+                 'injuryStatus', '_stat_splits', 'injured', 'total_points', 'avg_points', 'projected_total_points',
+                 'projected_avg_points', '__dict__')
+
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId')]
+        # the stats and rankings are most of the players json and hold none of the fields
+        fields = json_parsing_keys(data, ['fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'acquisitionType', 'proTeamId', 'injuryStatus'],
+                                   skip=('stats', 'rankings'))
+        self.name = fields['fullName']
+        self.playerId = fields['id']
+        self.position = POSITION_MAP[fields['defaultPositionId']]
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.stats = {}
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in fields['eligibleSlots']]
+        self.acquisitionType = fields['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[fields['proTeamId']]
+        self.injuryStatus = fields['injuryStatus']
 
         # add available stats
 
@@ -20,26 +34,29 @@ class Player(object):
         self.injuryStatus = player.get('injuryStatus', self.injuryStatus)
         self.injured = player.get('injured', False)
 
+        # the points and compacted (averages, totals) of each split by stat id, the averages and totals are mapped when stats are read.
+        # A split without stats has no breakdowns and one without average stats has them both None
+        self._stat_splits = {}
         for split in player.get('stats', []):
-            id = self._stat_id_pretty(split['id'])
-            applied_total = split.get('appliedTotal', 0)
-            applied_avg =  round(split.get('appliedAverage', 0), 2)
-            self.stats[id] = dict(applied_total=applied_total, applied_avg=applied_avg)
+            breakdowns = None
             if 'stats' in split:
-                if 'averageStats' in split.keys():
-                    self.stats[id]['avg'] = {STATS_MAP[i]: split['averageStats'][i] for i in split['averageStats'].keys() if STATS_MAP[i] != ''}
-                    self.stats[id]['total'] = {STATS_MAP[i]: split['stats'][i] for i in split['stats'].keys() if STATS_MAP[i] != ''}
-                else:
-                    self.stats[id]['avg'] = None
-                    self.stats[id]['total'] = None
-        self.total_points = self.stats.get(f'{year}', {}).get('applied_total', 0)
-        self.avg_points = self.stats.get(f'{year}', {}).get('applied_avg', 0)
-        self.projected_total_points= self.stats.get(f'{year}_projected', {}).get('applied_total', 0)
-        self.projected_avg_points = self.stats.get(f'{year}_projected', {}).get('applied_avg', 0)
-            
+                breakdowns = (compact_stats(split['averageStats']), compact_stats(split['stats'])) if 'averageStats' in split else (None, None)
+            self._stat_splits[self._stat_id_pretty(split['id'])] = (split.get('appliedTotal', 0), round(split.get('appliedAverage', 0), 2), breakdowns)
+        (self.total_points, self.avg_points) = self._stat_splits.get(f'{year}', (0, 0))[:2]
+        (self.projected_total_points, self.projected_avg_points) = self._stat_splits.get(f'{year}_projected', (0, 0))[:2]
+
     def __repr__(self):
         return f'Player({self.name})'
     
     def _stat_id_pretty(self, id: str):
         id_type = STAT_ID_MAP.get(id[:2])
-        return f'{id[2:]}_{id_type}' if id_type else id[2:]
\ No newline at end of file
+        return f'{id[2:]}_{id_type}' if id_type else id[2:]
+
+    @cached_property
+    def stats(self):
+        stats = {}
+        for (id, (applied_total, applied_avg, breakdowns)) in self._stat_splits.items():
+            stats[id] = dict(applied_total=applied_total, applied_avg=applied_avg)
+            if breakdowns is not None:
+                (stats[id]['avg'], stats[id]['total']) = [_map_stats(breakdown) for breakdown in breakdowns]
+        return stats
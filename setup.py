@@ -16,6 +16,7 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     install_requires=['requests>=2.0.0,<3.0.0'],
+    extras_require={'async': ['aiohttp>=3.8'], 'fast-json': ['orjson'], 'numpy': ['numpy']},
     setup_requires=['nose>=1.0'],
     test_suite='nose.collector',
     tests_require=['nose', 'requests_mock', 'coverage'],
@@ -0,0 +1,104 @@
+import asyncio
+import tempfile
+import threading
+from unittest import TestCase, mock
+
+import requests_mock
+
+from espn_api.requests.async_espn_requests import AsyncEspnFantasyRequests
+from espn_api.requests.disk_cache import DiskCache
+from espn_api.requests.espn_requests import ESPNAccessDenied, EspnFantasyRequests
+
+
+class DiskCacheTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(path=self.directory.name, max_size=100, live_ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    @mock.patch('espn_api.requests.disk_cache.time.time')
+    def test_ttl_and_eviction(self, mock_time):
+        mock_time.return_value = 1000
+        self.cache.set('live', b'a' * 40, ttl=60)
+        self.cache.set('past', b'b' * 40)
+        mock_time.return_value = 1001
+        self.assertEqual(self.cache.get('live'), b'a' * 40)
+
+        # past was used least recently so it is evicted first
+        mock_time.return_value = 1002
+        self.cache.set('new', b'c' * 40)
+        self.assertIsNone(self.cache.get('past'))
+        self.assertEqual(self.cache.size(), 80)
+
+        mock_time.return_value = 1061
+        self.assertIsNone(self.cache.get('live'))
+        self.assertEqual(self.cache.get('new'), b'c' * 40)
+
+        # responses are kept between processes
+        self.cache.close()
+        self.assertEqual(DiskCache(path=self.directory.name).get('new'), b'c' * 40)
+
+    @requests_mock.Mocker()
+    def test_request_ttls(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', year=2100, league_id=1234, disk_cache=self.cache)
+        self.cache.max_size = 1024 * 1024
+        mock_request.get(request.LEAGUE_ENDPOINT, json={'schedule': []})
+        request.set_season_status(latest_scoring_period=5, season_complete=False)
+
+        with mock.patch.object(self.cache, 'set', wraps=self.cache.set) as mock_set:
+            request.get_box_scores(matchup_period=5, scoring_period=5)
+            self.assertEqual(mock_set.call_args[0][2], 60)
+            request.get_box_scores(matchup_period=4, scoring_period=4)
+            self.assertIsNone(mock_set.call_args[0][2])
+            request.get_free_agents(scoring_period=4)
+            self.assertEqual(mock_set.call_args[0][2], 60)
+
+        self.assertEqual(request.get_box_scores(matchup_period=4, scoring_period=4), {'schedule': []})
+        self.assertEqual(mock_request.call_count, 3)
+
+        request.set_season_status(latest_scoring_period=18, season_complete=True)
+        self.assertEqual(request._cache_ttl({'view': 'kona_player_info'}), None)
+        # a new league object remembers the season is over
+        other = EspnFantasyRequests(sport='nfl', year=2100, league_id=1234, disk_cache=self.cache)
+        self.assertFalse(other.season_complete)
+        self.assertIsNone(other._cache_ttl({'view': 'mTeam'}))
+        self.assertTrue(other.season_complete)
+
+    @requests_mock.Mocker()
+    def test_private_league_not_shared(self, mock_request):
+        self.cache.max_size = 1024 * 1024
+        private = EspnFantasyRequests(sport='nfl', year=2100, league_id=1234, cookies={'espn_s2': 's2', 'SWID': '{swid}'}, disk_cache=self.cache)
+        mock_request.get(private.LEAGUE_ENDPOINT, json={'teams': []})
+        self.assertEqual(private.get_league(), {'teams': []})
+        self.assertEqual(private.get_league(), {'teams': []})
+        self.assertEqual(mock_request.call_count, 1)
+
+        # a request without the credentials reaches ESPN instead of the cached private response
+        public = EspnFantasyRequests(sport='nfl', year=2100, league_id=1234, disk_cache=self.cache)
+        mock_request.get(public.LEAGUE_ENDPOINT, status_code=401)
+        with self.assertRaises(ESPNAccessDenied):
+            public.get_league()
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_async_request(self):
+        self.cache.max_size = 1024 * 1024
+        request = AsyncEspnFantasyRequests(sport='nfl', year=2100, league_id=1234, disk_cache=self.cache)
+        threads = []
+
+        def get(key):
+            threads.append(threading.current_thread())
+            return DiskCache.get(self.cache, key)
+
+        async def fetch():
+            return [await request.get_league(), await request.get_league()]
+
+        with mock.patch.object(request, '_send_async', new_callable=mock.AsyncMock, return_value=(200, b'{"teams": []}')) as mock_send, \
+                mock.patch.object(self.cache, 'get', side_effect=get):
+            self.assertEqual(asyncio.run(fetch()), [{'teams': []}] * 2)
+        mock_send.assert_called_once()
+        # sqlite is never used on the event loop thread
+        self.assertTrue(threads)
+        self.assertNotIn(threading.main_thread(), threads)
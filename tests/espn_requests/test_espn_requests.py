@@ -2,6 +2,9 @@ from unittest import mock, TestCase
 import requests_mock
 import io
 from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.session_pool import SessionPool, get_session_pool
+from espn_api.utils.logger import LazyJson, Logger
+from espn_api.hockey import League, AsyncLeague
 
 class EspnRequestsTest(TestCase):
 
@@ -11,6 +14,46 @@ class EspnRequestsTest(TestCase):
         url_api_key = 'https://registerdisney.go.com/jgc/v5/client/ESPN-FANTASYLM-PROD/api-key?langPref=en-US'
         mock_request.post(url_api_key, status_code=400)
 
+    @requests_mock.Mocker()
+    @mock.patch('espn_api.utils.logger.json.dumps')
+    def test_request_logging_disabled(self, mock_request, mock_dumps):
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, logger=Logger(name='nfl request test'))
+        mock_request.get(request.LEAGUE_ENDPOINT, text='{"teams": []}')
+
+        self.assertEqual(request.league_get(), {'teams': []})
+        mock_dumps.assert_not_called()
+
+    @requests_mock.Mocker()
+    def test_request_logging_truncated(self, mock_request):
+        logger = Logger(name='nfl debug request test', debug=True, max_response_length=10)
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, logger=logger)
+        mock_request.get(request.LEAGUE_ENDPOINT, json={'teams': ['a' * 100]})
+
+        with self.assertLogs('nfl debug request test', level='DEBUG') as logs:
+            request.league_get()
+        self.assertTrue(logs.output[0].endswith('ESPN API Response: {"teams": ... (truncated)'))
+
+    def test_lazy_json_truncated(self):
+        # the object after the truncation point would fail to serialize if the whole response was encoded
+        response = {'teams': ['a' * 100, object()]}
+        self.assertEqual(str(LazyJson(response, max_length=10)), '{"teams": ... (truncated)')
+        self.assertEqual(str(LazyJson({'teams': []}, max_length=13)), '{"teams": []}')
+
+    def test_league_max_response_length(self):
+        leagues = [
+            League(league_id=1234, year=2019, fetch_league=False, max_response_length=10),
+            AsyncLeague(league_id=1234, year=2019, max_response_length=10),
+        ]
+        for league in leagues:
+            self.assertEqual(league.logger.max_response_length, 10)
+            self.assertIs(league.espn_request.logger, league.logger)
+
+    def test_league_session_pool(self):
+        pool = SessionPool()
+        league = League(league_id=1234, year=2019, fetch_league=False, session_pool=pool)
+        self.assertIs(league.espn_request.session_pool, pool)
+        self.assertIs(League(league_id=1234, year=2019, fetch_league=False).espn_request.session_pool, get_session_pool())
+
     # @requests_mock.Mocker()
     # @mock.patch('sys.stdout', new_callable=io.StringIO)
     # def test_authentication_api_fail(self, mock_request, mock_stdout):
@@ -0,0 +1,31 @@
+import json
+from unittest import TestCase, mock
+
+import requests_mock
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.json_decoder import JSON_DECODERS, configure_json_decoder, get_json_decoder
+
+
+class JsonDecoderTest(TestCase):
+    def tearDown(self):
+        configure_json_decoder(next(iter(JSON_DECODERS)))
+
+    def test_get_json_decoder(self):
+        self.assertIs(get_json_decoder('json'), json.loads)
+        self.assertEqual(list(JSON_DECODERS)[-1], 'json')
+        with self.assertRaises(Exception):
+            get_json_decoder('simdjson')
+
+    @requests_mock.Mocker()
+    def test_request_decoder(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, json_decoder='json')
+        mock_request.get(request.LEAGUE_ENDPOINT, json={'teams': [1, 2]})
+        self.assertIs(request.json_decoder, json.loads)
+        self.assertEqual(request.league_get(), {'teams': [1, 2]})
+
+        decoder = mock.Mock(return_value={'teams': []})
+        configure_json_decoder(decoder)
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        self.assertEqual(request.league_get(), {'teams': []})
+        decoder.assert_called_once_with(b'{"teams": [1, 2]}')
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase, mock
+
+from espn_api.requests.async_espn_requests import AsyncEspnFantasyRequests
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.pro_data_cache import ProDataCache, configure_pro_data_cache
+
+
+class ProDataCacheTest(TestCase):
+    def setUp(self):
+        self.cache = configure_pro_data_cache()
+
+    def tearDown(self):
+        configure_pro_data_cache()
+
+    @mock.patch.object(EspnFantasyRequests, 'get')
+    def test_shared_between_leagues(self, mock_get):
+        mock_get.return_value = [{'id': 1, 'fullName': 'Player'}]
+
+        for league_id in range(5):
+            request = EspnFantasyRequests(sport='nfl', year=2019, league_id=league_id)
+            self.assertEqual(request.get_pro_players(), [{'id': 1, 'fullName': 'Player'}])
+        mock_get.assert_called_once()
+
+        EspnFantasyRequests(sport='nfl', year=2018, league_id=1).get_pro_players()
+        EspnFantasyRequests(sport='nba', year=2019, league_id=1).get_pro_players()
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.cache.hits, 4)
+
+    @mock.patch.object(EspnFantasyRequests, 'get')
+    def test_single_fetch_across_threads(self, mock_get):
+        def slow_get(**kwargs):
+            time.sleep(0.05)
+            return {'settings': {'proTeams': []}}
+        mock_get.side_effect = slow_get
+
+        requests = [EspnFantasyRequests(sport='nfl', year=2019, league_id=league_id) for league_id in range(8)]
+        threads = [threading.Thread(target=request.get_pro_schedule) for request in requests]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        mock_get.assert_called_once()
+
+    @mock.patch('espn_api.requests.pro_data_cache.time.monotonic')
+    def test_ttl_and_eviction(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        cache = ProDataCache(ttl=10, max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        # b was the least recently used entry
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+
+        mock_monotonic.return_value = 11
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get_or_fetch('a', lambda: 4), 4)
+
+        disabled = ProDataCache(ttl=0)
+        disabled.set('a', 1)
+        self.assertIsNone(disabled.get('a'))
+
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get', new_callable=mock.AsyncMock)
+    def test_async_single_fetch(self, mock_get):
+        mock_get.return_value = {'settings': {'proTeams': []}}
+        requests = [AsyncEspnFantasyRequests(sport='nfl', year=2019, league_id=league_id) for league_id in range(5)]
+
+        async def fetch():
+            return await asyncio.gather(*[request.get_pro_schedule() for request in requests])
+
+        self.assertEqual(asyncio.run(fetch()), [{'settings': {'proTeams': []}}] * 5)
+        self.assertEqual(asyncio.run(fetch()), [{'settings': {'proTeams': []}}] * 5)
+        mock_get.assert_awaited_once()
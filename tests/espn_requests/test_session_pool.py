@@ -0,0 +1,101 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase, skipIf
+
+from espn_api.requests import async_espn_requests
+from espn_api.requests.async_espn_requests import AsyncEspnFantasyRequests, AsyncSessionPool, encode_params
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.session_pool import SessionPool, configure_session_pool, get_session_pool
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'espn_s2=leaked; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SessionPoolTest(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), JsonHandler)
+        self.url = 'http://127.0.0.1:%s' % self.server.server_port
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_reused(self):
+        pool = SessionPool(pool_maxsize=2)
+        for i in range(5):
+            self.assertEqual(pool.get(self.url + '/%s' % i).json(), {'path': '/%s' % i})
+
+        stats = pool.stats()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['connections_reused'], 4)
+        self.assertEqual(len(pool.session.cookies), 0)
+        pool.close()
+
+    def test_shared_pool(self):
+        pool = configure_session_pool(pool_maxsize=4)
+        self.assertIs(get_session_pool(), pool)
+
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234)
+        other = EspnFantasyRequests(sport='nba', year=2019, league_id=4321)
+        self.assertIs(request.session_pool, pool)
+        self.assertIs(other.session_pool, pool)
+
+        request.ENDPOINT = self.url
+        other.ENDPOINT = self.url
+        request.get(extend='/nfl')
+        other.get(extend='/nba')
+        self.assertEqual(pool.stats()['connections_reused'], 1)
+
+        pool.close()
+
+        own_pool = SessionPool()
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, session_pool=own_pool)
+        self.assertIs(request.session_pool, own_pool)
+
+    def test_async_requests(self):
+        request = AsyncEspnFantasyRequests(sport='nfl', year=2019, league_id=1234, session_pool=AsyncSessionPool())
+        request.ENDPOINT = self.url
+
+        async def fetch():
+            responses = await asyncio.gather(request.get(extend='/nfl', params={'view': ['mTeam', 'mRoster']}),
+                                             request.get(extend='/nba'))
+            await request.async_session_pool.close()
+            return responses
+
+        self.assertEqual(asyncio.run(fetch()), [{'path': '/nfl?view=mTeam&view=mRoster'}, {'path': '/nba'}])
+        self.assertEqual(encode_params({'view': ['mTeam', 'mRoster'], 'scoringPeriodId': 1}),
+                         [('view', 'mTeam'), ('view', 'mRoster'), ('scoringPeriodId', '1')])
+
+    @skipIf(async_espn_requests.aiohttp is None, 'aiohttp is not installed')
+    def test_async_session_replaced_per_loop(self):
+        pool = AsyncSessionPool()
+        sessions = []
+
+        async def fetch():
+            await pool.get(self.url + '/nfl')
+            sessions.append(pool._session)
+
+        # every asyncio.run has its own event loop, the session of the last one is closed before it is replaced
+        asyncio.run(fetch())
+        asyncio.run(fetch())
+        self.assertTrue(sessions[0].closed)
+        self.assertFalse(sessions[1].closed)
+        asyncio.run(pool.close())
+        self.assertTrue(sessions[1].closed)
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import requests_mock
+
+from espn_api.hockey import League
+from espn_api.requests.espn_requests import EspnFantasyRequests
+from espn_api.requests.transport import JsonDirectoryTransport, RecordingTransport, ReplayTransport, open_replay
+
+
+class TransportTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'league.jsonl.gz')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @requests_mock.Mocker()
+    def test_record_and_replay(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, transport=RecordingTransport(self.path),
+                                      cookies={'espn_s2': 'secret', 'SWID': 'secret'})
+        mock_request.get(request.LEAGUE_ENDPOINT, [{'json': {'week': 1}}, {'json': {'week': 2}}, {'json': {'card': True}}])
+        self.assertEqual(request.get_box_scores(matchup_period=1, scoring_period=1), {'week': 1})
+        self.assertEqual(request.get_box_scores(matchup_period=1, scoring_period=1), {'week': 2})
+        self.assertEqual(request.get_player_card([1, 2], 1), {'card': True})
+        self.assertEqual(request.transport.recorded, 3)
+        with open(self.path, 'rb') as f:
+            self.assertNotIn(b'secret', f.read())
+
+        transport = open_replay(self.path)
+        self.assertIsInstance(transport, ReplayTransport)
+        self.assertEqual((transport.league_id, transport.year), (1234, 2019))
+        request = EspnFantasyRequests(sport='nfl', year=2019, league_id=1234, transport=transport)
+        # repeated requests are served in the order they were recorded
+        self.assertEqual(request.get_box_scores(matchup_period=1, scoring_period=1), {'week': 1})
+        self.assertEqual(request.get_box_scores(matchup_period=1, scoring_period=1), {'week': 2})
+        self.assertEqual(request.get_box_scores(matchup_period=1, scoring_period=1), {'week': 2})
+        self.assertEqual(request.get_player_card([1, 2], 1), {'card': True})
+        with self.assertRaises(Exception):
+            request.get_player_card([3], 1)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_league_from_directory(self):
+        transport = open_replay('tests/hockey/unit/data')
+        self.assertIsInstance(transport, JsonDirectoryTransport)
+
+        league = League.from_replay('tests/hockey/unit/data')
+        self.assertEqual((league.league_id, league.year), (40384, 2020))
+        self.assertEqual(len(league.teams), 10)
+        self.assertEqual(league.box_scores()[0].away_score, 0)
+        self.assertEqual(len(league.scoreboard()), 5)
+        self.assertEqual(league.free_agents()[0].name, 'Brendan  Gallagher')
@@ -0,0 +1,59 @@
+import json
+import os
+import random
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+class FakeTeam(object):
+    '''The parts of a football Team that standings, power rankings and playoff odds read'''
+    def __init__(self, team_id, division_id=0):
+        self.team_id = team_id
+        self.division_id = division_id
+        self.scores = []
+        self.mov = []
+        self.outcomes = []
+        self.schedule = []
+
+    def __repr__(self):
+        return 'Team(%s)' % self.team_id
+
+
+def outcome(score, opponent_score):
+    return 'W' if score > opponent_score else 'L' if score < opponent_score else 'T'
+
+
+def add_game(home, away, home_score, away_score, played=True):
+    '''Adds a game to both teams, a game that is not played yet has the outcome U'''
+    for (team, opponent, score, opponent_score) in [(home, away, home_score, away_score), (away, home, away_score, home_score)]:
+        team.scores.append(score)
+        team.mov.append(score - opponent_score)
+        team.schedule.append(opponent)
+        team.outcomes.append(outcome(score, opponent_score) if played else 'U')
+
+
+def fixture_teams(played_weeks=None, division_count=2):
+    '''Teams of the 2018 league fixture playing its regular season, weeks after played_weeks are not played yet.
+    The fixture has no divisions so teams are split by team_id'''
+    with open(os.path.join(DATA_DIR, 'league_matchupScore_2018.json')) as f:
+        data = json.load(f)
+
+    teams = {}
+    matchups = [matchup for matchup in data['schedule'] if matchup['playoffTierType'] == 'NONE']
+    for matchup in sorted(matchups, key=lambda x: x['matchupPeriodId']):
+        (home, away) = [teams.setdefault(matchup[side]['teamId'], FakeTeam(matchup[side]['teamId'], matchup[side]['teamId'] % division_count))
+                        for side in ('home', 'away')]
+        played = played_weeks is None or matchup['matchupPeriodId'] <= played_weeks
+        add_game(home, away, matchup['home']['totalPoints'], matchup['away']['totalPoints'], played)
+    return sorted(teams.values(), key=lambda x: x.team_id)
+
+
+def random_teams(team_count, weeks, scores, seed, division_count=2):
+    '''A season of random pairings, a few distinct scores make every tiebreaker come up'''
+    rng = random.Random(seed)
+    teams = [FakeTeam(team_id, team_id % division_count) for team_id in range(1, team_count + 1)]
+    for week in range(weeks):
+        order = rng.sample(teams, len(teams))
+        for (home, away) in zip(order[::2], order[1::2]):
+            add_game(home, away, rng.choice(scores), rng.choice(scores))
+    return teams
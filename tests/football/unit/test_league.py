@@ -474,11 +474,43 @@ class LeagueTest(TestCase):
         with open('tests/football/unit/data/league_recent_activity_2019.json') as f:
             data = json.loads(f.read())
         m.get(self.espn_endpoint + '/communication/?view=kona_league_communication', status_code=200, json=data)
-        m.get(self.espn_endpoint + '?view=kona_playercard', status_code=200, json=self.player_card_data)
+        # answer every requested id with a copy of the player card
+        def player_cards(request, context):
+            player_ids = json.loads(request.headers['x-fantasy-filter'])['players']['filterIds']['value']
+            card = self.player_card_data['players'][0]
+            return {'players': [dict(card, id=player_id, player=dict(card['player'], id=player_id)) for player_id in player_ids]}
+        m.get(self.espn_endpoint + '?view=kona_playercard', status_code=200, json=player_cards)
 
         activity  = league.recent_activity()
         self.assertEqual(repr(activity[0].actions[0][0]), 'Team(Perscription Mixon)')
-        self.assertEqual(len(repr(activity)), 2765)
+        actions = [(getattr(team, 'team_id', None), action, player.playerId) for item in activity for (team, action, player, bid_amount) in item.actions]
+        self.assertEqual(actions, [
+            (11, 'FA ADDED', -16001), (11, 'DROPPED', -16021), (10, 'FA ADDED', 17437), (4, 'DROPPED', 9354),
+            (4, 'FA ADDED', 17372), (1, 'DROPPED', 13934), (1, 'FA ADDED', 3051738), (None, 'TRADED', 3043234),
+            (3, 'DROPPED', 2971573), (1, 'WAIVER ADDED', -16011), (1, 'DROPPED', 2969962), (5, 'WAIVER ADDED', 4527),
+            (5, 'DROPPED', 16974), (3, 'DROPPED', -16010), (3, 'WAIVER ADDED', 3128452), (4, 'WAIVER ADDED', 12483),
+            (4, 'DROPPED', 16760), (1, 'WAIVER ADDED', 3917792), (11, 'WAIVER ADDED', 3045127), (11, 'DROPPED', -16027),
+            (10, 'WAIVER ADDED', -16030), (10, 'DROPPED', -16025), (2, 'DROPPED', 4361606), (1, 'DROPPED', -16006),
+            (8, 'DROPPED', 3128429), (8, 'FA ADDED', 3124084), (2, 'FA ADDED', 4361606), (4, 'FA ADDED', 4047650),
+            (7, 'FA ADDED', 3127292), (7, 'DROPPED', 12537), (5, 'FA ADDED', 5529), (5, 'DROPPED', 2979477),
+            (10, 'FA ADDED', 2971618), (10, 'DROPPED', 3052876), (2, 'WAIVER ADDED', -16009), (2, 'DROPPED', -16034),
+            (8, 'WAIVER ADDED', 3115394), (8, 'DROPPED', 3043080), (1, 'WAIVER ADDED', 3043116), (3, 'WAIVER ADDED', 2576414),
+            (3, 'DROPPED', 2570986), (2, 'WAIVER ADDED', 3121422), (2, 'DROPPED', 4039359),
+        ])
+        self.assertEqual([len(item.actions) for item in activity], [2, 1, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 1, 1, 2, 1, 1, 2, 2, 2, 2, 2, 1, 2, 2])
+
+        # players that aren't on a roster are requested with one batched player card request
+        card_requests = [request for request in m.request_history if 'kona_playercard' in request.url]
+        self.assertEqual(len(card_requests), 1)
+        player_ids = json.loads(card_requests[0].headers['x-fantasy-filter'])['players']['filterIds']['value']
+        self.assertEqual(len(player_ids), len(set(player_ids)))
+        players = [action[2] for item in activity for action in item.actions if action[2] and action[2].playerId == 3045147]
+        self.assertTrue(all(player.name == 'James Conner' for player in players))
+
+        league._player_card_batch_size = 10
+        league.recent_activity()
+        card_requests = [request for request in m.request_history if 'kona_playercard' in request.url]
+        self.assertEqual(len(card_requests), 1 + (len(player_ids) + 9) // 10)
 
     @mock.patch.object(League, '_fetch_league')
     def test_cookie_set(self, mock_fetch_league):
@@ -0,0 +1,114 @@
+import random
+from unittest import TestCase, mock
+
+from espn_api.football import League
+from espn_api.football.lineup import LineupEfficiency, assignment, optimal_lineup, starting_slots
+from .fake_league import FakeTeam
+
+
+class FakeBoxPlayer(object):
+    def __init__(self, name, eligibleSlots, points, projected_points=0, slot_position='BE'):
+        self.name = name
+        self.eligibleSlots = eligibleSlots + ['BE', 'IR']
+        self.points = points
+        self.projected_points = projected_points
+        self.slot_position = slot_position
+
+    def __repr__(self):
+        return 'Player(%s)' % self.name
+
+
+class FakeBoxScore(object):
+    def __init__(self, home_team, home_lineup, away_team=0, away_lineup=[]):
+        self.home_team = home_team
+        self.home_lineup = home_lineup
+        self.away_team = away_team
+        self.away_lineup = away_lineup
+
+
+ELIGIBLE_SLOTS = {
+    'QB': ['QB', 'OP'],
+    'RB': ['RB', 'RB/WR', 'RB/WR/TE', 'OP'],
+    'WR': ['WR', 'RB/WR', 'WR/TE', 'RB/WR/TE', 'OP'],
+    'TE': ['TE', 'WR/TE', 'RB/WR/TE', 'OP'],
+    'K': ['K'],
+}
+
+
+def brute_force_points(lineup, slots):
+    '''Tries every way of filling the slots'''
+    if not slots:
+        return 0
+    # the first slot stays empty or gets any eligible player
+    best = brute_force_points(lineup, slots[1:])
+    for player in lineup:
+        if slots[0] in player.eligibleSlots:
+            rest = [other for other in lineup if other is not player]
+            best = max(best, player.points + brute_force_points(rest, slots[1:]))
+    return best
+
+
+class LineupTest(TestCase):
+    def setUp(self):
+        self.slot_counts = {'QB': 1, 'RB': 2, 'WR': 2, 'TE': 1, 'OP': 0, 'RB/WR/TE': 1, 'K': 1, 'BE': 6, 'IR': 1}
+
+    def test_flex_slots(self):
+        # filling the slots with the best player first puts the WR in the RB/WR slot and benches the RB
+        slot_counts = {'RB/WR': 1, 'WR/TE': 1}
+        lineup = [
+            FakeBoxPlayer('WR', ELIGIBLE_SLOTS['WR'], 10),
+            FakeBoxPlayer('RB', ELIGIBLE_SLOTS['RB'], 9),
+            FakeBoxPlayer('TE', ELIGIBLE_SLOTS['TE'], 8),
+        ]
+        self.assertEqual(sorted((slot, player.name) for (slot, player) in optimal_lineup(lineup, slot_counts)),
+                         [('RB/WR', 'RB'), ('WR/TE', 'WR')])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        slot_counts = {'QB': 1, 'RB': 1, 'WR': 1, 'RB/WR': 1, 'RB/WR/TE': 1, 'OP': 1}
+        for _ in range(30):
+            lineup = [FakeBoxPlayer(str(i), ELIGIBLE_SLOTS[rng.choice(['QB', 'RB', 'WR', 'TE', 'K'])], round(rng.uniform(-2, 30), 2))
+                      for i in range(rng.randint(3, 8))]
+            best = optimal_lineup(lineup, slot_counts)
+            self.assertAlmostEqual(sum(player.points for (slot, player) in best), brute_force_points(lineup, starting_slots(slot_counts)))
+            self.assertTrue(all(slot in player.eligibleSlots for (slot, player) in best))
+            self.assertEqual(len({id(player) for (slot, player) in best}), len(best))
+
+    def test_projected(self):
+        lineup = [FakeBoxPlayer('WR1', ELIGIBLE_SLOTS['WR'], 20, 5), FakeBoxPlayer('WR2', ELIGIBLE_SLOTS['WR'], 5, 15)]
+        self.assertEqual(optimal_lineup(lineup, {'WR': 1}), [('WR', lineup[0])])
+        self.assertEqual(optimal_lineup(lineup, {'WR': 1}, projected=True), [('WR', lineup[1])])
+
+    def test_empty_slots(self):
+        lineup = [FakeBoxPlayer('K', ELIGIBLE_SLOTS['K'], 7, slot_position='K')]
+        efficiency = LineupEfficiency(FakeTeam(1), 1, lineup, self.slot_counts)
+        self.assertEqual(efficiency.optimal_lineup, [('K', lineup[0])])
+        self.assertEqual(efficiency.efficiency, 1.0)
+        self.assertEqual(assignment([]), [])
+
+    @mock.patch.object(League, 'box_scores_range')
+    def test_league_lineup_efficiency(self, mock_box_scores_range):
+        league = League(1, 2019, fetch_league=False)
+        league.settings = mock.Mock(position_slot_counts=self.slot_counts)
+        (team, other) = (FakeTeam(1), FakeTeam(2))
+        week_1 = [
+            FakeBoxPlayer('QB', ELIGIBLE_SLOTS['QB'], 20, slot_position='QB'),
+            FakeBoxPlayer('RB1', ELIGIBLE_SLOTS['RB'], 10, slot_position='RB'),
+            FakeBoxPlayer('RB2', ELIGIBLE_SLOTS['RB'], 12, slot_position='RB'),
+            FakeBoxPlayer('RB3', ELIGIBLE_SLOTS['RB'], 18),
+            FakeBoxPlayer('WR1', ELIGIBLE_SLOTS['WR'], 4, slot_position='RB/WR/TE'),
+        ]
+        week_2 = [FakeBoxPlayer('K', ELIGIBLE_SLOTS['K'], 8, slot_position='K'), FakeBoxPlayer('K2', ELIGIBLE_SLOTS['K'], 9)]
+        mock_box_scores_range.return_value = {
+            1: [FakeBoxScore(team, week_1, other, [FakeBoxPlayer('TE', ELIGIBLE_SLOTS['TE'], 3, slot_position='TE')])],
+            2: [FakeBoxScore(team, week_2)],
+        }
+
+        (worst, best) = league.lineup_efficiency(end=2)
+        mock_box_scores_range.assert_called_once_with(1, 2)
+        self.assertIs(worst.team, team)
+        self.assertEqual([week.points_left_on_bench for week in worst.weeks], [18, 1])
+        self.assertEqual((worst.actual_points, worst.optimal_points, worst.points_left_on_bench), (54, 73, 19))
+        self.assertAlmostEqual(worst.efficiency, 54 / 73)
+        self.assertIs(best.team, other)
+        self.assertEqual(best.efficiency, 1.0)
@@ -0,0 +1,53 @@
+import copy
+import json
+import os
+from unittest import TestCase
+
+from espn_api.football.box_player import BoxPlayer
+from espn_api.football.player import Player
+from .fake_league import DATA_DIR
+
+
+class PlayerTest(TestCase):
+    def setUp(self):
+        with open(os.path.join(DATA_DIR, 'league_free_agents_2018.json')) as f:
+            self.data = json.load(f)['players'][0]
+        game = {'awayProTeamId': 17, 'homeProTeamId': 29, 'date': 1536525000000}
+        self.pro_schedule = {17: {'1': [game]}}
+
+    def test_lazy_stats(self):
+        player = Player(self.data, 2018, self.pro_schedule)
+        self.assertNotIn('stats', player.__dict__)
+        self.assertNotIn('schedule', player.__dict__)
+        self.assertEqual((player.total_points, player.projected_total_points), (138.7, 185.38))
+        self.assertEqual(player.active_status, 'active')
+
+        week_1 = player.scoring_period_stats(1)
+        self.assertNotIn('stats', player.__dict__)
+        self.assertEqual(week_1['points'], 8.7)
+        self.assertEqual(week_1['breakdown']['receivingTouchdowns'], 1.0)
+        self.assertEqual(player.stats[1], week_1)
+        self.assertEqual(player.stats[0]['points'], player.total_points)
+        self.assertEqual(player.schedule['1']['team'], 'CAR')
+
+    def test_box_player_week(self):
+        box_player = BoxPlayer(self.data, {}, {}, 1, 2018)
+        self.assertEqual((box_player.points, box_player.projected_points), (8.7, 10.06))
+        self.assertEqual(box_player.schedule, {})
+        self.assertNotIn('stats', box_player.__dict__)
+
+    def test_player_identities(self):
+        identities = {}
+        player = Player(self.data, 2018, player_identities=identities)
+        box_player = BoxPlayer(self.data, {}, {}, 1, 2018, player_identities=identities)
+        self.assertEqual(list(identities), [player.playerId])
+        self.assertIs(box_player.eligibleSlots, player.eligibleSlots)
+        self.assertIs(box_player.name, player.name)
+        self.assertEqual((box_player.position, box_player.proTeam), ('WR', 'NE'))
+
+        # a player traded to another pro team gets a new identity
+        traded = copy.deepcopy(self.data)
+        traded['player']['proTeamId'] = 29
+        self.assertEqual(Player(traded, 2018, player_identities=identities).proTeam, 'CAR')
+        self.assertIsNot(identities[player.playerId].eligibleSlots, player.eligibleSlots)
+        self.assertEqual(Player(self.data, 2018).eligibleSlots, player.eligibleSlots)
@@ -0,0 +1,98 @@
+import random
+from unittest import TestCase, mock, skipIf
+
+from espn_api.football import playoff_odds
+from espn_api.football.playoff_odds import PlayoffOdds, PlayoffSimulator, bye_count
+from espn_api.football.standings import StandingsEngine
+from .fake_league import FakeTeam, fixture_teams, outcome
+
+
+class PlayoffSimulatorTest(TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.division_map = {0: 'East', 1: 'West'}
+        # the last four weeks are still to be played
+        self.teams = fixture_teams(played_weeks=9)
+
+    def simulator(self, tie_rule):
+        return PlayoffSimulator(self.teams, self.division_map, tie_rule, 13)
+
+    def test_remaining_games(self):
+        simulator = self.simulator('H2H_RECORD')
+        self.assertEqual(len(simulator.games), 4 * 5)
+        self.assertEqual(simulator.record.wins[0] + simulator.record.ties[0] + simulator.record.losses[0], 9)
+
+    def test_seed_order_matches_standings(self):
+        for tie_rule in ['TOTAL_POINTS_SCORED', 'H2H_RECORD']:
+            simulator = self.simulator(tie_rule)
+            for _ in range(20):
+                results = [(random.gauss(110, 20), random.gauss(110, 20)) for game in simulator.games]
+                seeds = simulator.seed_order(results, random.Random(1))
+
+                # play the same results out and ask the standings engine
+                played = {}
+                for ((i, j), (score, opponent_score)) in zip(simulator.games, results):
+                    # games between the same teams are in week order
+                    played.setdefault((i, j), []).append((score, opponent_score))
+                    played.setdefault((j, i), []).append((opponent_score, score))
+                teams = [FakeTeam(team.team_id, team.division_id) for team in self.teams]
+                for (i, team) in enumerate(self.teams):
+                    for (week, opponent) in enumerate(team.schedule):
+                        j = self.teams.index(opponent)
+                        teams[i].schedule.append(teams[j])
+                        if week < 9:
+                            teams[i].scores.append(team.scores[week])
+                            teams[i].outcomes.append(team.outcomes[week])
+                        else:
+                            (score, opponent_score) = played[(i, j)].pop(0)
+                            teams[i].scores.append(score)
+                            teams[i].outcomes.append(outcome(score, opponent_score))
+                engine = StandingsEngine(teams, self.division_map, tie_rule)
+                self.assertEqual([teams[i] for i in seeds], engine.standings(13))
+
+    @skipIf(playoff_odds.np is None, 'numpy is not installed')
+    def test_numpy_matches_seed_order(self):
+        for tie_rule in ['TOTAL_POINTS_SCORED', 'H2H_RECORD']:
+            simulator = self.simulator(tie_rule)
+            counts = simulator.simulate(500, seed=3)
+
+            expected = [[0] * len(self.teams) for team in self.teams]
+            (team_scores, opponent_scores) = simulator.sample_scores(500, seed=3)
+            for k in range(500):
+                results = list(zip(team_scores[k].tolist(), opponent_scores[k].tolist()))
+                for (seed_index, i) in enumerate(simulator.seed_order(results, random.Random(3))):
+                    expected[i][seed_index] += 1
+            self.assertEqual(counts, expected)
+
+    @skipIf(playoff_odds.np is None, 'numpy is not installed')
+    def test_numpy_head_to_head_ties(self):
+        simulator = self.simulator('H2H_RECORD')
+        h2h_keys = []
+
+        def h2h_key(*args):
+            h2h_keys.append(PlayoffSimulator._h2h_key(*args))
+            return h2h_keys[-1]
+
+        # ties on win percentage are settled by the vectorized head to head sort
+        with mock.patch.object(simulator, '_h2h_key', h2h_key), mock.patch.object(simulator, '_seed_exact') as mock_seed_exact:
+            counts = simulator.simulate(2000, seed=3)
+        mock_seed_exact.assert_not_called()
+        self.assertTrue(any(key.any() for key in h2h_keys))
+        self.assertEqual([sum(row) for row in counts], [2000] * len(self.teams))
+
+    @mock.patch.object(playoff_odds, 'np', None)
+    def test_pure_python(self):
+        counts = self.simulator('TOTAL_POINTS_SCORED').simulate(200, seed=5)
+        self.assertEqual([sum(row) for row in counts], [200] * len(self.teams))
+        self.assertEqual(counts, self.simulator('TOTAL_POINTS_SCORED').simulate(200, seed=5))
+
+        odds = [PlayoffOdds(team, counts[i], 200, 4, bye_count(4)) for (i, team) in enumerate(self.teams)]
+        self.assertAlmostEqual(sum(team_odds.playoff_pct for team_odds in odds), 400)
+        self.assertEqual(sum(team_odds.bye_pct for team_odds in odds), 0)
+
+    def test_bye_count(self):
+        self.assertEqual([bye_count(count) for count in [1, 2, 4, 6, 7, 8]], [0, 0, 0, 2, 1, 0])
+
+    def test_unknown_tie_rule(self):
+        with self.assertRaises(ValueError):
+            self.simulator('NOT_A_REAL_RULE')
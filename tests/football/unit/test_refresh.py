@@ -0,0 +1,80 @@
+import copy
+import json
+import os
+from unittest import TestCase, mock
+
+from espn_api.football import League
+from .fake_league import DATA_DIR
+
+
+def league_data(players):
+    '''League payload of three teams with five players each and two weeks of matchups'''
+    teams = [{'id': team_id, 'abbrev': 'T%d' % team_id, 'name': 'Team %d' % team_id, 'divisionId': 0, 'owners': ['{%d}' % team_id],
+              'record': {'overall': {'wins': 1, 'losses': 1, 'ties': 0, 'pointsFor': 200, 'pointsAgainst': 200, 'streakLength': 1, 'streakType': 'WIN'}},
+              'playoffSeed': team_id, 'rankCalculatedFinal': 0,
+              'roster': {'entries': [{'playerId': player['id'], 'lineupSlotId': 20, 'playerPoolEntry': player}
+                                     for player in players[team_id * 5:team_id * 5 + 5]]}}
+             for team_id in (1, 2, 3)]
+    schedule = [
+        {'matchupPeriodId': 1, 'winner': 'HOME', 'home': {'teamId': 1, 'totalPoints': 110}, 'away': {'teamId': 2, 'totalPoints': 90}},
+        {'matchupPeriodId': 1, 'winner': 'UNDECIDED', 'home': {'teamId': 3, 'totalPoints': 0}},
+        {'matchupPeriodId': 2, 'winner': 'AWAY', 'home': {'teamId': 1, 'totalPoints': 90}, 'away': {'teamId': 3, 'totalPoints': 100}},
+        {'matchupPeriodId': 2, 'winner': 'UNDECIDED', 'home': {'teamId': 2, 'totalPoints': 0}},
+    ]
+    members = [{'id': '{%d}' % team_id, 'firstName': 'Owner', 'lastName': str(team_id)} for team_id in (1, 2, 3)]
+    return {'seasonId': 2018, 'status': {'latestScoringPeriod': 2}, 'teams': teams, 'schedule': schedule, 'members': members}
+
+
+class RefreshTest(TestCase):
+    def setUp(self):
+        with open(os.path.join(DATA_DIR, 'league_free_agents_2018.json')) as f:
+            self.data = league_data(json.load(f)['players'])
+        self.league = League(1, 2018, fetch_league=False)
+        self.league.settings = mock.Mock(division_map={0: 'East'})
+        self.league._set_pro_schedule({})
+        self.league._fetch_teams(self.data)
+
+    def test_unchanged(self):
+        teams = list(self.league.teams)
+        players = [list(team.roster) for team in teams]
+        summary = self.league._refresh_teams(copy.deepcopy(self.data), self.league._pro_schedule_data)
+        self.assertFalse(summary)
+        self.assertEqual(summary.teams, {})
+        for (team, old, roster) in zip(self.league.teams, teams, players):
+            self.assertIs(team, old)
+            self.assertEqual(list(map(id, team.roster)), list(map(id, roster)))
+
+    def test_changed_teams(self):
+        (team_1, team_2, team_3) = self.league.teams
+        roster_2 = team_2.roster
+        data = copy.deepcopy(self.data)
+        data['teams'][0]['roster']['entries'].pop()
+        data['teams'][1]['record']['overall']['wins'] = 2
+        data['schedule'][2]['home']['totalPoints'] = 95
+        data['members'][2]['lastName'] = 'Three'
+
+        summary = self.league._refresh_teams(data, self.league._pro_schedule_data)
+        self.assertEqual(summary.teams, {1: ['roster', 'schedule'], 2: ['team'], 3: ['schedule', 'owners']})
+        self.assertFalse(summary.pro_schedule)
+        (new_1, new_2, new_3) = self.league.teams
+        self.assertEqual(len(new_1.roster), 4)
+        self.assertEqual((new_2.wins, list(map(id, new_2.roster))), (2, list(map(id, roster_2))))
+        self.assertEqual(new_3.owners[0]['lastName'], 'Three')
+        self.assertIsNot(new_2, team_2)
+
+        # schedules point at the current teams and the margins of victory match a league built from scratch
+        league = League(1, 2018, fetch_league=False)
+        league.settings = self.league.settings
+        league._set_pro_schedule({})
+        league._fetch_teams(data)
+        for (team, expected) in zip(self.league.teams, league.teams):
+            self.assertTrue(all(opponent in self.league.teams for opponent in team.schedule))
+            self.assertEqual((team.scores, team.mov, [player.playerId for player in team.roster]),
+                             (expected.scores, expected.mov, [player.playerId for player in expected.roster]))
+        self.assertEqual(self.league.get_team_data(1), new_1)
+
+    def test_pro_schedule_changed(self):
+        summary = self.league._refresh_teams(copy.deepcopy(self.data), {'settings': {'proTeams': []}})
+        self.assertTrue(summary.pro_schedule)
+        self.assertEqual(summary.teams, {1: ['roster'], 2: ['roster'], 3: ['roster']})
+        self.assertEqual(self.league._pro_schedule_data, {'settings': {'proTeams': []}})
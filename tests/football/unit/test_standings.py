@@ -0,0 +1,82 @@
+import random
+from unittest import TestCase
+
+from espn_api.football.helper import (
+    sort_by_coin_flip,
+    sort_by_division_record,
+    sort_by_head_to_head,
+    sort_by_points_against,
+    sort_by_points_for,
+    sort_by_win_pct,
+    sort_team_data_list,
+)
+from espn_api.football.standings import StandingsEngine
+from .fake_league import fixture_teams, random_teams
+
+
+def standings_weekly(teams, division_map, tie_rule, week):
+    '''standings_weekly as it was before the StandingsEngine, rescanning every schedule'''
+    list_of_team_data = []
+    for team in teams:
+        team_data = {
+            'team': team,
+            'team_id': team.team_id,
+            'division_id': team.division_id,
+            'wins': team.outcomes[:week].count('W'),
+            'ties': team.outcomes[:week].count('T'),
+            'losses': team.outcomes[:week].count('L'),
+            'points_for': sum(team.scores[:week]),
+            'points_against': sum([team.schedule[w].scores[w] for w in range(week)]),
+            'schedule': team.schedule[:week],
+            'outcomes': team.outcomes[:week],
+        }
+        team_data['win_pct'] = (team_data['wins'] + team_data['ties'] / 2) / len(team.outcomes[:week])
+        list_of_team_data.append(team_data)
+
+    if tie_rule == 'TOTAL_POINTS_SCORED':
+        tiebreaker_hierarchy = [(sort_by_win_pct, 'win_pct'), (sort_by_points_for, 'points_for'), (sort_by_head_to_head, 'h2h_wins')]
+    else:
+        tiebreaker_hierarchy = [(sort_by_win_pct, 'win_pct'), (sort_by_head_to_head, 'h2h_wins'), (sort_by_points_for, 'points_for')]
+    tiebreaker_hierarchy += [(sort_by_division_record, 'division_record'), (sort_by_points_against, 'points_against'),
+                             (sort_by_coin_flip, 'coin_flip')]
+
+    division_winners = []
+    for division_id in division_map:
+        division_teams = [team_data for team_data in list_of_team_data if team_data['division_id'] == division_id]
+        division_winner = sort_team_data_list(division_teams, tiebreaker_hierarchy)[0]
+        division_winners.append(division_winner)
+        list_of_team_data.remove(division_winner)
+    sorted_team_data = sort_team_data_list(division_winners, tiebreaker_hierarchy)
+    sorted_team_data += sort_team_data_list(list_of_team_data, tiebreaker_hierarchy)
+    return [team_data['team'] for team_data in sorted_team_data]
+
+
+class StandingsEngineTest(TestCase):
+    def setUp(self):
+        self.division_map = {0: 'East', 1: 'West'}
+        self.teams = fixture_teams()
+
+    def test_matches_schedule_scan(self):
+        # few distinct scores in the random season so every tiebreaker gets used
+        for teams in [self.teams, random_teams(10, 14, [80, 100, 120], seed=7)]:
+            weeks = len(teams[0].outcomes)
+            for tie_rule in ['TOTAL_POINTS_SCORED', 'H2H_RECORD']:
+                engine = StandingsEngine(teams, self.division_map, tie_rule)
+                for week in range(1, weeks + 1):
+                    random.seed(week)
+                    expected = standings_weekly(teams, self.division_map, tie_rule, week)
+                    random.seed(week)
+                    self.assertEqual(engine.standings(week), expected, (tie_rule, week))
+
+    def test_team_data(self):
+        engine = StandingsEngine(self.teams, self.division_map, 'H2H_RECORD')
+        team = self.teams[0]
+        team_data = engine.team_data(6)[0]
+        self.assertEqual(team_data['points_for'], sum(team.scores[:6]))
+        self.assertEqual(team_data['points_against'], sum(team.schedule[w].scores[w] for w in range(6)))
+        self.assertEqual(team_data['wins'] + team_data['ties'] + team_data['losses'], 6)
+
+    def test_unknown_tie_rule(self):
+        engine = StandingsEngine(self.teams, self.division_map, 'NOT_A_REAL_RULE')
+        with self.assertRaises(ValueError):
+            engine.standings(3)
@@ -0,0 +1,77 @@
+import json
+import os
+from unittest import TestCase, mock, skipIf
+
+from espn_api import stats_store
+from espn_api.football import League
+from espn_api.football.player import Player
+from espn_api.stats_store import StatsStore
+from .fake_league import DATA_DIR
+
+
+def player_data(player_id, position_id, weeks):
+    '''Player json with the actual (receptions, receiving yards) of each week in weeks'''
+    stats = [{'seasonId': 2018, 'scoringPeriodId': week, 'statSourceId': 0, 'statSplitTypeId': 1, 'appliedTotal': points,
+              'stats': {'53': receptions, '42': yards}} for (week, (points, receptions, yards)) in weeks.items()]
+    stats.append({'seasonId': 2018, 'scoringPeriodId': 1, 'statSourceId': 1, 'statSplitTypeId': 1, 'appliedTotal': 99, 'stats': {'53': 9}})
+    return {'id': player_id, 'player': {'fullName': 'Player %d' % player_id, 'id': player_id, 'eligibleSlots': [position_id],
+                                        'proTeamId': 1, 'stats': stats}}
+
+
+@skipIf(stats_store.np is None, 'numpy is not installed')
+class StatsStoreTest(TestCase):
+    def setUp(self):
+        # eligible slots 4 and 6 are WR and TE
+        self.players = [
+            Player(player_data(1, 4, {1: (10, 5, 60), 2: (4, 2, 30), 3: (20, 8, 120)}), 2018),
+            Player(player_data(2, 4, {2: (12, 6, 80), 3: (12, 6, 80), 4: (12, 6, 80)}), 2018),
+            Player(player_data(3, 6, {1: (6, 4, 40), 4: (30, 9, 150)}), 2018),
+            Player(player_data(4, 4, {}), 2018),
+        ]
+        self.league = League(1, 2018, fetch_league=False)
+        self.store = self.league.stats_store(self.players)
+
+    def test_store(self):
+        self.assertEqual(self.store.scoring_periods, [1, 2, 3, 4])
+        self.assertEqual(self.store.stats, ['points', 'receivingReceptions', 'receivingYards'])
+        self.assertEqual(self.store.values.shape, (4, 4, 3))
+        for (i, player) in enumerate(self.players):
+            for (p, week) in enumerate(self.store.scoring_periods):
+                for (k, stat) in enumerate(self.store.stats):
+                    week_stats = player.stats.get(week, {})
+                    expected = week_stats.get('points') if stat == 'points' else week_stats.get('breakdown', {}).get(stat)
+                    value = self.store.values[i, p, k]
+                    if expected is None:
+                        self.assertNotEqual(value, value)
+                    else:
+                        self.assertEqual(value, expected)
+
+    def test_window_queries(self):
+        self.assertEqual(self.store.window_sum('receivingReceptions', 2, 4).tolist(), [10, 18, 9, 0])
+        self.assertEqual(self.store.window_sum('points').tolist(), [34, 36, 36, 0])
+        averages = self.store.window_average('receivingYards', 3)
+        self.assertEqual(averages[:3].tolist(), [120, 80, 150])
+        self.assertNotEqual(averages[3], averages[3])
+        self.assertEqual(self.store.rank('points').tolist(), [3, 1, 1, 4])
+        self.assertEqual(self.store.rank('receivingYards', 3, average=True).tolist(), [2, 3, 1, 4])
+
+        top = self.store.top('receivingReceptions', 1, 4, position='WR', size=2)
+        self.assertEqual([(player.playerId, value) for (player, value) in top], [(2, 18), (1, 15)])
+        with self.assertRaises(Exception):
+            self.store.window_sum('notAStat')
+
+    def test_projected(self):
+        store = self.league.stats_store(self.players, projected=True)
+        self.assertEqual(store.scoring_periods, [1])
+        self.assertEqual(store.window_sum('receivingReceptions').tolist(), [9, 9, 9, 9])
+
+    def test_fixture_players(self):
+        with open(os.path.join(DATA_DIR, 'league_free_agents_2018.json')) as f:
+            players = [Player(data, 2018) for data in json.load(f)['players']]
+        store = StatsStore.from_players(players, lambda stat_id: str(stat_id))
+        self.assertEqual(store.window_sum('points', 1, 1).tolist(), [player.stats.get(1, {}).get('points', 0) for player in players])
+
+    @mock.patch.object(stats_store, 'np', None)
+    def test_needs_numpy(self):
+        with self.assertRaises(Exception):
+            self.league.stats_store(self.players)
@@ -0,0 +1,28 @@
+from unittest import TestCase, mock, skipIf
+
+from espn_api.football import utils
+from espn_api.football.utils import power_points, power_points_all_weeks, two_step_dominance, win_matrix
+from .fake_league import fixture_teams
+
+
+class PowerRankingsTest(TestCase):
+    def setUp(self):
+        self.teams = fixture_teams()
+
+    def expected(self, weeks):
+        return [power_points(two_step_dominance(win_matrix(self.teams, week)), self.teams, week) for week in range(1, weeks + 1)]
+
+    def test_win_matrix(self):
+        matrix = win_matrix(self.teams, 13)
+        self.assertEqual(sum(map(sum, matrix)), 13 * 5)
+        self.assertEqual(sum(matrix[0]), sum(1 for mov in self.teams[0].mov if mov > 0))
+
+    @mock.patch.object(utils, 'np', None)
+    def test_power_points_all_weeks_pure_python(self):
+        self.assertEqual(two_step_dominance([[0, 1], [0, 0]]), [1.0, 0.0])
+        self.assertEqual(power_points_all_weeks(self.teams, 13), self.expected(13))
+
+    @skipIf(utils.np is None, 'numpy is not installed')
+    def test_power_points_all_weeks_numpy(self):
+        self.assertEqual(two_step_dominance([[0, 1], [0, 0]]), [1.0, 0.0])
+        self.assertEqual(power_points_all_weeks(self.teams, 13), self.expected(13))
@@ -0,0 +1,125 @@
+import asyncio
+import json
+from unittest import TestCase, mock
+
+from espn_api.hockey import AsyncLeague
+from espn_api.requests.async_espn_requests import AsyncEspnFantasyRequests
+
+
+class AsyncLeagueTest(TestCase):
+    def setUp(self):
+        self.league_id = 1
+        self.season = 2020
+
+        with open('tests/hockey/unit/data/league_data.json') as data:
+            self.league_data = json.loads(data.read())
+        with open('tests/hockey/unit/data/player_data.json') as data:
+            self.player_data = json.loads(data.read())
+
+    def fetch_league(self):
+        league = AsyncLeague(self.league_id, self.season)
+        return asyncio.run(league.fetch_league())
+
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league_draft', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_players', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league', new_callable=mock.AsyncMock)
+    def test_fetch_league(self, mock_league_request, mock_players_request, mock_league_draft):
+        mock_league_request.return_value = self.league_data
+        mock_players_request.return_value = self.player_data
+        mock_league_draft.return_value = {}
+
+        league = self.fetch_league()
+
+        self.assertEqual(league.scoringPeriodId, 265)
+        self.assertEqual(league.currentMatchupPeriod, 13)
+        self.assertEqual(len(league.teams), 10)
+        self.assertEqual(league.player_map[2555315], 'Charlie  Coyle')
+        mock_league_request.assert_awaited_once()
+        mock_players_request.assert_awaited_once()
+        mock_league_draft.assert_awaited_once()
+
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_schedule', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'league_get', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league_draft', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_players', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league', new_callable=mock.AsyncMock)
+    def test_league_requests(self, mock_league_request, mock_players_request, mock_league_draft, mock_league_get, mock_pro_schedule):
+        mock_league_request.return_value = self.league_data
+        mock_players_request.return_value = self.player_data
+        mock_league_draft.return_value = {}
+        with open('tests/hockey/unit/data/pro_schedule.json') as data:
+            mock_pro_schedule.return_value = json.loads(data.read())
+        league = self.fetch_league()
+
+        with open('tests/hockey/unit/data/box_score_data.json') as data:
+            mock_league_get.return_value = json.loads(data.read())
+        box_scores = asyncio.run(league.box_scores())
+        self.assertEqual(len(box_scores), 6)
+        self.assertEqual(repr(box_scores[0]), 'Box Score(12 at Team(2 Minutes for.. Rooping?))')
+
+        with open('tests/hockey/unit/data/free_agent_data.json') as data:
+            mock_league_get.return_value = json.loads(data.read())
+        free_agents = asyncio.run(league.free_agents())
+        self.assertEqual(repr(free_agents[0]), 'Player(Brendan  Gallagher)')
+
+        with open('tests/hockey/unit/data/recent_activity_data.json') as data:
+            mock_league_get.return_value = json.loads(data.read())
+        activities = asyncio.run(league.recent_activity())
+        self.assertEqual(repr(activities[0]), 'Activity((Team(2 Minutes for.. Rooping?),FA ADDED,Jake  DeBrusk))')
+
+        with open('tests/hockey/unit/data/matchup_data.json') as data:
+            mock_league_get.return_value = json.loads(data.read())
+        matchups = asyncio.run(league.scoreboard())
+        self.assertEqual(repr(matchups[0]), 'Matchup(Team(Drop Trou and Shattenkirk) 9.0 - 1.0 Team(Eichel Scott Paper Company ))')
+
+        self.assertEqual(mock_league_get.await_count, 4)
+
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_recent_activity', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league_draft', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_players', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league', new_callable=mock.AsyncMock)
+    def test_iter_activity(self, mock_league_request, mock_players_request, mock_league_draft, mock_recent_activity):
+        mock_league_request.return_value = self.league_data
+        mock_players_request.return_value = self.player_data
+        mock_league_draft.return_value = {}
+        with open('tests/hockey/unit/data/recent_activity_data.json') as data:
+            topics = json.loads(data.read())['topics']
+        mock_recent_activity.side_effect = lambda msg_types, size, offset: {'topics': topics[offset:offset + size]}
+        league = self.fetch_league()
+
+        async def collect(**kwargs):
+            return [activity async for activity in league.iter_activity(page_size=10, **kwargs)]
+
+        self.assertEqual(len(asyncio.run(collect())), 25)
+        self.assertEqual(mock_recent_activity.await_count, 3)
+        self.assertEqual(len(asyncio.run(collect(last_id=topics[12]['id']))), 12)
+        self.assertEqual(mock_recent_activity.await_count, 5)
+
+    @mock.patch('espn_api.box_score_poller.asyncio.sleep', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_schedule', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_box_scores', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league_draft', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_players', new_callable=mock.AsyncMock)
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league', new_callable=mock.AsyncMock)
+    def test_box_score_poller_events(self, mock_league_request, mock_players_request, mock_league_draft, mock_box_scores,
+                                     mock_pro_schedule, mock_sleep):
+        mock_league_request.return_value = self.league_data
+        mock_players_request.return_value = self.player_data
+        mock_league_draft.return_value = {}
+        with open('tests/hockey/unit/data/pro_schedule.json') as data:
+            mock_pro_schedule.return_value = json.loads(data.read())
+        with open('tests/hockey/unit/data/box_score_data.json') as data:
+            box_score_data = json.loads(data.read())
+        live_data = json.loads(json.dumps(box_score_data))
+        live_data['schedule'][2]['away']['totalPointsLive'] = 12.5
+        mock_box_scores.side_effect = [box_score_data, live_data]
+        league = self.fetch_league()
+
+        async def collect():
+            return [change async for change in league.box_score_poller(live_interval=10).events(polls=2)]
+
+        changes = asyncio.run(collect())
+        away_team_id = box_score_data['schedule'][2]['away']['teamId']
+        self.assertEqual([(change.team.team_id, change.field, change.new) for change in changes], [(away_team_id, 'score', 12.5)])
+        self.assertEqual(mock_box_scores.await_count, 2)
+        mock_sleep.assert_awaited_once()
@@ -0,0 +1,66 @@
+import asyncio
+import json
+from unittest import TestCase, mock
+
+from espn_api.fleet import FleetStats, LeagueFleet, LeagueResult
+from espn_api.hockey import AsyncLeague, League
+from espn_api.requests.async_espn_requests import AsyncEspnFantasyRequests
+from espn_api.requests.espn_requests import ESPNAccessDenied, ESPNInvalidLeague, EspnFantasyRequests
+
+
+class LeagueFleetTest(TestCase):
+    def setUp(self):
+        with open('tests/hockey/unit/data/league_data.json') as data:
+            self.league_data = json.loads(data.read())
+        self.leagues = [('nhl', 1, 2020, None), ('hockey', 2, 2020, ('s2', '{swid}')), ('nhl', 401, 2020), ('nhl', 404, 2020),
+                        ('xfl', 5, 2020)]
+
+    def get_league(self, request):
+        if request.league_id == 401:
+            raise ESPNAccessDenied('League 401 cannot be accessed')
+        if request.league_id == 404:
+            raise ESPNInvalidLeague('League 404 does not exist')
+        return self.league_data
+
+    def check_results(self, results, stats):
+        results = {result.league_id: result for result in results}
+        self.assertEqual(sorted(results), [1, 2, 5, 401, 404])
+        self.assertIsInstance(results[1].league, League)
+        self.assertEqual(results[2].league.espn_request.cookies, {'espn_s2': 's2', 'SWID': '{swid}'})
+        self.assertIsInstance(results[401].error, ESPNAccessDenied)
+        self.assertIsInstance(results[404].error, ESPNInvalidLeague)
+        self.assertFalse(results[5].ok)
+        self.assertEqual((stats.loaded, stats.failed), (2, 3))
+        self.assertEqual(stats.errors, {'ESPNAccessDenied': 1, 'ESPNInvalidLeague': 1, 'Exception': 1})
+        self.assertGreater(stats.leagues_per_second, 0)
+        return results
+
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft', return_value={})
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players', return_value=[])
+    def test_fetch(self, mock_players_request, mock_league_draft):
+        fleet = LeagueFleet(max_workers=2)
+        with mock.patch.object(EspnFantasyRequests, 'get_league', autospec=True, side_effect=self.get_league):
+            results = list(fleet.fetch(iter(self.leagues)))
+        self.check_results(results, fleet.stats)
+        self.assertTrue(all(result.league.espn_request.session_pool is fleet.session_pool for result in results if result.ok))
+
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_league_draft', new_callable=mock.AsyncMock, return_value={})
+    @mock.patch.object(AsyncEspnFantasyRequests, 'get_pro_players', new_callable=mock.AsyncMock, return_value=[])
+    def test_fetch_async(self, mock_players_request, mock_league_draft):
+        async def get_league(request):
+            return self.get_league(request)
+
+        async def collect(fleet):
+            return [result async for result in fleet.fetch_async(self.leagues)]
+
+        fleet = LeagueFleet(max_workers=2)
+        with mock.patch.object(AsyncEspnFantasyRequests, 'get_league', autospec=True, side_effect=get_league):
+            results = asyncio.run(collect(fleet))
+        self.assertIsInstance(self.check_results(results, fleet.stats)[1].league, AsyncLeague)
+
+    def test_stats(self):
+        stats = FleetStats()
+        for elapsed in range(1, 21):
+            stats.record(LeagueResult('nhl', elapsed, 2020, elapsed=elapsed / 10))
+        self.assertEqual((stats.p50, stats.p95, stats.latency(100)), (1.0, 1.9, 2.0))
+        self.assertEqual(FleetStats().p95, 0.0)
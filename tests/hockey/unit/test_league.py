@@ -1,7 +1,10 @@
+import copy
 import json
+import threading
 from unittest import TestCase, mock
 
 from espn_api.base_league import BaseLeague
+from espn_api.box_score_poller import PlayerChange, ScoreChange
 from espn_api.hockey import League as HockeyLeague, Team
 from espn_api.requests.espn_requests import EspnFantasyRequests
 
@@ -55,6 +58,22 @@ class BaseLeagueTest(TestCase):
         self.assertEqual(schedule[11], (13, 1613520000000))
         mock_get_pro_schedule.assert_called_once()
 
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
+    def test_base_league_pro_schedule_store(self, mock_get_pro_schedule):
+        with open('tests/hockey/unit/data/pro_schedule.json') as data:
+            schedule_data = json.loads(data.read())
+        mock_get_pro_schedule.return_value = schedule_data
+
+        self.assertEqual(self.league._get_pro_schedule(scoringPeriodId=35)[11], (13, 1613520000000))
+        self.assertEqual(self.league._get_pro_schedule_store().game(11, 35), (13, 1613520000000))
+        self.league._get_pro_schedule(scoringPeriodId=36)
+        self.assertIn(11, self.league._get_all_pro_schedule())
+        mock_get_pro_schedule.assert_called_once()
+
+        self.league._pro_schedule = None
+        self.league._get_pro_schedule(scoringPeriodId=35)
+        self.assertEqual(mock_get_pro_schedule.call_count, 2)
+
     def test_base_league_standings(self):
         expected_standings = ["Team(Barkko Ruutu)",
                               "Team(2 Minutes for.. Rooping?)",
@@ -92,6 +111,28 @@ class HockeyLeagueTest(BaseLeagueTest):
         self.assertEqual(league.year, self.season)
         mock_league_request.assert_called_once()
 
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_concurrent_requests(self, mock_league_request, mock_players_request, mock_league_draft):
+        # each request waits until all of them have been sent
+        barrier = threading.Barrier(3, timeout=5)
+        def wait_for(value):
+            def request():
+                barrier.wait()
+                return value
+            return request
+        mock_league_request.side_effect = wait_for(self.league_data)
+        mock_players_request.side_effect = wait_for([])
+        mock_league_draft.side_effect = wait_for({})
+
+        league = HockeyLeague(self.league_id, self.season, concurrent_requests=True)
+        self.assertEqual(league.scoringPeriodId, 265)
+        self.assertEqual(len(league.teams), 10)
+        mock_league_request.assert_called_once()
+        mock_players_request.assert_called_once()
+        mock_league_draft.assert_called_once()
+
     @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
     @mock.patch.object(EspnFantasyRequests, 'get_league')
     def test_league_teams(self, mock_league_request, mock_league_draft):
@@ -209,3 +250,126 @@ class HockeyLeagueTest(BaseLeagueTest):
 
         mock_get_league_request.assert_called_once()
         mock_league_get_request.assert_called_once()
+
+    @mock.patch.object(EspnFantasyRequests, 'get_recent_activity')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_iter_activity(self, mock_get_league_request, mock_players_request, mock_league_draft, mock_recent_activity):
+        with open('tests/hockey/unit/data/recent_activity_data.json') as file:
+            topics = json.loads(file.read())['topics']
+        mock_league_draft.return_value = {}
+        mock_players_request.return_value = []
+        mock_get_league_request.return_value = self.league_data
+        mock_recent_activity.side_effect = lambda msg_types, size, offset: {'topics': topics[offset:offset + size]}
+        league = HockeyLeague(self.league_id, self.season)
+
+        activities = list(league.iter_activity(page_size=10))
+        self.assertEqual([activity.id for activity in activities], [topic['id'] for topic in topics])
+        self.assertEqual(mock_recent_activity.call_count, 3)
+
+        # only the pages up to the last seen activity are requested
+        mock_recent_activity.reset_mock()
+        activities = list(league.iter_activity(page_size=10, last_id=topics[12]['id']))
+        self.assertEqual(len(activities), 12)
+        self.assertEqual(mock_recent_activity.call_count, 2)
+
+        mock_recent_activity.reset_mock()
+        activities = list(league.iter_activity(page_size=10, since=topics[4]['date']))
+        self.assertEqual(len(activities), 4)
+        self.assertEqual(mock_recent_activity.call_count, 1)
+
+    @mock.patch.object(EspnFantasyRequests, 'get_box_scores')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_box_scores_range(self, mock_get_league_request, mock_players_request, mock_league_draft, mock_pro_schedule,
+                                     mock_box_scores):
+        with open('tests/hockey/unit/data/box_score_data.json') as file:
+            mock_box_scores.return_value = json.loads(file.read())
+        with open('tests/hockey/unit/data/pro_schedule.json') as file:
+            mock_pro_schedule.return_value = json.loads(file.read())
+        mock_league_draft.return_value = {}
+        mock_players_request.return_value = []
+        mock_get_league_request.return_value = self.league_data
+        league = HockeyLeague(self.league_id, self.season)
+
+        box_scores = league.box_scores_range(1, 3)
+        self.assertEqual(list(box_scores.keys()), [1, 2, 3])
+        self.assertEqual(repr(box_scores[2][0]), 'Box Score(12 at Team(2 Minutes for.. Rooping?))')
+        self.assertEqual(sorted(call.args[0] for call in mock_box_scores.call_args_list), [1, 2, 3])
+        mock_pro_schedule.assert_called_once()
+
+        # completed matchup periods aren't requested again
+        box_scores = league.season_box_scores()
+        self.assertEqual(list(box_scores.keys()), list(range(1, league.currentMatchupPeriod + 1)))
+        self.assertEqual(mock_box_scores.call_count, league.currentMatchupPeriod)
+        mock_pro_schedule.assert_called_once()
+
+    @mock.patch.object(EspnFantasyRequests, 'get_box_scores')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_schedule')
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_box_score_poller(self, mock_get_league_request, mock_players_request, mock_league_draft, mock_pro_schedule,
+                                     mock_box_scores):
+        with open('tests/hockey/unit/data/box_score_data.json') as file:
+            box_score_data = json.loads(file.read())
+        with open('tests/hockey/unit/data/pro_schedule.json') as file:
+            mock_pro_schedule.return_value = json.loads(file.read())
+        mock_league_draft.return_value = {}
+        mock_players_request.return_value = []
+        mock_get_league_request.return_value = self.league_data
+        league = HockeyLeague(self.league_id, self.season)
+
+        mock_box_scores.return_value = box_score_data
+        poller = league.box_score_poller(matchup_period=1, scoring_period=1)
+        self.assertEqual(poller.poll(), [])
+        box_scores = poller.box_scores
+        self.assertEqual(repr(box_scores[0]), 'Box Score(12 at Team(2 Minutes for.. Rooping?))')
+
+        # only the changed matchup is parsed again
+        live_data = copy.deepcopy(box_score_data)
+        roster = live_data['schedule'][0]['home']['rosterForMatchupPeriod']
+        roster['appliedStatTotal'] = roster.get('appliedStatTotal', 0) + 5
+        roster['entries'][0]['lineupSlotId'] = 8
+        mock_box_scores.return_value = live_data
+        with mock.patch.object(HockeyLeague, '_parse_box_scores', wraps=league._parse_box_scores) as mock_parse:
+            changes = poller.poll()
+        self.assertEqual(len(mock_parse.call_args.args[0]['schedule']), 1)
+        self.assertEqual(poller.box_scores[1:], box_scores[1:])
+        self.assertIsNot(poller.box_scores[0], box_scores[0])
+
+        (score, player) = changes
+        self.assertIsInstance(score, ScoreChange)
+        self.assertEqual((score.team, score.field, score.new), (box_scores[0].home_team, 'score', round(score.old + 5, 2)))
+        self.assertIsInstance(player, PlayerChange)
+        self.assertEqual((player.old.slot_position, player.player.slot_position), ('Center', 'IR'))
+        self.assertEqual(poller.poll(), [])
+
+        # polls quickly while one of the scoring periods games is being played
+        game_start = min(date for (opponent, date) in league._get_pro_schedule(poller.scoring_period).values()) / 1000
+        self.assertEqual(poller.next_interval(now=game_start + 60), 30)
+        self.assertEqual(poller.next_interval(now=game_start - 120), 120)
+        self.assertEqual(poller.next_interval(now=game_start - 10), 30)
+        self.assertEqual(poller.next_interval(now=game_start + 365 * 24 * 3600), 600)
+
+    @mock.patch.object(EspnFantasyRequests, 'get_league_draft')
+    @mock.patch.object(EspnFantasyRequests, 'get_pro_players')
+    @mock.patch.object(EspnFantasyRequests, 'get_league')
+    def test_league_team_and_player_index(self, mock_get_league_request, mock_players_request, mock_league_draft):
+        mock_league_draft.return_value = {}
+        mock_players_request.return_value = []
+        mock_get_league_request.return_value = self.league_data
+        league = HockeyLeague(self.league_id, self.season)
+
+        team = league.teams[3]
+        player = team.roster[0]
+        self.assertIs(league.get_team_data(team.team_id), team)
+        self.assertIsNone(league.get_team_data(-1))
+        self.assertIs(league.get_player_data(player.playerId), player)
+        self.assertIs(league.get_player_team(player.playerId), team)
+        self.assertIsNone(league.get_player_team(-1))
+        self.assertIn(team.schedule[0].home_team, league.teams)
+        self.assertIn(team.schedule[0].away_team, league.teams)
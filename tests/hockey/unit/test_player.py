@@ -2,6 +2,7 @@ import json
 from unittest import TestCase
 
 from espn_api.hockey import Player
+from espn_api.utils.utils import compact_stats, json_parsing, json_parsing_keys
 
 
 class TestPlayer(TestCase):
@@ -17,6 +18,30 @@ class TestPlayer(TestCase):
         self.assertEqual('Player(Taylor Hall)', repr(actual_player))
         self.assertEqual(actual_player.position, 'Left Wing')
 
+    def test_lazy_stats(self):
+        player = Player(self.roster_data[0])
+        self.assertNotIn('stats', player.__dict__)
+        split = next(split for split in self.roster_data[0]['playerPoolEntry']['player']['stats'] if split['id'] == '002020')
+        self.assertEqual(player.stats['Total 2020']['total']['G'], split['stats']['13'])
+        self.assertIn('stats', player.__dict__)
+
+    def test_compact_stats(self):
+        (ids, values) = compact_stats({'1': 2.0, '30': 5.0})
+        self.assertEqual((ids, values), (('1', '30'), (2.0, 5.0)))
+        # stats with the same ids share them
+        self.assertIs(compact_stats({'1': 0.0, '30': 1.0})[0], ids)
+
+    def test_json_parsing_keys(self):
+        keys = ['fullName', 'id', 'defaultPositionId', 'eligibleSlots', 'proTeamId', 'injuryStatus', 'missingKey']
+        for player_input in self.roster_data:
+            fields = json_parsing_keys(player_input, keys)
+            self.assertEqual(fields, {key: json_parsing(player_input, key) for key in keys})
+
+    def test_json_parsing_keys_skip(self):
+        player_input = {'player': {'stats': [{'id': '002020', 'proTeamId': 5}], 'id': 1}}
+        self.assertEqual(json_parsing_keys(player_input, ['id', 'proTeamId']), {'id': '002020', 'proTeamId': 5})
+        self.assertEqual(json_parsing_keys(player_input, ['id', 'proTeamId'], skip=('stats',)), {'id': 1, 'proTeamId': []})
+
 
 
 